@@ -10,6 +10,12 @@ any_t: TypeAlias = Any
 # Command-line arguments type alias
 args_t: TypeAlias = Namespace
 
+# Canonical query key type alias (ID, title, from year, to year, sort field, sort direction)
+query_key_t: TypeAlias = tuple[int, str, int, int, str, str]
+
+# RFC text section type alias (section number, start offset, end offset)
+section_t: TypeAlias = tuple[str, int, int]
+
 # Unconstrained callable type alias
 func_t: TypeAlias = Callable[..., any_t]
 
@@ -17,4 +23,4 @@ func_t: TypeAlias = Callable[..., any_t]
 void_t: TypeAlias = None
 
 # Module export symbols
-__all__ = ["any_t", "args_t", "func_t", "void_t"]
+__all__ = ["any_t", "args_t", "func_t", "query_key_t", "section_t", "void_t"]
@@ -3,14 +3,21 @@ Command-line argument parser module.
 """
 import argparse
 import enum
+import re
+import sys
 import console
 import utils
 from alias import any_t, args_t, void_t
+from result_writer import FORMATS
+from rfc_index import INDEX_URL
 
 
 # Parsing error occurred
 _error_occurred: bool = False
 
+# Largest valid RFC number (RFC numbers have at most five digits)
+_MAX_RFC_ID: int = 99999
+
 
 @enum.unique
 class ArgError(enum.StrEnum):
@@ -19,7 +26,7 @@ class ArgError(enum.StrEnum):
     """
     NO_ERROR = "No argument parsing errors occurred"
     UNRECOGNIZED = "Unrecognized argument(s): {}"
-    MISSING_REQUIRED = "One of the following arguments is required: {}, {}"
+    MISSING_REQUIRED = "One of the following arguments is required: {}"
     INVALID_COMBO = "Invalid argument combination: {}"
     INVALID_VALUE = "Invalid value for argument '{}': {}"
 
@@ -63,15 +70,69 @@ class Parser:
             f"{Parser._app_usage()}\n",
             f"RFC specification search application\n",
             f"Positional Arguments:",
-            f"  RFC_ID                   RFC specification ID number\n",
+            f"  RFC_ID                   RFC specification ID number, ID range (e.g.,",
+            f"                           7230-7235), or '-' to read IDs from stdin\n",
             f"Optional Arguments:",
             f"  -h/-?, --help            Show this help message and exit",
             f"  -v,    --verbose         Enable verbose console output",
             f"  -k,    --keyword TERM    Perform the RFC search using a keyword",
-            f"  -l,    --list            Get a list of RFC specifications\n",
+            f"         --fuzzy           Rank the locally indexed RFC titles by their",
+            f"                           similarity to keyword TERM, tolerating typos",
+            f"  -f,    --fulltext QUERY  Search the locally indexed RFC text, where",
+            f"                           quoted phrases must match exactly",
+            f"  -l,    --list            Write the results as a table (paged if it",
+            f"                           does not fit on the screen), or list every",
+            f"                           indexed RFC",
+            f"  -o,    --offline         Only use locally indexed or cached results",
+            f"         --format FMT      Write search results as 'text' (default),",
+            f"                           'ndjson', 'csv' or 'json'",
+            f"         --timings         Write a per-phase timing breakdown on exit",
+            f"         --profile FILE    Write cProfile statistics to FILE, or trace",
+            f"                           event JSON if FILE ends with '.json'",
+            f"         --serve [ADDR]    Serve queries from a long-running process on Unix",
+            f"                           socket path or HOST:PORT ADDR until interrupted",
+            f"         --connect [ADDR]  Send the search to the query server at ADDR",
+            f"         --limit N         Stop searching after the first N results",
+            f"         --status LIST     Only include the locally indexed RFCs with one of",
+            f"                           the comma-separated statuses (e.g., proposed)",
+            f"         --author NAME     Only include the locally indexed RFCs by NAME",
+            f"         --from YEAR       Only include the RFCs published in or after YEAR",
+            f"         --to YEAR         Only include the RFCs published in or before YEAR",
+            f"         --section NUM     Write section NUM (e.g., 3.10 or A.1) of each",
+            f"                           RFC_ID from the packed RFC text",
+            f"         --latest          Get the current replacements of each obsolete",
+            f"                           RFC_ID",
+            f"         --updated-by      Get every RFC that (transitively) updates RFC_ID",
+            f"         --depends         Get every RFC that RFC_ID (transitively)",
+            f"                           references",
+            f"  -r,    --refresh         Apply the RFC specifications published or changed",
+            f"                           since the local RFC index was last updated",
+            f"  -s,    --sync [DIR]      Mirror the locally indexed RFC specification",
+            f"                           files into DIR, fetching new or changed files",
+            f"         --formats LIST    Comma-separated formats to mirror (e.g.,",
+            f"                           TEXT,HTML,PDF,XML), defaults to TEXT",
+            f"  -t,    --index-text      Build the full-text index and packed text from",
+            f"         [DIR]             the RFC text files in DIR, downloading any",
+            f"                           missing files",
+            f"  -u,    --update-index    Build the local RFC index from the RFC Editor",
+            f"         [SOURCE]          bulk index XML file path or URL\n",
             f"Usage Examples:",
             f"  rfc-search.py 9293",
+            f"  rfc-search.py 7230-7235 9110 9112",
+            f"  rfc-search.py - < rfc-ids.txt",
+            f"  rfc-search.py --update-index",
+            f"  rfc-search.py --refresh",
+            f"  rfc-search.py 9293 --section 3.10",
+            f"  rfc-search.py 2616 --latest",
+            f"  rfc-search.py --offline 1-9999 --format ndjson | jq .Title",
+            f"  rfc-search.py --fulltext '\"congestion window\" cubic'",
             f"  rfc-search.py -l -k TCP",
+            f"  rfc-search.py --list",
+            f"  rfc-search.py --limit 10 -k HTTP",
+            f"  rfc-search.py --status proposed --author postel --from 1980 --to 1990",
+            f"  rfc-search.py --fuzzy -k 'congestoin control'",
+            f"  rfc-search.py --serve 127.0.0.1:8790 &",
+            f"  rfc-search.py --connect 127.0.0.1:8790 -k TCP",
             f"  rfc-search.py --keyword TCP\n"
         ]
         return "\n".join(help_lines)
@@ -81,7 +142,20 @@ class Parser:
         """
         Get the application usage information.
         """
-        return f"Usage: {utils.app_name()} [-?hlv] [-k KEYWORD] [RFC_ID]"
+        usage = f"Usage: {utils.app_name()} "
+
+        usage_args = [
+            f"[-?hlov] [-k KEYWORD] [--fuzzy] [-f QUERY] [--limit N]",
+            f"[--status LIST] [--author NAME] [--from YEAR] [--to YEAR]",
+            f"[--format FMT] [--timings] [--profile FILE]",
+            f"[-r] [--serve [ADDR]] [--connect [ADDR]]",
+            f"[-s [DIR]] [--formats LIST] [-t [DIR]] [-u [SOURCE]]",
+            f"[--section NUM | --latest | --updated-by | --depends]",
+            f"[RFC_ID ...]"
+        ]
+
+        # Usage arguments are wrapped to the help information line width
+        return usage + f"\n{' ' * len(usage)}".join(usage_args)
 
     @staticmethod
     def _fmt_error_msg(error: ArgError, *args: any_t) -> str:
@@ -123,29 +197,160 @@ class Parser:
             self._Valid = True
 
         else:
+            self._Valid = False
+
             if self.UnknownArgs:
                 Parser._print_error(ArgError.UNRECOGNIZED,
                                     ", ".join(self.UnknownArgs))
 
-            elif not self.Args.rfc_id and not self.Args.keyword:
+            elif (rfc_ids := self._parse_ids()) is None:
+                return
+
+            elif not any(self._search_args() + self._task_args() + self._facet_args()):
                 Parser._print_error(ArgError.MISSING_REQUIRED,
-                                    "-k/--keyword TERM",
-                                    "RFC_ID")
+                                    "--author NAME, -f/--fulltext QUERY, --from YEAR, "
+                                    "-k/--keyword TERM, -l/--list, -r/--refresh, --serve, "
+                                    "--status LIST, -s/--sync, -t/--index-text, --to YEAR, "
+                                    "-u/--update-index, RFC_ID")
 
-            elif self.Args.rfc_id and self.Args.keyword:
+            elif len([a for a in self._search_args() if a]) > 1:
                 Parser._print_error(ArgError.INVALID_COMBO,
-                                    "-k/--keyword TERM, RFC_ID")
-            self._Valid = False
+                                    "-f/--fulltext QUERY, -k/--keyword TERM, RFC_ID")
+
+            elif self.Args.format is not None and self.Args.format not in FORMATS:
+                Parser._print_error(ArgError.INVALID_VALUE, "--format", self.Args.format)
+
+            elif self.Args.list and (self.Args.format is not None or self.Args.section):
+                Parser._print_error(ArgError.INVALID_COMBO,
+                                    "--format FMT, -l/--list, --section NUM")
+
+            elif self.Args.limit < 0:
+                Parser._print_error(ArgError.INVALID_VALUE, "--limit", self.Args.limit)
+
+            elif self.Args.from_year < 0:
+                Parser._print_error(ArgError.INVALID_VALUE, "--from", self.Args.from_year)
+
+            elif self.Args.to_year < 0 or 0 < self.Args.to_year < self.Args.from_year:
+                Parser._print_error(ArgError.INVALID_VALUE, "--to", self.Args.to_year)
+
+            elif any(self._facet_args()) and (self.Args.connect
+                                              or self.Args.section
+                                              or any(self._graph_args())):
+                Parser._print_error(ArgError.INVALID_COMBO,
+                                    "--author NAME, --connect, --depends, --from YEAR, "
+                                    "--latest, --section NUM, --status LIST, --to YEAR, "
+                                    "--updated-by")
+
+            elif self.Args.fuzzy and not self.Args.keyword:
+                Parser._print_error(ArgError.MISSING_REQUIRED, "-k/--keyword TERM")
+
+            elif (self.Args.section or any(self._graph_args())) and not rfc_ids:
+                Parser._print_error(ArgError.MISSING_REQUIRED, "RFC_ID")
+
+            elif len([a for a in [self.Args.section, *self._graph_args()] if a]) > 1:
+                Parser._print_error(ArgError.INVALID_COMBO,
+                                    "--depends, --latest, --section NUM, --updated-by")
+
+            elif self.Args.connect and not any(self._search_args()):
+                Parser._print_error(ArgError.MISSING_REQUIRED,
+                                    "-f/--fulltext QUERY, -k/--keyword TERM, RFC_ID")
+
+            elif self.Args.connect and (self.Args.section or any(self._graph_args())):
+                Parser._print_error(ArgError.INVALID_COMBO,
+                                    "--connect, --depends, --latest, "
+                                    "--section NUM, --updated-by")
+            else:
+                self.Args.rfc_ids = rfc_ids
+                self._Valid = not _error_occurred
+
+    def _parse_ids(self) -> list[int] | void_t:
+        """
+        Expand the RFC number and RFC number range arguments (reading them from
+        the standard input stream for argument '-') into a list of RFC numbers.
+        """
+        tokens = list[str]()
+        rfc_ids = list[int]()
+
+        for arg in self.Args.rfc_ids:
+            if arg == "-":
+                tokens.extend(re.split(r"[\s,]+", sys.stdin.read().strip()))
+            else:
+                tokens.append(arg)
+
+        for token in [t for t in tokens if t]:
+            match = re.fullmatch(r"(?:rfc)?(\d+)(?:-(\d+))?", token, re.I)
+            first = int(match.group(1)) if match else 0
+            last = int(match.group(2) or first) if match else 0
+
+            if not first or last < first or last > _MAX_RFC_ID:
+                Parser._print_error(ArgError.INVALID_VALUE, "RFC_ID", token)
+                return None
+
+            rfc_ids.extend(range(first, last + 1))
+
+        return rfc_ids
+
+    def _search_args(self) -> list[any_t]:
+        """
+        Get the values of the mutually exclusive search arguments.
+        """
+        return [self.Args.fulltext, self.Args.keyword, self.Args.rfc_ids]
+
+    def _graph_args(self) -> list[any_t]:
+        """
+        Get the values of the mutually exclusive relationship graph arguments.
+        """
+        return [self.Args.depends, self.Args.latest, self.Args.updated_by]
+
+    def _facet_args(self) -> list[any_t]:
+        """
+        Get the values of the local facet filter arguments.
+        """
+        return [self.Args.author, self.Args.from_year, self.Args.status, self.Args.to_year]
+
+    def _task_args(self) -> list[any_t]:
+        """
+        Get the values of the arguments that do not require a search argument.
+        """
+        return [
+            self.Args.index_text,
+            self.Args.list,
+            self.Args.refresh,
+            self.Args.serve,
+            self.Args.sync,
+            self.Args.update_index
+        ]
 
     def _args_provided(self) -> bool:
         """
         Determine whether any command-line arguments were provided.
         """
         args_list = [
+            self.Args.author,
+            self.Args.connect,
+            self.Args.depends,
+            self.Args.format,
+            self.Args.from_year,
+            self.Args.fulltext,
+            self.Args.fuzzy,
             self.Args.help,
+            self.Args.index_text,
             self.Args.keyword,
+            self.Args.latest,
+            self.Args.limit,
             self.Args.list,
-            self.Args.rfc_id,
+            self.Args.offline,
+            self.Args.refresh,
+            self.Args.rfc_ids,
+            self.Args.section,
+            self.Args.serve,
+            self.Args.status,
+            self.Args.sync,
+            self.Args.timings,
+            self.Args.to_year,
+            self.Args.profile,
+            self.Args.update_index,
+            self.Args.updated_by,
             self.Args.verbose
         ]
         return not all([not a for a in args_list])
@@ -154,11 +359,33 @@ class Parser:
         """
         Configure the underlying argument parser argument specifications.
         """
-        self._Parser.add_argument("rfc_id", type=int, nargs="?")
+        self._Parser.add_argument("rfc_ids", nargs="*")
         self._Parser.add_argument("-h", "-?", "--help", action="store_true")
         self._Parser.add_argument("-v", "--verbose", action="store_true")
         self._Parser.add_argument("-k", "--keyword", type=str)
+        self._Parser.add_argument("-f", "--fulltext", type=str)
+        self._Parser.add_argument("--fuzzy", action="store_true")
         self._Parser.add_argument("-l", "--list", action="store_true")
+        self._Parser.add_argument("-o", "--offline", action="store_true")
+        self._Parser.add_argument("--limit", type=int, default=0)
+        self._Parser.add_argument("--status", type=str)
+        self._Parser.add_argument("--author", type=str)
+        self._Parser.add_argument("--from", type=int, default=0, dest="from_year")
+        self._Parser.add_argument("--to", type=int, default=0, dest="to_year")
+        self._Parser.add_argument("--section", type=str)
+        self._Parser.add_argument("--latest", action="store_true")
+        self._Parser.add_argument("--updated-by", action="store_true")
+        self._Parser.add_argument("--depends", action="store_true")
+        self._Parser.add_argument("--serve", nargs="?", const=utils.server_address())
+        self._Parser.add_argument("--connect", nargs="?", const=utils.server_address())
+        self._Parser.add_argument("--format", type=str)
+        self._Parser.add_argument("--timings", action="store_true")
+        self._Parser.add_argument("--profile", type=str)
+        self._Parser.add_argument("-r", "--refresh", action="store_true")
+        self._Parser.add_argument("-s", "--sync", nargs="?", const=utils.corpus_dir())
+        self._Parser.add_argument("--formats", type=str, default="TEXT")
+        self._Parser.add_argument("-t", "--index-text", nargs="?", const=utils.corpus_dir())
+        self._Parser.add_argument("-u", "--update-index", nargs="?", const=INDEX_URL)
 
 
 # Module export symbols
@@ -0,0 +1,301 @@
+"""
+Versioned, checksummed and memory-mapped binary index file module.
+"""
+import itertools
+import mmap
+import os
+import struct
+import utils
+import zlib
+from typing import Iterable, Literal
+from alias import any_t, void_t
+
+_FILE_MAGIC: bytes = b"RFCBIDX\0"  # Index file signature
+_ALIGNMENT: int = 8                # Section alignment (in bytes)
+
+# Index file header (signature, index kind, format version,
+# section count, directory checksum)
+_HEADER: struct.Struct = struct.Struct("=8s4sIII")
+
+# Section directory entry (byte offset, byte size, checksum)
+_ENTRY: struct.Struct = struct.Struct("=QQI4x")
+
+
+def encode_varints(values: Iterable[int]) -> bytes:
+    """
+    Encode the given non-negative integers as unsigned LEB128 variable-length integers.
+    """
+    data = bytearray()
+
+    for value in values:
+        if value < 0:
+            raise ValueError(f"Invalid variable-length integer: {value}")
+
+        while value > 0x7F:
+            data.append(value & 0x7F | 0x80)
+            value >>= 7
+
+        data.append(value)
+
+    return bytes(data)
+
+
+def decode_varints(data: bytes | memoryview) -> list[int]:
+    """
+    Decode the unsigned LEB128 variable-length integers of the given bytes.
+    """
+    values = list[int]()
+    value = shift = 0
+
+    for byte in data:
+        if byte < 0x80:
+            values.append(value | byte << shift)
+            value = shift = 0
+        else:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+
+    if shift:
+        raise RuntimeError("Corrupt variable-length integer sequence")
+
+    return values
+
+
+def encode_deltas(values: Iterable[int]) -> bytes:
+    """
+    Encode the given ascending integers as variable-length integer
+    gaps between consecutive values (delta encoding).
+    """
+    deltas = list[int]()
+    previous = 0
+
+    for value in values:
+        if value < previous:
+            raise ValueError(f"Delta encoded value {value} is out of order")
+
+        deltas.append(value - previous)
+        previous = value
+
+    return encode_varints(deltas)
+
+
+def decode_deltas(data: bytes | memoryview) -> list[int]:
+    """
+    Decode the given delta encoded variable-length integers into ascending integers.
+    """
+    data = bytes(data)
+
+    # Dense sequences only have single byte gaps, which are summed without decoding
+    if data.isascii():
+        return list(itertools.accumulate(data))
+
+    values = decode_varints(data)
+
+    for pos in range(1, len(values)):
+        values[pos] += values[pos - 1]
+
+    return values
+
+
+def write_index(path: str, kind: bytes, version: int, sections: list[bytes]) -> void_t:
+    """
+    Atomically write the given sections to a binary index file of the given
+    kind (a four byte tag) and format version. Sections are aligned so that
+    fixed-width tables can be cast in place once the file is memory-mapped.
+    """
+    entries = bytearray()
+    offset = _HEADER.size + _ENTRY.size * len(sections)
+
+    for data in sections:
+        offset += -offset % _ALIGNMENT
+        entries.extend(_ENTRY.pack(offset, len(data), zlib.crc32(data)))
+        offset += len(data)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = utils.temp_path(path)
+
+    with open(temp_path, "wb") as file:
+        checksum = zlib.crc32(entries)
+
+        file.write(_HEADER.pack(_FILE_MAGIC, kind, version, len(sections), checksum))
+        file.write(entries)
+
+        for data in sections:
+            file.write(bytes(-file.tell() % _ALIGNMENT))
+            file.write(data)
+
+        # Data must be on disk before the rename, or a crash can leave an empty index
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temp_path, path)
+
+
+class BinaryIndex:
+    """
+    Read-only binary index file, memory-mapped so that opening it only validates
+    its header and section directory. Each section is checked against its checksum
+    the first time it is accessed, and sections are read without copying.
+    """
+    def __init__(self, path: str, kind: bytes, version: int) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path        # Index file path
+        self.Kind: bytes = kind      # Index kind tag
+        self.Version: int = version  # Index format version
+
+        self._Map: mmap.mmap | None = None
+        self._Entries: list[tuple[int, int, int]] = list[tuple[int, int, int]]()
+        self._Sections: dict[int, memoryview] = dict[int, memoryview]()
+        self._Tables = dict[tuple[int, str], memoryview]()
+
+    def __enter__(self) -> "BinaryIndex":
+        """
+        Enter the runtime context.
+        """
+        return self
+
+    def __exit__(self, *args: any_t) -> void_t:
+        """
+        Exit the runtime context and close the memory map.
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Get the number of sections.
+        """
+        return len(self._Entries)
+
+    @staticmethod
+    def open(path: str, kind: bytes, version: int) -> "BinaryIndex":
+        """
+        Memory-map the given binary index file of the given kind and format version.
+        """
+        index = BinaryIndex(path, kind, version)
+        index.load()
+
+        return index
+
+    def load(self) -> void_t:
+        """
+        Memory-map the underlying index file and validate its header and section directory.
+        """
+        self.close()
+
+        with open(self.Path, "rb") as file:
+            # Empty files cannot be memory-mapped
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise RuntimeError(f"Corrupt index file: {self.Path}")
+
+            index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._Entries = self._read_entries(index_map)
+        except RuntimeError:
+            index_map.close()
+            raise
+
+        self._Map = index_map
+
+    def _read_entries(self, index_map: mmap.mmap) -> list[tuple[int, int, int]]:
+        """
+        Get the section directory entries of the given memory-mapped index file.
+        """
+        if len(index_map) < _HEADER.size:
+            raise RuntimeError(f"Corrupt index file: {self.Path}")
+
+        magic, kind, version, count, checksum = _HEADER.unpack_from(index_map)
+
+        if magic != _FILE_MAGIC or kind != self.Kind:
+            raise RuntimeError(f"Unsupported index file: {self.Path}")
+
+        if version != self.Version:
+            raise RuntimeError(f"Unsupported index file version: {version}")
+
+        end = _HEADER.size + _ENTRY.size * count
+
+        if end > len(index_map) or zlib.crc32(index_map[_HEADER.size:end]) != checksum:
+            raise RuntimeError(f"Corrupt index file: {self.Path}")
+
+        entries = list(_ENTRY.iter_unpack(index_map[_HEADER.size:end]))
+
+        if any([o + s > len(index_map) for o, s, _ in entries]):
+            raise RuntimeError(f"Corrupt index file: {self.Path}")
+
+        return entries
+
+    def close(self) -> void_t:
+        """
+        Release the section views and close the underlying memory map.
+        """
+        # Derived views must be released before the views they were derived from
+        for view in [*self._Tables.values(), *self._Sections.values()]:
+            view.release()
+
+        self._Tables.clear()
+        self._Sections.clear()
+
+        if self._Map is not None:
+            self._Map.close()
+            self._Map = None
+
+    def section(self, pos: int) -> memoryview:
+        """
+        Get a zero-copy view of the section at the given position,
+        checking it against its checksum on first access.
+        """
+        if (view := self._Sections.get(pos)) is not None:
+            return view
+
+        if self._Map is None:
+            raise RuntimeError("Index file is not loaded")
+
+        offset, size, checksum = self._Entries[pos]
+
+        with memoryview(self._Map) as file_view:
+            view = file_view[offset:offset + size]
+
+        if zlib.crc32(view) != checksum:
+            view.release()
+            raise RuntimeError(f"Corrupt index file section {pos}: {self.Path}")
+
+        # Each section has a single view, so long-lived readers do not accumulate views
+        # (concurrent first accesses keep the view that was cached first)
+        if (cached := self._Sections.setdefault(pos, view)) is not view:
+            view.release()
+
+        return cached
+
+    def table(self, pos: int, typecode: Literal["B", "H", "I", "Q"]) -> memoryview:
+        """
+        Get a zero-copy view of the fixed-width integer table
+        (e.g., 'I' for unsigned 32-bit) at the given section position.
+        """
+        if (view := self._Tables.get((pos, typecode))) is None:
+            view = self.section(pos).cast(typecode)
+
+            if (cached := self._Tables.setdefault((pos, typecode), view)) is not view:
+                view.release()
+                view = cached
+
+        return view
+
+    def verify(self) -> void_t:
+        """
+        Check every section of the index file against its checksum.
+        """
+        for pos in range(len(self._Entries)):
+            self.section(pos)
+
+
+# Module export symbols
+__all__ = [
+    "BinaryIndex",
+    "decode_deltas",
+    "decode_varints",
+    "encode_deltas",
+    "encode_varints",
+    "write_index"
+]
@@ -4,6 +4,7 @@ Module for console utilities and control sequence processing.
 import enum
 import os
 import sys
+import timings
 import utils
 from typing import TextIO
 from alias import any_t, func_t, void_t
@@ -246,11 +247,13 @@ def _console_title(title: str) -> void_t:
 def setup_console() -> void_t:
     """
     Customize the console title and enable virtual terminal processing.
+    The title is not set when the standard output stream is redirected.
     """
     if _is_win_os() and not _enable_vt_seq():
         raise RuntimeError("Error occurred enabling virtual terminal processing")
 
-    _console_title(utils.app_title())
+    if sys.stdout.isatty():
+        _console_title(utils.app_title())
 
 
 def write_ln(obj: any_t,
@@ -258,10 +261,14 @@ def write_ln(obj: any_t,
              symbol: LevelSymbol = LevelSymbol.INFO,
              stream: TextIO = sys.stdout) -> void_t:
     """
-    Write a line prefixed with a colored status level
-    symbol to the specified output console stream.
+    Write a line prefixed with a colored status level symbol to the specified
+    output console stream. Colors are skipped if the stream is not a terminal.
     """
-    print(f"{color}{symbol}{_RESET} {obj}{_RESET}", file=stream)
+    with timings.span("console"):
+        if stream.isatty():
+            print(f"{color}{symbol}{_RESET} {obj}{_RESET}", file=stream)
+        else:
+            print(f"{symbol} {obj}", file=stream)
 
 
 def error_ln(obj: any_t) -> void_t:
@@ -278,5 +285,12 @@ def warn_ln(obj: any_t) -> void_t:
     write_ln(obj, color=Color.YELLOW, symbol=LevelSymbol.WARN, stream=sys.stderr)
 
 
+def verbose_ln(obj: any_t) -> void_t:
+    """
+    Write a verbose line to the standard error console stream.
+    """
+    write_ln(obj, color=Color.GREEN, symbol=LevelSymbol.VERBOSE, stream=sys.stderr)
+
+
 # Module export symbols
 __all__ = ["Color", "LevelSymbol", "ExternError"]
@@ -1,36 +1,330 @@
 """
 RFC specification web crawler module.
 """
-import requests
+import copy
+import math
+import timings
 import utils
-from requests import Response
+from datetime import datetime
+from threading import Lock
+from types import TracebackType
+from typing import TYPE_CHECKING, Generator, Iterable, Iterator
 from alias import void_t
-from query_params import QueryParams
+from http_cache import ResponseCache
+from query_params import FIRST_YEAR, QueryParams
+from result_cache import ResultCache
+from scheduler import RequestScheduler
+from search_results import SearchResults
+from rfc_index import RfcIndex
 from spec_metadata import SpecMetadata
 
+# Network and HTML parsing modules are only imported once a request is sent,
+# so that lookups resolved by the local index do not pay their import cost
+if TYPE_CHECKING:
+    from requests import Response, Session
+    from result_parser import ResultParser
+
+# Streamed response content chunk size (in bytes)
+_CHUNK_SIZE: int = 16 * 1024
+
+
+class PoolConfig:
+    """
+    HTTP connection pool configuration.
+    """
+    def __init__(self,
+                 pool_size: int = 10,
+                 keep_alive: bool = True,
+                 connect_timeout: float = 10.0,
+                 read_timeout: float = 30.0,
+                 retries: int = 3,
+                 backoff: float = 0.5,
+                 max_workers: int = 4,
+                 rate_limit: float = 0.0,
+                 burst: int = 10) -> None:
+        """
+        Initialize the object.
+        """
+        self.PoolSize: int = pool_size                # Maximum pooled connections per host
+        self.KeepAlive: bool = keep_alive             # Reuse connections between requests
+        self.ConnectTimeout: float = connect_timeout  # Connection timeout (seconds)
+        self.ReadTimeout: float = read_timeout        # Response read timeout (seconds)
+        self.Retries: int = retries                   # Maximum request retry attempts
+        self.Backoff: float = backoff                 # Retry exponential backoff factor
+        self.MaxWorkers: int = max_workers            # Maximum concurrent page requests
+        self.RateLimit: float = rate_limit            # Maximum requests/s (0 for unlimited)
+        self.Burst: int = burst                       # Maximum request burst size
+
+        if self.PoolSize < 1:
+            raise ValueError(f"Invalid connection pool size: {self.PoolSize}")
+
+        if self.MaxWorkers < 1:
+            raise ValueError(f"Invalid maximum worker count: {self.MaxWorkers}")
+
+        if self.RateLimit < 0:
+            raise ValueError(f"Invalid request rate limit: {self.RateLimit}")
+
+    def timeout(self) -> tuple[float, float]:
+        """
+        Get the connect and read timeouts used for HTTP requests.
+        """
+        return self.ConnectTimeout, self.ReadTimeout
+
+    def scheduler(self) -> RequestScheduler:
+        """
+        Create a request scheduler that enforces the configured rate, concurrency
+        and retry limits.
+        """
+        return RequestScheduler(self.RateLimit,
+                                self.Burst,
+                                self.MaxWorkers,
+                                self.Retries,
+                                self.Backoff,
+                                latency_target=self.ReadTimeout / 2)
+
 
 class Crawler:
     """
     RFC specification web crawler.
     """
-    def __init__(self, params: QueryParams) -> None:
+    def __init__(self,
+                 params: QueryParams | None = None,
+                 index: RfcIndex | None = None,
+                 cache: ResponseCache | None = None,
+                 offline: bool = False,
+                 pool: PoolConfig | None = None,
+                 results: ResultCache | None = None) -> None:
         """
         Initialize the object.
         """
-        self.Params: QueryParams = params  # Lookup query parameters
+        self.Params: QueryParams | None = params    # Lookup query parameters
+        self.Index: RfcIndex | None = index         # Local specification index
+        self.Cache: ResponseCache | None = cache    # HTTP response cache
+        self.Offline: bool = offline                # Only serve cached responses
+        self.Pool: PoolConfig = pool if pool else PoolConfig()  # Connection pool config
+        self.Results: ResultCache | None = results  # Parsed search result cache
+
+        # Derived crawlers share the scheduler, so limits apply to all their requests
+        self.Scheduler: RequestScheduler = self.Pool.scheduler()
+
+        self._Session: Session | None = None
+        self._Lock: Lock = Lock()
+
+    def __enter__(self) -> "Crawler":
+        """
+        Enter the runtime context of the object.
+        """
+        return self
+
+    def __exit__(self,
+                 exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> void_t:
+        """
+        Exit the runtime context of the object and release its pooled connections.
+        """
+        self.close()
+
+    def close(self) -> void_t:
+        """
+        Close the underlying HTTP session and all its pooled connections.
+        """
+        if self._Session is not None:
+            self._Session.close()
+
+    def derive(self, params: QueryParams | None = None) -> "Crawler":
+        """
+        Create a crawler with the given query parameters that shares the underlying
+        index, caches and pooled HTTP session, so that concurrent searches can use
+        different parameters. Derived crawlers must not be closed.
+        """
+        crawler = copy.copy(self)
+        crawler.Params = params
+
+        if not self.Offline:
+            crawler._Session = self._session()
+
+        return crawler
+
+    def _session(self) -> "Session":
+        """
+        Get the underlying HTTP session, creating it when it is first used.
+        """
+        with self._Lock:
+            if self._Session is None:
+                self._Session = self._make_session()
+
+            return self._Session
+
+    def _make_session(self) -> "Session":
+        """
+        Create an HTTP session backed by the configured connection pool.
+        Requests are retried by the scheduler rather than the session.
+        """
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=self.Pool.PoolSize,
+                              pool_maxsize=self.Pool.PoolSize,
+                              max_retries=0)
+        session = Session()
+
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        if not self.Pool.KeepAlive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    def _query(self) -> QueryParams:
+        """
+        Get the underlying lookup query parameters.
+        """
+        if self.Params is None:
+            raise RuntimeError("Missing lookup query parameters")
+
+        return self.Params
+
+    def fetch_text(self, spec: SpecMetadata) -> str | void_t:
+        """
+        Download the plain text of the given specification.
+        """
+        if not spec.TxtUrl or self.Offline:
+            return None
+
+        response = self.fetch(spec.TxtUrl)
+
+        if response.status_code != 200:
+            return None
+
+        return response.text
+
+    def fetch(self,
+              url: str,
+              headers: dict[str, str] | None = None,
+              stream: bool = False) -> "Response":
+        """
+        Send an HTTP GET request for the given URL using the pooled HTTP session.
+        """
+        if not utils.valid_url(url):
+            raise ValueError(f"Invalid URL: {url}")
+
+        if self.Offline:
+            raise RuntimeError(f"Cannot fetch '{url}' in offline mode")
+
+        session = self._session()
+
+        with timings.span("http"):
+            return self.Scheduler.send(lambda: session.get(url,
+                                                           headers=headers,
+                                                           timeout=self.Pool.timeout(),
+                                                           stream=stream))
 
-    def _send_request(self, url: str) -> Response | void_t:
+    def _send_request(self,
+                      url: str,
+                      query: QueryParams | None = None,
+                      stream: bool = False) -> "Response | void_t":
         """
-        Send an HTTP GET request to the server with the underlying query parameters.
+        Send an HTTP GET request to the server with the given query
+        parameters, or the underlying query parameters if none are given.
+        Streamed response content is not added to the response cache.
         """
         if not utils.valid_url(url):
             raise ValueError(f"Invalid url: {url}")
 
-        response = requests.get(url, self.Params.dict())
-        response.close()
+        params = (query if query else self._query()).dict()
+        entry = self.Cache.get(url, params) if self.Cache else None
+
+        if self.Offline or (entry and self.Cache and self.Cache.is_fresh(entry)):
+            return entry.response() if entry else None
+
+        session = self._session()
+        headers = entry.headers() if entry else None
+
+        with timings.span("http"):
+            response = self.Scheduler.send(lambda: session.get(url,
+                                                               params=params,
+                                                               headers=headers,
+                                                               timeout=self.Pool.timeout(),
+                                                               stream=stream))
+
+        if self.Cache is not None:
+            if response.status_code == 304 and entry is not None:
+                return self.Cache.refresh(url, params, entry).response()
+
+            if response.status_code == 200 and not stream:
+                self.Cache.put(url, params, response)
 
         return response
 
+    def _search_page(self, url: str, page_num: int = 1) -> "ResultParser | void_t":
+        """
+        Send a search request for the given result page number and parse the response.
+        """
+        from result_parser import ResultParser
+
+        query = copy.copy(self._query())
+        query.PageNum = page_num
+
+        response = self._send_request(url, query)
+
+        # Failed requests must not be mistaken for empty result pages
+        if response is None or response.status_code != 200:
+            return None
+
+        return ResultParser(url).parse_page(response.text)
+
+    def _stream_page(self,
+                     url: str,
+                     parser: "ResultParser",
+                     page_num: int = 1) -> Generator[SpecMetadata, None, bool]:
+        """
+        Send a streamed search request for the given result page number and
+        incrementally parse the response as its content is received. Determine
+        whether a successful response was received and parsed.
+        """
+        query = copy.copy(self._query())
+        query.PageNum = page_num
+
+        response = self._send_request(url, query, stream=True)
+
+        if response is None:
+            return False
+
+        # Error responses are not result pages, so their content is discarded
+        if response.status_code != 200:
+            response.close()
+            return False
+
+        # Cached responses have no underlying raw stream
+        body = list[bytes]() if self.Cache and response.raw is not None else None
+
+        with response:
+            # Content is received as it is iterated, so each chunk is an HTTP span
+            content = response.iter_content(chunk_size=_CHUNK_SIZE)
+            chunks = timings.iter_span("http", content)
+
+            if body is not None:
+                chunks = Crawler._tee(chunks, body)
+
+            yield from parser.iter_parse(chunks, response.encoding or "utf-8")
+
+        if self.Cache is not None and body is not None:
+            self.Cache.put(url, query.dict(), response, b"".join(body))
+
+        return True
+
+    @staticmethod
+    def _tee(chunks: Iterable[bytes], body: list[bytes]) -> Iterator[bytes]:
+        """
+        Get an iterator over the given response content chunks that also
+        collects them into the given response body chunk list.
+        """
+        for chunk in chunks:
+            body.append(chunk)
+            yield chunk
+
     def crawl(self, url: str) -> SpecMetadata | list[SpecMetadata] | void_t:
         """
         Use the RFC web search functionality to find the specification(s)
@@ -39,32 +333,309 @@ class Crawler:
         if not utils.valid_url(url):
             raise ValueError(f"Invalid URL: {url}")
 
-        self.Params.validate()
-        url = "https://www.rfc-editor.org/search/rfc_search_detail.php"
+        self._query().validate()
 
         # ID search takes precedence over keyword search
-        return self.id_search(url) if self.Params.Id else self.keyword_search(url)
+        return self.id_search(url) if self._query().Id else self.keyword_search(url)
 
     def id_search(self, url: str) -> SpecMetadata | void_t:
         """
         Use the RFC web search functionality to find the specification matching
         the RFC number specified in the underlying query parameters.
         """
-        if not self.Params.Id:
+        rfc_id = self._query().Id
+
+        if not rfc_id:
             raise RuntimeError("Missing RFC number for which to search")
 
-        raise NotImplementedError(self.id_search)
+        return self._lookup_id(url, rfc_id)
+
+    def batch_search(self,
+                     url: str,
+                     rfc_ids: Iterable[int]) -> Iterator[tuple[int, SpecMetadata | void_t]]:
+        """
+        Find the specifications matching the given RFC numbers, yielding each distinct
+        RFC number and its specification (if found) in input order. Local index hits
+        are resolved immediately, and all other lookups are sent concurrently.
+        """
+        unique_ids = list(dict.fromkeys(rfc_ids))
+
+        if any([i <= 0 for i in unique_ids]):
+            raise ValueError(f"Invalid RFC number: {min(unique_ids)}")
+
+        misses = [i for i in unique_ids if not self._index_hit(i)]
+
+        # Lookups resolved by the local index need no worker threads
+        if not misses and self.Index is not None:
+            yield from [(i, self.Index.lookup(i)) for i in unique_ids]
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.Pool.MaxWorkers) as executor:
+            futures = {i: executor.submit(self._lookup_id, url, i) for i in misses}
+
+            for rfc_id in unique_ids:
+                if rfc_id in futures:
+                    yield rfc_id, futures.pop(rfc_id).result()
+
+                elif self.Index is not None:
+                    yield rfc_id, self.Index.lookup(rfc_id)
+
+    def _index_hit(self, rfc_id: int) -> bool:
+        """
+        Determine whether the given RFC number can be resolved using only the local index.
+        """
+        return self.Index is not None and not self.Index.is_stale() and rfc_id in self.Index
+
+    def _lookup_id(self, url: str, rfc_id: int) -> SpecMetadata | void_t:
+        """
+        Find the specification matching the given RFC number, using the local
+        index if possible and falling back to the RFC web search functionality.
+        """
+        spec = self.Index.lookup(rfc_id) if self.Index else None
+
+        # Local index entries take precedence over the network
+        if spec is not None and self.Index and not self.Index.is_stale():
+            return spec
+
+        if self.Params is not None:
+            query = copy.copy(self.Params)
+            query.Id = rfc_id
+        else:
+            query = QueryParams(FIRST_YEAR, datetime.now().year, rfc_id=rfc_id)
+
+        if self.Results is not None:
+            cached = self.Results.get(query.key(), self.Offline)
+
+            if cached is not None:
+                return next((r for r in cached if r.Id == rfc_id), spec)
+
+        import requests
+        from result_parser import ResultParser
+
+        try:
+            response = self._send_request(url, query)
+        except requests.RequestException:
+            if spec is None:
+                raise
+            return spec
+
+        # Failed lookups are not cached, since they are not missing specifications
+        if response is None or response.status_code != 200:
+            return spec
+
+        results = ResultParser(url).parse(response.text)
+        match = next((r for r in results if r.Id == rfc_id), None)
+
+        if self.Results is not None:
+            self.Results.put(query.key(), [match] if match is not None else [])
+
+        if match is not None and self.Index is not None:
+            self.Index.add(match)
+
+        return match if match is not None else spec
+
+    def iter_search(self, url: str) -> Iterator[SpecMetadata]:
+        """
+        Use the RFC web search functionality to lazily find the specification(s)
+        matching the criteria in the underlying query parameters, yielding each
+        specification as soon as its search result row has been parsed.
+        """
+        if not self._query().Id:
+            yield from self._iter_keyword_search(url)
+
+        elif (spec := self.id_search(url)) is not None:
+            yield spec
+
+    def search(self, url: str, limit: int = 0) -> SearchResults:
+        """
+        Use the RFC web search functionality to lazily find at most the given number
+        of specifications (0 for unlimited) containing the RFC title or keyword
+        specified in the underlying query parameters. Result pages are only fetched
+        once the results of the previous pages have been consumed.
+        """
+        results = SearchResults(limit)
+        return results.bind(self._iter_keyword_search(url, results))
 
     def keyword_search(self, url: str) -> list[SpecMetadata] | void_t:
         """
         Use the RFC web search functionality to find the specifications containing
         the RFC title or keyword specified in the underlying query parameters.
         """
-        if not self.Params.Title:
-            raise RuntimeError("Missing RFC title or keyword for which to search")
+        return list(self._iter_keyword_search(url))
+
+    def _iter_keyword_search(self,
+                             url: str,
+                             hints: SearchResults | None = None) -> Iterator[SpecMetadata]:
+        """
+        Lazily find the specifications containing the RFC title or keyword (or
+        published in the year range) specified in the underlying query parameters,
+        using the parsed result cache if possible. The first result page is
+        streamed, and any remaining pages are fetched concurrently on demand.
+        The total result count and result limit are shared with the given hints.
+        """
+        if not self._query().Title and not self._query().is_bounded():
+            raise RuntimeError("Missing RFC title, keyword or year range "
+                               "for which to search")
+
+        key = self._query().key()
+        cached = self.Results.get(key, self.Offline) if self.Results else None
+
+        if cached is not None:
+            if hints is not None:
+                hints.Total = len(cached)
+
+            yield from cached
+            return
+
+        results = list[SpecMetadata]()
+        complete = yield from self._iter_search_pages(url, hints, results)
+
+        # Searches that are abandoned before their last result, limited to fewer
+        # result pages or missing failed pages are not cached, since cache keys
+        # have no limit and failed requests are not empty results
+        if complete and self.Results is not None:
+            self.Results.put(key, results)
+
+    def _iter_search_pages(self,
+                           url: str,
+                           hints: SearchResults | None = None,
+                           results: list[SpecMetadata] | None = None
+                           ) -> Generator[SpecMetadata, None, bool]:
+        """
+        Lazily find the distinct specifications of every search result page (or of
+        the pages within the result limit), collecting them into the given result
+        list. Determine whether every result page was fetched.
+        """
+        from result_parser import ResultParser
+        parser = ResultParser(url)
+        rfc_ids = set[int]()
+        row_count = 0
+
+        stream = self._stream_page(url, parser)
+
+        while True:
+            # Streamed pages report whether a successful response was parsed
+            try:
+                spec = next(stream)
+            except StopIteration as stop:
+                received: bool = stop.value
+                break
+
+            row_count += 1
+
+            # Total result counts precede the first result row
+            if hints is not None and hints.Total is None and parser.Total:
+                hints.Total = parser.Total
+
+            if spec.Id not in rfc_ids:
+                rfc_ids.add(spec.Id)
+
+                if results is not None:
+                    results.append(spec)
+                yield spec
+
+        if not received:
+            return False
+
+        page_size = abs(self._query().Page)
+
+        # All results were returned in a single page
+        if not page_size or row_count < page_size:
+            if hints is not None and hints.Total is None:
+                hints.Total = len(rfc_ids)
+            return True
+
+        max_pages = 0
+        complete = True
+
+        # Limited searches never request pages beyond their limit
+        if hints is not None and hints.Limit:
+            max_pages = math.ceil(max(hints.Limit - len(rfc_ids), 1) / page_size)
+
+            # Result page counts are unknown without a total result count
+            complete = 0 < parser.Total <= (max_pages + 1) * page_size
+
+        # Remove duplicates caused by results shifting between page requests
+        for page in self._iter_pages(url, parser.Total, page_size, max_pages):
+            if page is None:
+                complete = False
+                continue
+
+            for spec in page:
+                if spec.Id not in rfc_ids:
+                    rfc_ids.add(spec.Id)
+
+                    if results is not None:
+                        results.append(spec)
+                    yield spec
+
+        return complete
+
+    def _iter_pages(self,
+                    url: str,
+                    total: int,
+                    page_size: int,
+                    max_pages: int = 0) -> Iterator[list[SpecMetadata] | void_t]:
+        """
+        Get the search results of every page after the first result page (or at most
+        the given number of pages), in page order. At most one page per worker is
+        requested ahead of the consumer, and unrequested pages are never fetched.
+        Pages whose request failed are yielded as none.
+        """
+        if total:
+            page_nums = range(2, math.ceil(total / page_size) + 1)
+
+            if max_pages:
+                page_nums = page_nums[:max_pages]
+
+            max_workers = min(self.Pool.MaxWorkers, max(len(page_nums), 1))
+
+            from collections import deque
+            from concurrent.futures import Future, ThreadPoolExecutor
+
+            pending = deque[Future["ResultParser | void_t"]]()
+            next_nums = iter(page_nums)
+            search_page = self._search_page
+
+            # Pages are fetched concurrently but collected in page order
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                try:
+                    for page_num in next_nums:
+                        pending.append(executor.submit(search_page, url, page_num))
+
+                        if len(pending) >= max_workers:
+                            break
+
+                    while pending:
+                        page = pending.popleft().result()
+
+                        if (page_num := next(next_nums, 0)) > 0:
+                            pending.append(executor.submit(search_page, url, page_num))
+
+                        yield page.Results if page is not None else None
+
+                # Abandoned searches cancel their pages that have not been requested yet
+                finally:
+                    for future in pending:
+                        future.cancel()
+        else:
+            page_num = 2
+            page = self._search_page(url, page_num)
+
+            # Total result count is unknown, so fetch until a partial page
+            while page is not None:
+                yield page.Results
+
+                if len(page.Results) < page_size or page_num - 1 == max_pages:
+                    return
+
+                page_num += 1
+                page = self._search_page(url, page_num)
 
-        raise NotImplementedError(self.keyword_search)
+            yield None
 
 
 # Module export symbols
-__all__ = ["Crawler"]
+__all__ = ["Crawler", "PoolConfig"]
@@ -0,0 +1,314 @@
+"""
+Local RFC specification status, year and author facet index module.
+"""
+import bisect
+import contextlib
+import itertools
+import json
+import os
+import re
+import utils
+from array import array
+from typing import Iterable
+from alias import void_t
+from binary_index import BinaryIndex, decode_deltas, encode_deltas, write_index
+from rfc_index import RfcIndex
+from spec_metadata import SpecMetadata
+
+_INDEX_KIND: bytes = b"FCET"                              # Binary index file kind
+_INDEX_VERSION: int = 1                                   # Index file format version
+_YEAR_RE: re.Pattern[str] = re.compile(r"\b(\d{4})\b")    # Publication date year pattern
+_WORD_RE: re.Pattern[str] = re.compile(r"\w+")           # Status or author word pattern
+_EMPTY_TABLE: memoryview = memoryview(bytes()).cast("I")  # Unmapped index file table
+
+
+def words(text: str) -> list[str]:
+    """
+    Split the given status or author name into casefolded words.
+    """
+    return _WORD_RE.findall(text.casefold())
+
+
+def bitset(rfc_ids: Iterable[int]) -> int:
+    """
+    Get the bitset of the given RFC numbers, where bit N is set if RFC N is included.
+    """
+    data = bytearray()
+
+    for rfc_id in rfc_ids:
+        if rfc_id >> 3 >= len(data):
+            data.extend(bytes((rfc_id >> 3) + 1 - len(data)))
+        data[rfc_id >> 3] |= 1 << (rfc_id & 7)
+
+    return int.from_bytes(data, "little")
+
+
+def members(bits: int) -> list[int]:
+    """
+    Get the RFC numbers included in the given bitset in ascending order.
+    """
+    digits = bin(bits)[:1:-1]
+    rfc_ids = list[int]()
+    pos = digits.find("1")
+
+    while pos != -1:
+        rfc_ids.append(pos)
+        pos = digits.find("1", pos + 1)
+
+    return rfc_ids
+
+
+class FacetIndex:
+    """
+    Precomputed facet index over the local RFC index, which stores one bitset (indexed
+    by RFC number) per publication status and year, and one RFC number postings list per
+    author name word, so that facet filters are answered by bitset intersection.
+    """
+    def __init__(self, path: str = str()) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path or FacetIndex.default_path()  # Index file path
+        self.Updated: float = 0.0                           # Source index timestamp
+
+        self._All: int = 0                                 # Indexed RFC numbers
+        self._Statuses: dict[str, int] = dict[str, int]()  # Bitsets by status
+        self._Years: dict[int, int] = dict[int, int]()     # Bitsets by publication year
+        self._Authors: list[str] = list[str]()             # Sorted author name words
+
+        # RFC number postings by author name word position
+        self._Postings: list[array[int]] = list["array[int]"]()
+
+        # Memory-mapped index file, posting data offsets and delta encoded postings
+        self._File: BinaryIndex | None = None
+        self._PostingOffsets: memoryview = _EMPTY_TABLE
+        self._PostingData: memoryview = memoryview(bytes())
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed specifications.
+        """
+        return self._All.bit_count()
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Get the default facet index file path.
+        """
+        return os.path.join(utils.data_dir(), "facets.idx")
+
+    @staticmethod
+    def open(index: RfcIndex, path: str = str()) -> "FacetIndex":
+        """
+        Load the facet index of the given local RFC index from disk,
+        rebuilding and saving it if it is missing or out of date.
+        """
+        facet_index = FacetIndex(path)
+
+        # Unsupported and corrupt index files are rebuilt
+        if os.path.isfile(facet_index.Path):
+            with contextlib.suppress(RuntimeError):
+                facet_index.load()
+
+        if facet_index.Updated != index.Updated or len(facet_index) != len(index):
+            facet_index.build(index)
+            facet_index.Updated = index.Updated
+
+            if len(facet_index):
+                facet_index.save()
+
+        return facet_index
+
+    def build(self, specs: Iterable[SpecMetadata]) -> int:
+        """
+        Build the index from the given specifications, replacing all
+        existing entries. Get the number of indexed specifications.
+        """
+        statuses = dict[str, list[int]]()
+        years = dict[int, list[int]]()
+        authors = dict[str, list[int]]()
+        rfc_ids = list[int]()
+
+        for spec in specs:
+            rfc_ids.append(spec.Id)
+            statuses.setdefault(" ".join(words(spec.Status)), list[int]()).append(spec.Id)
+
+            if match := _YEAR_RE.search(spec.Date):
+                years.setdefault(int(match.group(1)), list[int]()).append(spec.Id)
+
+            for word in set(words(spec.Authors)):
+                authors.setdefault(word, list[int]()).append(spec.Id)
+
+        self.close()
+        self._All = bitset(rfc_ids)
+        self._Statuses = {k: bitset(v) for k, v in statuses.items()}
+        self._Years = {k: bitset(v) for k, v in years.items()}
+        self._Authors = sorted(authors)
+        self._Postings = [array("I", sorted(authors[w])) for w in self._Authors]
+
+        return len(rfc_ids)
+
+    def select(self,
+               statuses: Iterable[str] = (),
+               author: str = str(),
+               from_year: int = 0,
+               to_year: int = 0) -> int:
+        """
+        Get the bitset of the specifications that have any of the given statuses,
+        an author matching the given name, and a publication year in the given
+        range. Empty filters (and zero years) match every specification.
+        """
+        bits = self._All
+        statuses = [s for s in statuses if s.strip()]
+
+        if statuses:
+            bits &= self.status(statuses)
+
+        if author.strip():
+            bits &= self.author(author)
+
+        if from_year or to_year:
+            bits &= self.years(from_year, to_year)
+
+        return bits
+
+    def status(self, statuses: Iterable[str]) -> int:
+        """
+        Get the bitset of the specifications that have any of the given statuses,
+        where each status word is matched by prefix (e.g., 'proposed' or 'best current').
+        """
+        bits = 0
+
+        for status in statuses:
+            query_words = words(status)
+
+            for name, status_bits in self._Statuses.items():
+                name_words = name.split()
+
+                if all([any([n.startswith(q) for n in name_words]) for q in query_words]):
+                    bits |= status_bits
+
+        return bits
+
+    def years(self, from_year: int = 0, to_year: int = 0) -> int:
+        """
+        Get the bitset of the specifications published in the given year
+        range, where zero years leave the range unbounded.
+        """
+        bits = 0
+
+        for year, year_bits in self._Years.items():
+            if from_year <= year and (not to_year or year <= to_year):
+                bits |= year_bits
+
+        return bits
+
+    def author(self, name: str) -> int:
+        """
+        Get the bitset of the specifications with an author whose name
+        has a word matching each word of the given name by prefix.
+        """
+        bits = self._All
+
+        for query_word in words(name):
+            start = bisect.bisect_left(self._Authors, query_word)
+            end = bisect.bisect_left(self._Authors, f"{query_word}\U0010FFFF")
+
+            bits &= bitset(itertools.chain(*[self._postings(p) for p in range(start, end)]))
+
+        return bits
+
+    def _postings(self, pos: int) -> "list[int] | array[int]":
+        """
+        Get the ascending RFC numbers of the author name word at the given position.
+        """
+        if self._File is None:
+            return self._Postings[pos]
+
+        start = self._PostingOffsets[pos]
+        return decode_deltas(self._PostingData[start:self._PostingOffsets[pos + 1]])
+
+    def close(self) -> void_t:
+        """
+        Close the memory-mapped index file, which also discards its postings.
+        """
+        if self._File is not None:
+            self._File.close()
+            self._File = None
+
+            self._All = 0
+            self._Statuses.clear()
+            self._Years.clear()
+            self._Authors.clear()
+            self._PostingOffsets = _EMPTY_TABLE
+            self._PostingData = memoryview(bytes())
+
+    def load(self) -> void_t:
+        """
+        Memory-map the underlying index file. Author postings are decoded on access.
+        """
+        self.close()
+        index_file = BinaryIndex.open(self.Path, _INDEX_KIND, _INDEX_VERSION)
+
+        try:
+            data = json.loads(str(index_file.section(0), "utf-8"))
+            bitsets = index_file.section(1)
+            authors = str(index_file.section(2), "utf-8")
+
+            self._PostingOffsets = index_file.table(3, "I")
+            self._PostingData = index_file.section(4)
+        except RuntimeError:
+            index_file.close()
+            raise
+
+        # Bitsets are small, so only the author postings remain memory-mapped
+        size = data["size"]
+        keys = ["all", *data["statuses"], *data["years"]]
+        offsets = range(0, len(keys) * size, size)
+        values = [int.from_bytes(bitsets[p:p + size], "little") for p in offsets]
+
+        self.Updated = data["updated"]
+        self._All = values[0]
+        self._Statuses = dict(zip(data["statuses"], values[1:]))
+        self._Years = dict(zip(data["years"], values[1 + len(self._Statuses):]))
+        self._Authors = authors.split("\n") if authors else list[str]()
+        self._File = index_file
+
+    def save(self) -> void_t:
+        """
+        Atomically write the built index to the underlying index file.
+        """
+        # Memory-mapped indexes are unchanged since they were loaded
+        if self._File is not None:
+            return
+
+        size = (self._All.bit_length() + 7) // 8
+        bitsets = [self._All, *self._Statuses.values(), *self._Years.values()]
+
+        data = {
+            "updated": self.Updated,
+            "size": size,
+            "statuses": list(self._Statuses),
+            "years": list(self._Years)
+        }
+
+        posting_offsets = array("I", [0])
+        posting_data = bytearray()
+
+        for postings in self._Postings:
+            posting_data.extend(encode_deltas(postings))
+            posting_offsets.append(len(posting_data))
+
+        sections = [
+            json.dumps(data).encode(),
+            b"".join([b.to_bytes(size, "little") for b in bitsets]),
+            "\n".join(self._Authors).encode("utf-8"),
+            posting_offsets.tobytes(),
+            bytes(posting_data)
+        ]
+
+        write_index(self.Path, _INDEX_KIND, _INDEX_VERSION, sections)
+
+
+# Module export symbols
+__all__ = ["FacetIndex", "bitset", "members", "words"]
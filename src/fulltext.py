@@ -0,0 +1,452 @@
+"""
+RFC specification full-text search index module.
+"""
+import bisect
+import contextlib
+import itertools
+import json
+import math
+import os
+import re
+import utils
+from array import array
+from typing import Container, Iterable
+from alias import void_t
+from binary_index import BinaryIndex, write_index
+from binary_index import decode_varints, encode_deltas, encode_varints
+
+# BM25 term frequency saturation parameter
+BM25_K1: float = 1.2
+
+# BM25 document length normalization parameter
+BM25_B: float = 0.75
+
+_INDEX_KIND: bytes = b"FTXT"                            # Binary index file kind
+_INDEX_VERSION: int = 2                                 # Index file format version
+_TOKEN_RE: re.Pattern[str] = re.compile(r"[a-z0-9]+")   # Token pattern
+_PHRASE_RE: re.Pattern[str] = re.compile(r'"([^"]*)"')  # Query phrase pattern
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split the given text into lowercase alphanumeric tokens.
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+class Postings:
+    """
+    Positional postings list of a single term, stored as parallel arrays.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the object.
+        """
+        self.Docs: array[int] = array("I")       # Document RFC numbers
+        self.Freqs: array[int] = array("I")      # Term frequency per document
+        self.Offsets: array[int] = array("Q")    # Document offset into positions
+        self.Positions: array[int] = array("I")  # Token positions of all documents
+
+    def add(self, rfc_id: int, positions: list[int]) -> void_t:
+        """
+        Add the term positions of the given document.
+        """
+        self.Docs.append(rfc_id)
+        self.Freqs.append(len(positions))
+        self.Offsets.append(len(self.Positions))
+        self.Positions.extend(positions)
+
+    def extend(self, other: "Postings") -> void_t:
+        """
+        Append the documents of the given postings list, whose RFC
+        numbers must all be greater than those of this postings list.
+        """
+        base = len(self.Positions)
+
+        self.Docs.extend(other.Docs)
+        self.Freqs.extend(other.Freqs)
+        self.Offsets.extend([o + base for o in other.Offsets])
+        self.Positions.extend(other.Positions)
+
+    def encode(self) -> tuple[bytes, bytes]:
+        """
+        Encode the postings as delta encoded RFC numbers followed by
+        their term frequencies, and as per-document delta encoded
+        term positions, all as variable-length integers.
+        """
+        positions = bytearray()
+
+        for doc_pos in range(len(self.Docs)):
+            positions.extend(encode_deltas(self.positions(doc_pos)))
+
+        return encode_deltas(self.Docs) + encode_varints(self.Freqs), bytes(positions)
+
+    @staticmethod
+    def decode(docs: bytes | memoryview,
+               positions: bytes | memoryview | None) -> "Postings":
+        """
+        Decode the given encoded postings, and the given encoded term positions (if any).
+        """
+        postings = Postings()
+        values = decode_varints(docs)
+        count = len(values) // 2
+
+        postings.Docs = array("I", itertools.accumulate(values[:count]))
+        postings.Freqs = array("I", values[count:])
+
+        if positions is not None:
+            values = decode_varints(positions)
+            offset = 0
+
+            for freq in postings.Freqs:
+                postings.Offsets.append(offset)
+                deltas = values[offset:offset + freq]
+                postings.Positions.extend(itertools.accumulate(deltas))
+                offset += freq
+
+        return postings
+
+    def positions(self, doc_pos: int) -> "array[int]":
+        """
+        Get the term positions of the document at the given postings position.
+        """
+        offset = self.Offsets[doc_pos]
+        return self.Positions[offset:offset + self.Freqs[doc_pos]]
+
+
+class FullTextIndex:
+    """
+    Positional inverted index over RFC specification text with BM25 ranking. Saved
+    indexes are memory-mapped binary index files of variable-length delta encoded
+    postings, which are only decoded for the query terms.
+    """
+    def __init__(self, path: str = str()) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path if path else FullTextIndex.default_path()  # Index file path
+
+        self._Postings: dict[str, Postings] = dict[str, Postings]()
+        self._DocLens: dict[int, int] = dict[int, int]()
+        self._TotalLen: int = 0
+
+        # Memory-mapped index file (whose postings are decoded on access) and term count
+        self._File: BinaryIndex | None = None
+        self._Terms: int = 0
+
+    def __contains__(self, rfc_id: int) -> bool:
+        """
+        Determine whether the index contains the given RFC number.
+        """
+        return rfc_id in self._DocLens
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed documents.
+        """
+        return len(self._DocLens)
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Get the default full-text index file path.
+        """
+        return os.path.join(utils.data_dir(), "fulltext.idx")
+
+    @staticmethod
+    def open(path: str = str()) -> "FullTextIndex":
+        """
+        Load the full-text index from disk, or get an empty index if none exists.
+        """
+        index = FullTextIndex(path)
+
+        # Unsupported and corrupt index files are rebuilt by the next corpus indexing
+        if os.path.isfile(index.Path):
+            with contextlib.suppress(RuntimeError):
+                index.load()
+
+        return index
+
+    def add(self, rfc_id: int, text: str) -> void_t:
+        """
+        Add the given RFC specification text to the index. Documents
+        must be added in ascending RFC number order.
+        """
+        self._decode()
+
+        if rfc_id in self._DocLens:
+            raise ValueError(f"RFC {rfc_id} is already indexed")
+
+        if self._DocLens and rfc_id < next(reversed(self._DocLens)):
+            raise ValueError(f"RFC {rfc_id} was added out of order")
+
+        term_positions = dict[str, list[int]]()
+        tokens = tokenize(text)
+
+        for pos, token in enumerate(tokens):
+            term_positions.setdefault(token, list[int]()).append(pos)
+
+        for term, positions in term_positions.items():
+            if term not in self._Postings:
+                self._Postings[term] = Postings()
+            self._Postings[term].add(rfc_id, positions)
+
+        self._DocLens[rfc_id] = len(tokens)
+        self._TotalLen += len(tokens)
+
+    def build(self, documents: Iterable[tuple[int, str]]) -> int:
+        """
+        Build the index from the given RFC number and text pairs (in ascending RFC
+        number order), replacing all existing documents. Get the number of
+        indexed documents.
+        """
+        self.close()
+        self._Postings.clear()
+        self._DocLens.clear()
+        self._TotalLen = 0
+
+        for rfc_id, text in documents:
+            self.add(rfc_id, text)
+
+        return len(self._DocLens)
+
+    def merge(self, other: "FullTextIndex") -> void_t:
+        """
+        Append the documents of the given index (e.g., the partial index of a corpus
+        shard), whose RFC numbers must all be greater than those of this index.
+        """
+        self._decode()
+        other._decode()
+
+        if self._DocLens and other._DocLens:
+            first_id: int = next(iter(other._DocLens))
+
+            if first_id <= next(reversed(self._DocLens)):
+                raise ValueError(f"RFC {first_id} was merged out of order")
+
+        for term, postings in other._Postings.items():
+            if term in self._Postings:
+                self._Postings[term].extend(postings)
+            else:
+                self._Postings[term] = postings
+
+        self._DocLens.update(other._DocLens)
+        self._TotalLen += other._TotalLen
+
+    def search(self,
+               query: str,
+               limit: int = 10,
+               allowed: Container[int] | None = None) -> list[tuple[int, float]]:
+        """
+        Get the RFC numbers and BM25 scores of the best matching documents for
+        the given query (limited to the given allowed RFC numbers, if any).
+        Quoted query phrases must appear in matching documents.
+        """
+        phrases = [tokenize(p) for p in _PHRASE_RE.findall(query)]
+        terms = set(tokenize(query))
+
+        if not terms or not self._DocLens:
+            return list[tuple[int, float]]()
+
+        scores = self._bm25(terms)
+
+        if allowed is not None:
+            scores = {k: v for k, v in scores.items() if k in allowed}
+
+        for phrase in [p for p in phrases if p]:
+            phrase_docs = self._phrase_docs(phrase)
+            scores = {k: v for k, v in scores.items() if k in phrase_docs}
+
+        ranked = sorted(scores.items(), key=lambda s: (-s[1], s[0]))
+        return ranked[:limit] if limit > 0 else ranked
+
+    def _bm25(self, terms: set[str]) -> dict[int, float]:
+        """
+        Get the BM25 scores of all documents containing any of the given terms.
+        """
+        doc_count = len(self._DocLens)
+        avg_len = self._TotalLen / doc_count
+        scores = dict[int, float]()
+
+        for term in terms:
+            postings = self._postings(term)
+
+            if postings is None:
+                continue
+
+            doc_freq = len(postings.Docs)
+            idf = math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+            for rfc_id, freq in zip(postings.Docs, postings.Freqs):
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._DocLens[rfc_id] / avg_len)
+                score = idf * freq * (BM25_K1 + 1) / (freq + norm)
+                scores[rfc_id] = scores.get(rfc_id, 0.0) + score
+
+        return scores
+
+    def _phrase_docs(self, phrase: list[str]) -> set[int]:
+        """
+        Get the RFC numbers of all documents containing the given token sequence.
+        """
+        postings = list[Postings]()
+
+        for term in phrase:
+            if (term_postings := self._postings(term, True)) is None:
+                return set[int]()
+            postings.append(term_postings)
+
+        doc_maps = [{d: i for i, d in enumerate(p.Docs)} for p in postings]
+        matches = set[int]()
+
+        # Check the rarest term's documents first to minimize work
+        for rfc_id in min(doc_maps, key=len):
+            if not all([rfc_id in m for m in doc_maps]):
+                continue
+
+            starts = set(postings[0].positions(doc_maps[0][rfc_id]))
+
+            for offset in range(1, len(phrase)):
+                positions = postings[offset].positions(doc_maps[offset][rfc_id])
+                starts &= {p - offset for p in positions}
+
+                if not starts:
+                    break
+
+            if starts:
+                matches.add(rfc_id)
+
+        return matches
+
+    def _term(self, pos: int) -> bytes:
+        """
+        Get the memory-mapped term at the given term table position.
+        """
+        if self._File is None:
+            raise RuntimeError("Index file is not loaded")
+
+        term_offsets = self._File.table(4, "Q")
+        return bytes(self._File.section(3)[term_offsets[pos]:term_offsets[pos + 1]])
+
+    def _term_pos(self, term: str) -> int:
+        """
+        Get the term table position of the given memory-mapped term,
+        or -1 if it is not indexed.
+        """
+        key = term.encode()
+        pos = bisect.bisect_left(range(self._Terms), key, key=self._term)
+
+        return pos if pos < self._Terms and self._term(pos) == key else -1
+
+    def _postings(self, term: str, positions: bool = False) -> Postings | void_t:
+        """
+        Get the postings list of the given term, decoding its term positions
+        from the memory-mapped index file only if requested.
+        """
+        if self._File is None:
+            return self._Postings.get(term)
+
+        if (pos := self._term_pos(term)) == -1:
+            return None
+
+        doc_offsets = self._File.table(5, "Q")
+        docs = self._File.section(6)[doc_offsets[pos]:doc_offsets[pos + 1]]
+
+        if not positions:
+            return Postings.decode(docs, None)
+
+        position_offsets = self._File.table(7, "Q")
+        start, end = position_offsets[pos], position_offsets[pos + 1]
+
+        return Postings.decode(docs, self._File.section(8)[start:end])
+
+    def _decode(self) -> void_t:
+        """
+        Decode every memory-mapped postings list so that the index can
+        be modified, then close the index file.
+        """
+        if self._File is None:
+            return
+
+        terms = [str(self._term(p), "utf-8") for p in range(self._Terms)]
+        postings = {t: self._postings(t, True) for t in terms}
+
+        self.close()
+        self._Postings = {t: p for t, p in postings.items() if p is not None}
+
+    def close(self) -> void_t:
+        """
+        Close the memory-mapped index file, if any.
+        """
+        if self._File is not None:
+            self._File.close()
+            self._File = None
+            self._Terms = 0
+
+    def load(self) -> void_t:
+        """
+        Memory-map the underlying index file. Postings are decoded on access.
+        """
+        self.close()
+        index_file = BinaryIndex.open(self.Path, _INDEX_KIND, _INDEX_VERSION)
+
+        try:
+            data = json.loads(str(index_file.section(0), "utf-8"))
+
+            # Document length tables are small, so only the postings remain memory-mapped
+            doc_lens = dict(zip(index_file.table(1, "I"), index_file.table(2, "I")))
+        except RuntimeError:
+            index_file.close()
+            raise
+
+        self._Postings.clear()
+        self._DocLens = doc_lens
+        self._TotalLen = data["total_len"]
+        self._Terms = data["terms"]
+        self._File = index_file
+
+    def save(self) -> void_t:
+        """
+        Atomically write the index to the underlying index file.
+        """
+        # Memory-mapped indexes are unchanged since they were loaded
+        if self._File is not None:
+            return
+
+        terms = sorted(self._Postings)
+        doc_offsets = array("Q", [0])
+        doc_data = bytearray()
+        position_offsets = array("Q", [0])
+        position_data = bytearray()
+
+        for term in terms:
+            docs, positions = self._Postings[term].encode()
+
+            doc_data.extend(docs)
+            doc_offsets.append(len(doc_data))
+            position_data.extend(positions)
+            position_offsets.append(len(position_data))
+
+        term_offsets = array("Q", [0])
+
+        for term in terms:
+            term_offsets.append(term_offsets[-1] + len(term.encode()))
+
+        data = {"total_len": self._TotalLen, "terms": len(terms)}
+
+        sections = [
+            json.dumps(data).encode(),
+            array("I", self._DocLens).tobytes(),
+            array("I", self._DocLens.values()).tobytes(),
+            "".join(terms).encode(),
+            term_offsets.tobytes(),
+            doc_offsets.tobytes(),
+            bytes(doc_data),
+            position_offsets.tobytes(),
+            bytes(position_data)
+        ]
+
+        write_index(self.Path, _INDEX_KIND, _INDEX_VERSION, sections)
+
+
+# Module export symbols
+__all__ = ["BM25_B", "BM25_K1", "FullTextIndex", "Postings", "tokenize"]
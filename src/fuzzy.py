@@ -0,0 +1,361 @@
+"""
+Typo-tolerant RFC specification title search module.
+"""
+import bisect
+import contextlib
+import json
+import os
+import re
+import utils
+from array import array
+from collections import Counter
+from typing import Container, Iterable
+from alias import void_t
+from binary_index import BinaryIndex, decode_deltas, encode_deltas, write_index
+from rfc_index import RfcIndex
+
+# Default maximum number of ranked title matches
+DEFAULT_LIMIT: int = 10
+
+# Minimum query trigram coverage of a ranked title match
+MIN_SIMILARITY: float = 0.2
+
+_INDEX_KIND: bytes = b"TRGM"                            # Binary index file kind
+_INDEX_VERSION: int = 2                                 # Index file format version
+_CANDIDATES: int = 50                                   # Edit distance re-rank candidates
+_MIN_TYPO_LIMIT: int = 2                                # Minimum word edit distance limit
+_WORD_RE: re.Pattern[str] = re.compile(r"[a-z0-9]+")    # Title word pattern
+_EMPTY: memoryview = memoryview(bytes())                # Unmapped index file section
+_EMPTY_TABLE: memoryview = _EMPTY.cast("I")             # Unmapped index file table
+
+
+def words(text: str) -> list[str]:
+    """
+    Split the given text into lowercase alphanumeric words.
+    """
+    return _WORD_RE.findall(text.lower())
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    Get the distinct trigrams of the words in the given text. Words are padded
+    so that their first and last characters also form trigrams.
+    """
+    grams = set[str]()
+
+    for word in words(text):
+        padded = f"  {word} "
+        grams.update([padded[i:i + 3] for i in range(len(padded) - 2)])
+
+    return grams
+
+
+def _gram_key(gram: str) -> int:
+    """
+    Get the integer sort key of the given (ASCII) trigram.
+    """
+    return int.from_bytes(gram.encode("ascii"), "big")
+
+
+def edit_distance(source: str, target: str, limit: int) -> int:
+    """
+    Get the Levenshtein edit distance between the given strings,
+    or the given limit if the distance is at least the limit.
+    """
+    if abs(len(source) - len(target)) >= limit:
+        return limit
+
+    previous = list(range(len(target) + 1))
+
+    for i, source_char in enumerate(source, 1):
+        current = [i]
+
+        for j, target_char in enumerate(target, 1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (source_char != target_char)))
+
+        # Every remaining alignment already exceeds the limit
+        if min(current) >= limit:
+            return limit
+
+        previous = current
+
+    return min(previous[-1], limit)
+
+
+class TrigramIndex:
+    """
+    Trigram index over RFC specification titles that ranks titles by trigram
+    similarity, optionally re-ranking the best candidates by word edit distance.
+    Saved indexes are memory-mapped, and only the postings of query trigrams
+    and the titles of re-ranked candidates are decoded.
+    """
+    def __init__(self, path: str = str()) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path or TrigramIndex.default_path()  # Index file path
+        self.Updated: float = 0.0                             # Source index timestamp
+
+        self._Ids: array[int] = array("I")        # Title RFC numbers
+        self._Sizes: array[int] = array("H")      # Title trigram counts
+        self._Titles: list[str] = list[str]()     # Titles by title position
+        self._Postings: dict[str, array[int]] = dict[str, "array[int]"]()
+
+        # Memory-mapped index file, title data offsets and title data
+        self._File: BinaryIndex | None = None
+        self._TitleOffsets: memoryview = _EMPTY_TABLE
+        self._TitleData: memoryview = _EMPTY
+
+        # Memory-mapped sorted trigram keys, posting data offsets and delta encoded postings
+        self._Grams: memoryview = _EMPTY_TABLE
+        self._PostingOffsets: memoryview = _EMPTY_TABLE
+        self._PostingData: memoryview = _EMPTY
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed titles.
+        """
+        return len(self._Ids)
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Get the default trigram index file path.
+        """
+        return os.path.join(utils.data_dir(), "trigram.idx")
+
+    @staticmethod
+    def open(index: RfcIndex, path: str = str()) -> "TrigramIndex":
+        """
+        Load the trigram index of the given local RFC index from disk,
+        rebuilding and saving it if it is missing or out of date.
+        """
+        trigram_index = TrigramIndex(path)
+
+        # Unsupported and corrupt index files are rebuilt
+        if os.path.isfile(trigram_index.Path):
+            with contextlib.suppress(RuntimeError):
+                trigram_index.load()
+
+        if trigram_index.Updated != index.Updated or len(trigram_index) != len(index):
+            trigram_index.build((s.Id, s.Title) for s in index)
+            trigram_index.Updated = index.Updated
+
+            if len(trigram_index):
+                trigram_index.save()
+
+        return trigram_index
+
+    def build(self, titles: Iterable[tuple[int, str]]) -> int:
+        """
+        Build the index from the given RFC number and title pairs, replacing
+        all existing titles. Get the number of indexed titles.
+        """
+        self.close()
+        self._Ids = array("I")
+        self._Sizes = array("H")
+        self._Titles.clear()
+        self._Postings.clear()
+
+        for rfc_id, title in titles:
+            grams = trigrams(title)
+            pos = len(self._Ids)
+
+            for gram in grams:
+                if gram not in self._Postings:
+                    self._Postings[gram] = array("I")
+                self._Postings[gram].append(pos)
+
+            self._Ids.append(rfc_id)
+            self._Sizes.append(min(len(grams), 0xFFFF))
+            self._Titles.append(title)
+
+        return len(self._Ids)
+
+    def search(self,
+               query: str,
+               limit: int = DEFAULT_LIMIT,
+               rerank: bool = True,
+               allowed: Container[int] | None = None) -> list[tuple[int, float]]:
+        """
+        Get the RFC numbers and similarity scores (query trigram coverage) of the
+        titles that best match the given query (limited to the given allowed RFC
+        numbers, if any), re-ranking the best trigram candidates by the edit
+        distance between the query words and their closest title words.
+        """
+        query_grams = trigrams(query)
+        shared = Counter[int]()
+
+        for gram in query_grams:
+            shared.update(self._postings(gram))
+
+        scores = list[tuple[float, float, int]]()
+
+        # Short queries cover little of long titles, so Jaccard similarity only breaks ties
+        for pos, count in shared.items():
+            if allowed is not None and self._Ids[pos] not in allowed:
+                continue
+
+            coverage = count / len(query_grams)
+            jaccard = count / (len(query_grams) + self._Sizes[pos] - count)
+
+            if coverage >= MIN_SIMILARITY:
+                scores.append((coverage, jaccard, pos))
+
+        scores.sort(key=lambda s: (-s[0], -s[1], s[2]))
+        candidates = scores[:max(limit, _CANDIDATES) if rerank else limit]
+
+        if rerank:
+            query_words = words(query)
+            cache = dict[tuple[str, str], int]()
+            positions = [p for _, _, p in candidates]
+            distances = {p: self._word_distance(query_words, p, cache) for p in positions}
+            candidates.sort(key=lambda s: (distances[s[2]], -s[0], -s[1], s[2]))
+
+        return [(self._Ids[p], s) for s, _, p in candidates[:limit]]
+
+    def _word_distance(self,
+                       query_words: list[str],
+                       pos: int,
+                       cache: dict[tuple[str, str], int]) -> float:
+        """
+        Get the mean edit distance between each query word and its
+        closest word in the title at the given title position, relative
+        to the query word typo limit (half its length). Word distances
+        are memoized in the given cache.
+        """
+        title_words = set(words(self._title(pos)))
+
+        if not query_words or not title_words:
+            return 1.0
+
+        total = 0.0
+
+        for query_word in query_words:
+            limit = max(len(query_word) // 2, _MIN_TYPO_LIMIT)
+            distance = 0 if query_word in title_words else limit
+
+            for title_word in title_words:
+                if not distance:
+                    break
+
+                if (key := (query_word, title_word)) not in cache:
+                    cache[key] = edit_distance(query_word, title_word, limit)
+                distance = min(distance, cache[key])
+
+            total += distance / limit
+
+        return total / len(query_words)
+
+    def _postings(self, gram: str) -> "list[int] | array[int]":
+        """
+        Get the ascending title positions of the given trigram.
+        """
+        if self._File is None:
+            return self._Postings.get(gram, array("I"))
+
+        key = _gram_key(gram)
+        pos = bisect.bisect_left(self._Grams, key)
+
+        if pos == len(self._Grams) or self._Grams[pos] != key:
+            return list[int]()
+
+        start = self._PostingOffsets[pos]
+        return decode_deltas(self._PostingData[start:self._PostingOffsets[pos + 1]])
+
+    def _title(self, pos: int) -> str:
+        """
+        Get the title at the given title position.
+        """
+        if self._File is None:
+            return self._Titles[pos]
+
+        start = self._TitleOffsets[pos]
+        return str(self._TitleData[start:self._TitleOffsets[pos + 1]], "utf-8")
+
+    def close(self) -> void_t:
+        """
+        Close the memory-mapped index file, which also discards its titles.
+        """
+        if self._File is not None:
+            self._File.close()
+            self._File = None
+
+            self._Ids = array("I")
+            self._Sizes = array("H")
+            self._TitleOffsets = self._Grams = self._PostingOffsets = _EMPTY_TABLE
+            self._TitleData = self._PostingData = _EMPTY
+
+    def load(self) -> void_t:
+        """
+        Memory-map the underlying index file. Titles and postings are decoded on access.
+        """
+        self.close()
+        index_file = BinaryIndex.open(self.Path, _INDEX_KIND, _INDEX_VERSION)
+
+        try:
+            data = json.loads(str(index_file.section(0), "utf-8"))
+
+            # Title tables are small, so only titles and postings remain memory-mapped
+            self._Ids = array("I", index_file.table(1, "I"))
+            self._Sizes = array("H", index_file.table(2, "H"))
+            self._TitleOffsets = index_file.table(3, "I")
+            self._TitleData = index_file.section(4)
+            self._Grams = index_file.table(5, "I")
+            self._PostingOffsets = index_file.table(6, "I")
+            self._PostingData = index_file.section(7)
+        except RuntimeError:
+            index_file.close()
+            raise
+
+        self.Updated = data["updated"]
+        self._File = index_file
+
+    def save(self) -> void_t:
+        """
+        Atomically write the built index to the underlying index file.
+        """
+        # Memory-mapped indexes are unchanged since they were loaded
+        if self._File is not None:
+            return
+
+        title_offsets = array("I", [0])
+        title_data = bytearray()
+
+        for title in self._Titles:
+            title_data.extend(title.encode("utf-8"))
+            title_offsets.append(len(title_data))
+
+        grams = sorted(self._Postings, key=_gram_key)
+        posting_offsets = array("I", [0])
+        posting_data = bytearray()
+
+        for gram in grams:
+            posting_data.extend(encode_deltas(self._Postings[gram]))
+            posting_offsets.append(len(posting_data))
+
+        sections = [
+            json.dumps({"updated": self.Updated}).encode(),
+            self._Ids.tobytes(),
+            self._Sizes.tobytes(),
+            title_offsets.tobytes(),
+            bytes(title_data),
+            array("I", [_gram_key(g) for g in grams]).tobytes(),
+            posting_offsets.tobytes(),
+            bytes(posting_data)
+        ]
+
+        write_index(self.Path, _INDEX_KIND, _INDEX_VERSION, sections)
+
+
+# Module export symbols
+__all__ = [
+    "DEFAULT_LIMIT",
+    "MIN_SIMILARITY",
+    "TrigramIndex",
+    "edit_distance",
+    "trigrams",
+    "words"
+]
@@ -0,0 +1,211 @@
+"""
+Persistent on-disk HTTP response cache module.
+"""
+import json
+import os
+import time
+import utils
+from typing import TYPE_CHECKING
+from alias import void_t
+
+# HTTP response types are only imported when a response is created
+if TYPE_CHECKING:
+    from requests import Response
+
+# Default cached response time-to-live (in seconds)
+DEFAULT_TTL: int = 24 * 60 * 60
+
+# Default maximum total size (in bytes) of all cached response bodies
+DEFAULT_MAX_SIZE: int = 64 * 1024 * 1024
+
+# Eviction target size (fraction of the maximum size)
+_EVICT_RATIO: float = 0.9
+
+
+class CacheEntry:
+    """
+    Cached HTTP response metadata and body.
+    """
+    def __init__(self,
+                 url: str,
+                 body: bytes,
+                 etag: str = str(),
+                 last_modified: str = str(),
+                 encoding: str = str(),
+                 stored: float = 0.0) -> None:
+        """
+        Initialize the object.
+        """
+        self.Url: str = url                     # Response URL
+        self.Body: bytes = body                 # Response body
+        self.ETag: str = etag                   # 'ETag' validator header
+        self.LastModified: str = last_modified  # 'Last-Modified' validator header
+        self.Encoding: str = encoding           # Response text encoding
+        self.Stored: float = stored             # Stored or revalidated UNIX timestamp
+
+    def headers(self) -> dict[str, str]:
+        """
+        Get the conditional request headers used to revalidate the entry.
+        """
+        headers = dict[str, str]()
+
+        if self.ETag:
+            headers["If-None-Match"] = self.ETag
+
+        if self.LastModified:
+            headers["If-Modified-Since"] = self.LastModified
+
+        return headers
+
+    def response(self) -> "Response":
+        """
+        Create an HTTP response object from the entry.
+        """
+        from requests import Response
+        from requests.structures import CaseInsensitiveDict
+
+        response = Response()
+
+        response.url = self.Url
+        response.status_code = 200
+        response.encoding = self.Encoding or None
+        response.headers = CaseInsensitiveDict[str]({"Content-Length": str(len(self.Body))})
+        response._content = self.Body
+
+        # Content iteration must use the body rather than the raw stream
+        setattr(response, "_content_consumed", True)
+
+        return response
+
+
+class ResponseCache:
+    """
+    Persistent on-disk HTTP response cache with size-based LRU eviction.
+    """
+    def __init__(self,
+                 path: str = str(),
+                 ttl: int = DEFAULT_TTL,
+                 max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path or ResponseCache.default_path()  # Cache directory
+        self.TTL: int = ttl                                    # Entry TTL (seconds)
+        self.MaxSize: int = max_size                           # Maximum size (bytes)
+
+        self._Files: utils.LruDirectory = utils.LruDirectory(self.Path, ".body", (".json",))
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Get the default cache directory path.
+        """
+        return os.path.join(utils.data_dir(), "http-cache")
+
+    @staticmethod
+    def key(url: str, params: dict[str, str]) -> str:
+        """
+        Get the cache key of the given URL and query parameters.
+        """
+        import hashlib
+        canonical = json.dumps([url, params], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _paths(self, key: str) -> tuple[str, str]:
+        """
+        Get the metadata and body file paths of the given cache key.
+        """
+        base_path = os.path.join(self.Path, key)
+        return f"{base_path}.json", f"{base_path}.body"
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """
+        Determine whether the given entry can be used without revalidation.
+        """
+        return time.time() - entry.Stored <= self.TTL
+
+    def get(self, url: str, params: dict[str, str]) -> CacheEntry | void_t:
+        """
+        Get the cached response entry of the given URL and query parameters.
+        """
+        meta_path, body_path = self._paths(ResponseCache.key(url, params))
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file:
+                meta = json.load(file)
+
+            with open(body_path, "rb") as file:
+                body = file.read()
+
+        except (OSError, ValueError):
+            return None
+
+        self._Files.touch(body_path)
+
+        return CacheEntry(meta["url"],
+                          body,
+                          meta["etag"],
+                          meta["last_modified"],
+                          meta["encoding"],
+                          meta["stored"])
+
+    def put(self,
+            url: str,
+            params: dict[str, str],
+            response: "Response",
+            body: bytes | None = None) -> CacheEntry:
+        """
+        Add the given response (with the given body if it was streamed) to the cache
+        and evict the least recently used entries if the maximum size is exceeded.
+        """
+        entry = CacheEntry(response.url or url,
+                           body if body is not None else response.content,
+                           response.headers.get("ETag", str()),
+                           response.headers.get("Last-Modified", str()),
+                           response.encoding or str(),
+                           time.time())
+
+        self._write(ResponseCache.key(url, params), entry)
+        self._Files.trim(self.MaxSize, _EVICT_RATIO)
+
+        return entry
+
+    def refresh(self, url: str, params: dict[str, str], entry: CacheEntry) -> CacheEntry:
+        """
+        Mark the given entry as revalidated by the server.
+        """
+        entry.Stored = time.time()
+        self._write(ResponseCache.key(url, params), entry, write_body=False)
+
+        return entry
+
+    def _write(self, key: str, entry: CacheEntry, write_body: bool = True) -> void_t:
+        """
+        Atomically write the given entry's metadata and body files.
+        """
+        meta_path, body_path = self._paths(key)
+
+        meta = {
+            "url": entry.Url,
+            "etag": entry.ETag,
+            "last_modified": entry.LastModified,
+            "encoding": entry.Encoding,
+            "stored": entry.Stored
+        }
+
+        if write_body:
+            self._Files.write(body_path, entry.Body)
+
+        self._Files.write(meta_path, json.dumps(meta).encode())
+
+    def evict(self, target_size: int = -1) -> int:
+        """
+        Remove the least recently used entries until the total cache size does not
+        exceed the given target size (or the maximum size). Get the number of removed
+        entries.
+        """
+        return self._Files.evict(self.MaxSize if target_size < 0 else target_size)
+
+
+# Module export symbols
+__all__ = ["CacheEntry", "DEFAULT_MAX_SIZE", "DEFAULT_TTL", "ResponseCache"]
@@ -0,0 +1,154 @@
+"""
+Parallel RFC specification corpus indexing pipeline module.
+"""
+import os
+import console
+from alias import section_t, void_t
+from fulltext import FullTextIndex
+from rfc_graph import RfcGraph
+from rfc_index import RfcIndex
+from text_store import TextStore
+
+_SHARDS_PER_WORKER: int = 4  # Corpus shards per worker process (for load balancing)
+
+
+def read_text(path: str) -> str:
+    """
+    Read the given RFC specification text file, replacing invalid UTF-8 sequences.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as file:
+        return file.read()
+
+
+class IndexShard:
+    """
+    Partial full-text index, section ranges and references of a contiguous range
+    of RFC specification text files, built by a single worker process.
+    """
+    def __init__(self, paths: list[tuple[int, str]]) -> None:
+        """
+        Initialize the object.
+        """
+        self.Paths: list[tuple[int, str]] = paths       # RFC number and file path pairs
+        self.FullText: FullTextIndex = FullTextIndex()  # Partial full-text index
+
+        # Section tuples and referenced RFC numbers of each RFC number
+        self.Sections: dict[int, list[section_t]] = dict[int, list[section_t]]()
+        self.References: dict[int, set[int]] = dict[int, set[int]]()
+
+    def build(self) -> "IndexShard":
+        """
+        Tokenize and parse the text files of the shard into its partial indexes.
+        """
+        for rfc_id, path in self.Paths:
+            text = read_text(path)
+            data = text.encode("utf-8")
+
+            self.FullText.add(rfc_id, text)
+            self.Sections[rfc_id] = TextStore.find_sections(data)
+            self.References[rfc_id] = RfcGraph.parse_references(data) - {rfc_id}
+
+        return self
+
+
+def _build_shard(shard: IndexShard) -> IndexShard:
+    """
+    Build the partial indexes of the given shard in a worker process.
+    """
+    return shard.build()
+
+
+class IndexPipeline:
+    """
+    Corpus indexing pipeline that shards the RFC specification text files across
+    worker processes, builds per-shard partial indexes in parallel, and merges them
+    into the full-text index, packed text store and relationship graph.
+    """
+    def __init__(self, index: RfcIndex, workers: int = 0) -> None:
+        """
+        Initialize the object.
+        """
+        self.Index: RfcIndex = index                        # Local specification index
+        self.Workers: int = workers or os.cpu_count() or 1  # Worker process count
+        self.FullText: FullTextIndex = FullTextIndex()      # Merged full-text index
+        self.Store: TextStore = TextStore()                 # Packed text store
+        self.Graph: RfcGraph = RfcGraph()                   # Relationship graph
+
+    def shards(self, paths: list[tuple[int, str]]) -> list[IndexShard]:
+        """
+        Split the given RFC number and text file path pairs into contiguous
+        shards in ascending RFC number order.
+        """
+        paths = sorted(paths)
+        count = min(len(paths), self.Workers * _SHARDS_PER_WORKER)
+
+        if not count:
+            return list[IndexShard]()
+
+        size = -(-len(paths) // count)
+        return [IndexShard(paths[i:i + size]) for i in range(0, len(paths), size)]
+
+    def run(self, paths: list[tuple[int, str]]) -> int:
+        """
+        Build and save the full-text index, packed text store and relationship
+        graph from the given RFC number and text file path pairs. Get the number
+        of indexed specifications.
+        """
+        shards = self._map(self.shards(paths))
+
+        # Partial indexes are merged in ascending RFC number order
+        self.FullText = FullTextIndex(self.FullText.Path)
+
+        for shard in shards:
+            self.FullText.merge(shard.FullText)
+
+        self.FullText.save()
+
+        documents = [(i, p, s.Sections[i]) for s in shards for i, p in s.Paths]
+        self.Store.pack((i, read_text(p).encode("utf-8"), t) for i, p, t in documents)
+
+        references = [(i, r) for s in shards for i, r in s.References.items()]
+        self.Graph.build(self.Index, references)
+        self.Graph.Updated = self.Index.Updated
+        self.Graph.save()
+
+        return len(self.FullText)
+
+    def close(self) -> void_t:
+        """
+        Close the packed text store.
+        """
+        self.Store.close()
+
+    def _map(self, shards: list[IndexShard]) -> list[IndexShard]:
+        """
+        Build the partial indexes of the given shards, in worker processes if
+        there is more than one worker. Get the built shards in input order.
+        """
+        if self.Workers < 2 or len(shards) < 2:
+            total = len(shards)
+            return [self._progress(s.build(), n, total) for n, s in enumerate(shards, 1)]
+
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=min(self.Workers, len(shards))) as executor:
+            futures = {executor.submit(_build_shard, s): n for n, s in enumerate(shards)}
+            built = list[IndexShard | None]([None] * len(shards))
+
+            for done, future in enumerate(as_completed(futures), 1):
+                built[futures[future]] = self._progress(future.result(), done, len(shards))
+
+        return [s for s in built if s is not None]
+
+    @staticmethod
+    def _progress(shard: IndexShard, done: int, total: int) -> IndexShard:
+        """
+        Report the progress of the given built shard.
+        """
+        console.write_ln(f"Indexed shard {done}/{total} "
+                         f"({len(shard.Paths)} RFC specifications)")
+        return shard
+
+
+# Module export symbols
+__all__ = ["IndexPipeline", "IndexShard", "read_text"]
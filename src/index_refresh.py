@@ -0,0 +1,185 @@
+"""
+Incremental local RFC index refresh module.
+"""
+import json
+import os
+import re
+import utils
+from datetime import datetime
+from alias import void_t
+from crawler import Crawler
+from query_params import FIRST_YEAR, QueryParams
+from rfc_graph import Relation, RfcGraph
+from rfc_index import RfcIndex
+from spec_metadata import SpecMetadata
+
+# Relationship types mapped to the inverse relationships they add to their targets
+_LINKS: dict[Relation, Relation] = {
+    Relation.OBSOLETES: Relation.OBSOLETED_BY,
+    Relation.UPDATES: Relation.UPDATED_BY
+}
+
+_YEAR_RE: re.Pattern[str] = re.compile(r"\b(\d{4})\b")  # Publication date year pattern
+
+
+class RefreshStats:
+    """
+    Incremental index refresh statistics.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the object.
+        """
+        self.Checked: int = 0  # New or updated source entries checked
+        self.Added: int = 0    # Specifications added to the index
+        self.Changed: int = 0  # Indexed specifications that changed
+        self.Linked: int = 0   # Indexed specifications newly obsoleted or updated
+
+    def __repr__(self) -> str:
+        """
+        Get the string representation of the object.
+        """
+        return f"{self.__class__.__name__}({json.dumps(vars(self))})"
+
+
+class IndexRefresh:
+    """
+    Incremental refresh of a local RFC index, which fetches only the specifications
+    published since its high-water mark (or re-reads its bulk index file only if it
+    was modified) and applies the new and changed entries as a single delta.
+    """
+    def __init__(self, index: RfcIndex, crawler: Crawler) -> None:
+        """
+        Initialize the object.
+        """
+        self.Index: RfcIndex = index               # Local specification index
+        self.Crawler: Crawler = crawler            # Delta search HTTP crawler
+        self.Stats: RefreshStats = RefreshStats()  # Last refresh statistics
+
+    def run(self) -> RefreshStats:
+        """
+        Fetch the new and changed specifications and apply them to the index.
+        Get the refresh statistics.
+        """
+        self.Stats = RefreshStats()
+        source = self.Index.Source
+        modified = self.Index.Modified
+
+        if source and not utils.valid_url(source) and os.path.isfile(source):
+            entries = self._file_entries(source)
+        else:
+            entries = self._search_entries()
+
+        self.Stats.Checked = len(entries)
+        delta = self._delta(entries)
+
+        if delta:
+            self.Index.apply(delta.values())
+
+        # Unchanged bulk index files are only re-read once
+        elif self.Index.Modified != modified:
+            self.Index.save()
+
+        return self.Stats
+
+    def from_year(self) -> int:
+        """
+        Get the publication year of the index's high-water mark specification.
+        """
+        match = _YEAR_RE.search(self.Index.LatestDate)
+        return int(match.group(1)) if match is not None else FIRST_YEAR
+
+    def _file_entries(self, source: str) -> list[SpecMetadata]:
+        """
+        Get every entry of the given bulk index file if it was modified since
+        the index was built, otherwise no entries.
+        """
+        modified = os.path.getmtime(source)
+
+        if modified <= self.Index.Modified:
+            return list[SpecMetadata]()
+
+        # Entries are parsed into a scratch index that is never saved
+        scratch = RfcIndex(f"{self.Index.Path}.refresh")
+        scratch.build(source)
+
+        self.Index.Modified = modified
+        return list(scratch)
+
+    def _search_entries(self) -> list[SpecMetadata]:
+        """
+        Search for the specifications published in or after
+        the publication year of the high-water mark specification.
+        """
+        params = QueryParams(self.from_year(), datetime.now().year)
+        entries = list[SpecMetadata]()
+
+        for spec in self.Crawler.derive(params).iter_search(utils.search_url()):
+            spec.Status = spec.Status.upper()
+            entries.append(spec)
+
+        return entries
+
+    @staticmethod
+    def _fields(spec: SpecMetadata) -> tuple[str, ...]:
+        """
+        Get the normalized fields that determine whether the given specification changed.
+        """
+        fields = [spec.Title, spec.Authors, spec.Date, spec.MoreInfo, spec.Status]
+        return tuple([" ".join(f.casefold().split()) for f in fields])
+
+    def _delta(self, entries: list[SpecMetadata]) -> dict[int, SpecMetadata]:
+        """
+        Get the new and changed entries, including the indexed specifications
+        that the entries newly obsolete or update, by RFC number.
+        """
+        delta = dict[int, SpecMetadata]()
+
+        for spec in entries:
+            indexed = self.Index.lookup(spec.Id)
+
+            if indexed is None:
+                self.Stats.Added += 1
+
+            elif IndexRefresh._fields(indexed) != IndexRefresh._fields(spec):
+                self.Stats.Changed += 1
+            else:
+                continue
+
+            delta[spec.Id] = spec
+
+        for spec in list(delta.values()):
+            for relation, rfc_id in RfcGraph.parse_more_info(spec.MoreInfo):
+                if relation in _LINKS:
+                    self._link(delta, rfc_id, _LINKS[relation], spec.Id)
+
+        return delta
+
+    def _link(self,
+              delta: dict[int, SpecMetadata],
+              rfc_id: int,
+              relation: Relation,
+              related_id: int) -> void_t:
+        """
+        Add the given inverse relationship to the 'More Info' text of the
+        given specification, if it is indexed and does not already have it.
+        """
+        target = delta.get(rfc_id) or self.Index.lookup(rfc_id)
+
+        if target is None:
+            return
+
+        relations = RfcGraph.parse_more_info(target.MoreInfo)
+
+        if (relation, related_id) in relations:
+            return
+
+        target.MoreInfo = RfcGraph.format_more_info([*relations, (relation, related_id)])
+
+        if rfc_id not in delta:
+            self.Stats.Linked += 1
+            delta[rfc_id] = target
+
+
+# Module export symbols
+__all__ = ["IndexRefresh", "RefreshStats"]
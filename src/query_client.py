@@ -0,0 +1,163 @@
+"""
+RFC specification query server client module.
+"""
+import json
+import re
+import socket
+import utils
+from types import TracebackType
+from typing import BinaryIO
+from alias import any_t, void_t
+from spec_metadata import SpecMetadata
+
+# Default server response timeout (in seconds)
+DEFAULT_TIMEOUT: float = 120.0
+
+# TCP server address pattern (e.g., '127.0.0.1:8790', '[::1]:8790', 'localhost:8790')
+_TCP_ADDRESS_RE: re.Pattern[str] = re.compile(r"([\w.-]+|\[[0-9a-fA-F:]+\]):(\d{1,5})")
+
+
+def parse_address(address: str) -> str | tuple[str, int]:
+    """
+    Get the TCP host and port of the given server address,
+    or the Unix domain socket path if it is not a TCP address.
+    """
+    match = _TCP_ADDRESS_RE.fullmatch(address)
+
+    if match is None:
+        return address
+
+    return match.group(1).strip("[]"), int(match.group(2))
+
+
+class QueryClient:
+    """
+    Query server client that sends newline-delimited JSON requests
+    over a single persistent connection.
+    """
+    def __init__(self, address: str = str(), timeout: float = DEFAULT_TIMEOUT) -> None:
+        """
+        Initialize the object.
+        """
+        self.Address: str = address or utils.server_address()  # Server address
+        self.Timeout: float = timeout                          # Response timeout
+
+        self._Socket: socket.socket | None = None
+        self._Reader: BinaryIO | None = None
+
+    def __enter__(self) -> "QueryClient":
+        """
+        Enter the runtime context of the object and connect to the server.
+        """
+        self.connect()
+        return self
+
+    def __exit__(self,
+                 exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> void_t:
+        """
+        Exit the runtime context of the object and close the connection.
+        """
+        self.close()
+
+    def connect(self) -> void_t:
+        """
+        Connect to the server, if the client is not already connected.
+        """
+        if self._Socket is not None:
+            return
+
+        address = parse_address(self.Address)
+
+        if isinstance(address, str):
+            self._Socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._Socket.settimeout(self.Timeout)
+            self._Socket.connect(address)
+        else:
+            self._Socket = socket.create_connection(address, self.Timeout)
+            self._Socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._Reader = self._Socket.makefile("rb")
+
+    def close(self) -> void_t:
+        """
+        Close the connection to the server.
+        """
+        if self._Reader is not None:
+            self._Reader.close()
+            self._Reader = None
+
+        if self._Socket is not None:
+            self._Socket.close()
+            self._Socket = None
+
+    def request(self, op: str, **params: any_t) -> dict[str, any_t]:
+        """
+        Send a request for the given server operation and get its response.
+        """
+        self.connect()
+
+        if self._Socket is None or self._Reader is None:
+            raise RuntimeError(f"Not connected to query server '{self.Address}'")
+
+        request = json.dumps(dict(params, op=op), separators=(",", ":"))
+        self._Socket.sendall(f"{request}\n".encode("utf-8"))
+
+        line = self._Reader.readline()
+
+        if not line:
+            raise ConnectionError(f"Query server '{self.Address}' closed the connection")
+
+        response: dict[str, any_t] = json.loads(line)
+
+        if "error" in response:
+            raise RuntimeError(response["error"])
+
+        return response
+
+    def ping(self) -> dict[str, any_t]:
+        """
+        Get the server status.
+        """
+        return self.request("ping")
+
+    def lookup(self, rfc_ids: list[int]) -> list[tuple[int, SpecMetadata | void_t]]:
+        """
+        Find the specifications matching the given RFC numbers, getting each
+        distinct RFC number and its specification (if found) in input order.
+        """
+        response = self.request("lookup", ids=rfc_ids)
+        return [(i, QueryClient._spec(s)) for i, s in response["results"]]
+
+    def search(self,
+               keyword: str,
+               fuzzy: bool = False,
+               limit: int = 0) -> tuple[list[SpecMetadata], bool]:
+        """
+        Find at most the given number of specifications (0 for unlimited) matching
+        the given keyword, falling back to a fuzzy title search if there are no exact
+        matches. Get the matching specifications and whether they were ranked by the
+        fuzzy title search.
+        """
+        response = self.request("search", keyword=keyword, fuzzy=fuzzy, limit=limit)
+        return [SpecMetadata.from_dict(s) for s in response["results"]], response["fuzzy"]
+
+    def fulltext(self, query: str, limit: int = 0) -> list[SpecMetadata]:
+        """
+        Find at most the given number of ranked specifications (0 for the
+        default limit) matching the given full-text query.
+        """
+        response = self.request("fulltext", query=query, limit=limit)
+        return [SpecMetadata.from_dict(s) for s in response["results"]]
+
+    @staticmethod
+    def _spec(data: dict[str, any_t] | None) -> SpecMetadata | void_t:
+        """
+        Create specification metadata from the given response result, if there is one.
+        """
+        return SpecMetadata.from_dict(data) if data is not None else None
+
+
+# Module export symbols
+__all__ = ["DEFAULT_TIMEOUT", "QueryClient", "parse_address"]
@@ -2,9 +2,12 @@
 HTTP RFC specification lookup query parameters module.
 """
 from datetime import datetime
-from alias import void_t
+from alias import any_t, query_key_t, void_t
 from utils import RfcFieldName
 
+# Earliest RFC publication year
+FIRST_YEAR: int = 1968
+
 
 class QueryParams:
     """
@@ -16,6 +19,7 @@ class QueryParams:
                  rfc_id: int = 0,
                  title: str = "",
                  page: int = 0,
+                 page_num: int = 1,
                  sort_by: RfcFieldName = RfcFieldName.ID,
                  sort_dir: str = "ASC") -> None:
         """
@@ -26,28 +30,57 @@ class QueryParams:
         self.FromYear: int = from_yr   # Specification published after year
         self.ToYear: int = to_yr       # Specification published to year
         self.Page: int = page          # Number of result pages to include
+        self.PageNum: int = page_num   # Result page number (when paginated)
         self.Sort: str = str(sort_by)  # Field by which to sort results
         self.SortDir: str = sort_dir   # Results sorting direction ('ASC', 'DESC')
 
-        if self.FromYear < 1968:
-            self.FromYear = 1968
+        if self.FromYear < FIRST_YEAR:
+            self.FromYear = FIRST_YEAR
 
         if self.ToYear > datetime.now().year:
             self.ToYear = datetime.now().year
 
         self.validate()
 
+    def __eq__(self, other: any_t) -> bool:
+        """
+        Determine whether the object and the given object describe the same query.
+        """
+        if not isinstance(other, QueryParams):
+            return NotImplemented
+
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        """
+        Get the hash value of the object's canonical query key.
+        """
+        return hash(self.key())
+
     def __repr__(self) -> str:
         """
         Get the string representation of the object.
         """
-        return str(self.__dir__)
+        return f"{self.__class__.__name__}{self.key()!r}"
+
+    def key(self) -> query_key_t:
+        """
+        Get the canonical key of the query, which identifies its complete result
+        set regardless of pagination, title case and whitespace, sort spelling or
+        year bounds outside the range of published specifications.
+        """
+        return (self.Id,
+                " ".join(self.Title.casefold().split()),
+                max(self.FromYear, FIRST_YEAR),
+                min(self.ToYear, datetime.now().year),
+                str(self.Sort).casefold(),
+                self.SortDir.upper())
 
     def dict(self) -> dict[str, str]:
         """
         Get a dictionary of the object to use in RFC lookups.
         """
-        return {
+        params = {
             "rfc": str(self.Id) if self.Id else str(),
             "title": self.Title,
             "from_year": str(self.FromYear),
@@ -61,12 +94,24 @@ class QueryParams:
             "to_month": "December"
         }
 
+        if self.Page and self.PageNum > 1:
+            params["pageno"] = str(self.PageNum)
+
+        return params
+
+    def is_bounded(self) -> bool:
+        """
+        Determine whether the query's publication year range excludes
+        any year of the range of published specifications.
+        """
+        return self.FromYear > FIRST_YEAR or self.ToYear < datetime.now().year
+
     def validate(self) -> void_t:
         """
         Validate the underlying query parameters.
         """
-        if not self.Id and not self.Title:
-            error_msg = f"RFC specification number or title must be specified"
+        if not self.Id and not self.Title and not self.is_bounded():
+            error_msg = f"RFC specification number, title or year range must be specified"
             raise RuntimeError(error_msg)
 
         if self.Sort not in [n for n in RfcFieldName]:
@@ -78,4 +123,4 @@ class QueryParams:
 
 
 # Module export symbols
-__all__ = ["QueryParams"]
+__all__ = ["FIRST_YEAR", "QueryParams"]
@@ -0,0 +1,257 @@
+"""
+Long-running RFC specification query server module.
+"""
+import asyncio
+import contextlib
+import json
+import os
+import signal
+import stat
+import time
+import utils
+from datetime import datetime
+from threading import Lock
+from typing import TYPE_CHECKING
+from alias import any_t, func_t, void_t
+from crawler import Crawler
+from http_cache import ResponseCache
+from query_client import parse_address
+from query_params import FIRST_YEAR, QueryParams
+from result_cache import ResultCache
+from rfc_index import RfcIndex
+from spec_metadata import SpecMetadata
+
+# Local search indexes are only loaded by the first request that uses them
+if TYPE_CHECKING:
+    from fulltext import FullTextIndex
+    from fuzzy import TrigramIndex
+
+_MAX_REQUEST_SIZE: int = 1024 * 1024  # Maximum request line size (in bytes)
+_PAGE_SIZE: int = 100                 # Keyword search result page size
+
+# Compact JSON response encoder
+_ENCODER: json.JSONEncoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+class QueryServer:
+    """
+    Long-running query server that keeps the local indexes, caches and pooled HTTP
+    connections warm, answering newline-delimited JSON requests from concurrent
+    clients over a Unix domain socket or a localhost TCP socket.
+    """
+    def __init__(self, address: str = str(), offline: bool = False) -> None:
+        """
+        Initialize the object.
+        """
+        self.Address: str = address or utils.server_address()  # Server address
+        self.Offline: bool = offline                           # Only local results
+        self.Requests: int = 0                                 # Answered requests
+        self.Started: float = time.time()                      # Start timestamp
+
+        self.Index: RfcIndex = RfcIndex.open()  # Local specification index
+
+        self.Crawler: Crawler = Crawler(index=self.Index,
+                                        cache=ResponseCache(),
+                                        offline=offline,
+                                        results=ResultCache())
+
+        self._FullText: FullTextIndex | None = None
+        self._Trigrams: TrigramIndex | None = None
+        self._Lock: Lock = Lock()
+
+        self._Handlers: dict[str, func_t] = {
+            "fulltext": self._fulltext,
+            "lookup": self._lookup,
+            "ping": self._ping,
+            "search": self._search
+        }
+
+    def serve_forever(self) -> void_t:
+        """
+        Accept and answer client requests until the server is interrupted or terminated.
+        """
+        try:
+            asyncio.run(self._serve())
+        finally:
+            self.Crawler.close()
+
+    async def _serve(self) -> void_t:
+        """
+        Listen on the server address and answer client requests.
+        """
+        address = parse_address(self.Address)
+
+        if isinstance(address, str):
+            QueryServer._remove_socket(address)
+            os.makedirs(os.path.dirname(os.path.abspath(address)), exist_ok=True)
+
+            server = await asyncio.start_unix_server(self._handle,
+                                                     address,
+                                                     limit=_MAX_REQUEST_SIZE)
+        else:
+            server = await asyncio.start_server(self._handle,
+                                                *address,
+                                                limit=_MAX_REQUEST_SIZE)
+
+        stopped = asyncio.Event()
+
+        # Termination signal handlers are not supported on Windows
+        with contextlib.suppress(NotImplementedError):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopped.set)
+
+        try:
+            async with server:
+                await stopped.wait()
+        finally:
+            if isinstance(address, str):
+                QueryServer._remove_socket(address)
+
+    @staticmethod
+    def _remove_socket(path: str) -> void_t:
+        """
+        Remove the given Unix domain socket file left behind by a previous server.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise FileExistsError(f"Server address is not a socket: {path}")
+
+            os.remove(path)
+
+    async def _handle(self,
+                      reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> void_t:
+        """
+        Answer each request line sent on the given client connection in order.
+        """
+        try:
+            while line := await reader.readline():
+                response = await self._respond(line)
+
+                writer.write(f"{_ENCODER.encode(response)}\n".encode("utf-8"))
+                await writer.drain()
+
+        # Clients may disconnect or send oversized requests at any time
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, line: bytes) -> dict[str, any_t]:
+        """
+        Get the response to the given request line. Requests are answered on worker
+        threads, so that network lookups do not block other clients.
+        """
+        response: dict[str, any_t]
+
+        try:
+            request = json.loads(line)
+            handler = None
+
+            if isinstance(request, dict):
+                handler = self._Handlers.get(str(request.get("op")))
+
+            if handler is None:
+                raise ValueError(f"Invalid request operation: {request!r}")
+
+            response = await asyncio.to_thread(handler, request)
+
+        except Exception as exc:
+            response = {"error": f"{exc.__class__.__name__}: {exc}"}
+
+        self.Requests += 1
+        return response
+
+    def _ping(self, request: dict[str, any_t]) -> dict[str, any_t]:
+        """
+        Get the server status.
+        """
+        return {
+            "indexed": len(self.Index),
+            "requests": self.Requests,
+            "uptime": time.time() - self.Started
+        }
+
+    def _lookup(self, request: dict[str, any_t]) -> dict[str, any_t]:
+        """
+        Find the specifications matching the requested RFC numbers.
+        """
+        rfc_ids = [int(i) for i in request["ids"]]
+        results = self.Crawler.batch_search(utils.search_url(), rfc_ids)
+
+        return {"results": [[i, s.dict() if s else None] for i, s in results]}
+
+    def _search(self, request: dict[str, any_t]) -> dict[str, any_t]:
+        """
+        Find the specifications matching the requested keyword, falling
+        back to a fuzzy title search if there are no exact matches.
+        """
+        keyword = str(request["keyword"])
+        limit = int(request.get("limit") or 0)
+        results = list[SpecMetadata]()
+
+        if not request.get("fuzzy"):
+            params = QueryParams(FIRST_YEAR,
+                                 datetime.now().year,
+                                 title=keyword,
+                                 page=_PAGE_SIZE)
+
+            crawler = self.Crawler.derive(params)
+
+            with crawler.search(utils.search_url(), limit) as search_results:
+                results = list(search_results)
+
+        if results:
+            return {"results": [s.dict() for s in results], "fuzzy": False}
+
+        from fuzzy import DEFAULT_LIMIT
+        matches = self._trigrams().search(keyword, limit or DEFAULT_LIMIT)
+        return {"results": [self._spec(i).dict() for i, _ in matches], "fuzzy": True}
+
+    def _fulltext(self, request: dict[str, any_t]) -> dict[str, any_t]:
+        """
+        Find the ranked specifications matching the requested full-text query.
+        """
+        fulltext = self._fulltext_index()
+
+        if not len(fulltext):
+            raise RuntimeError("Build the full-text index first using -t/--index-text")
+
+        query = str(request["query"])
+        limit = int(request.get("limit") or 0)
+        ranked = fulltext.search(query, limit) if limit else fulltext.search(query)
+        return {"results": [self._spec(i).dict() for i, _ in ranked]}
+
+    def _spec(self, rfc_id: int) -> SpecMetadata:
+        """
+        Get the locally indexed specification of the given RFC number.
+        """
+        return self.Index.lookup(rfc_id) or SpecMetadata(rfc_id=rfc_id)
+
+    def _fulltext_index(self) -> "FullTextIndex":
+        """
+        Get the local full-text index, loading it when it is first used.
+        """
+        with self._Lock:
+            if self._FullText is None:
+                from fulltext import FullTextIndex
+                self._FullText = FullTextIndex.open()
+
+            return self._FullText
+
+    def _trigrams(self) -> "TrigramIndex":
+        """
+        Get the local title trigram index, loading it when it is first used.
+        """
+        with self._Lock:
+            if self._Trigrams is None:
+                from fuzzy import TrigramIndex
+                self._Trigrams = TrigramIndex.open(self.Index)
+
+            return self._Trigrams
+
+
+# Module export symbols
+__all__ = ["QueryServer"]
@@ -0,0 +1,181 @@
+"""
+Parsed search result cache module.
+"""
+import json
+import os
+import time
+import utils
+from collections import OrderedDict
+from threading import Lock
+from typing import TypeAlias
+from alias import query_key_t, void_t
+from spec_metadata import SpecMetadata
+
+# Default cached result time-to-live (in seconds)
+DEFAULT_TTL: int = 24 * 60 * 60
+
+# Default maximum number of in-process cached result sets
+DEFAULT_MAX_ENTRIES: int = 256
+
+# Default maximum total size (in bytes) of all on-disk cached result sets
+DEFAULT_MAX_SIZE: int = 32 * 1024 * 1024
+
+_CACHE_VERSION: int = 1    # Result file format version
+_EVICT_RATIO: float = 0.9  # Eviction target size (fraction of the maximum size)
+
+# Cached result set type alias (stored timestamp, results)
+_entry_t: TypeAlias = tuple[float, list[SpecMetadata]]
+
+
+class ResultCache:
+    """
+    Parsed search result cache keyed by canonical query keys. Result sets are kept
+    in an in-process LRU cache, backed by an optional on-disk cache with size-based
+    LRU eviction, so that repeated searches skip both the network and parsing.
+    """
+    def __init__(self,
+                 path: str = str(),
+                 ttl: int = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_size: int = DEFAULT_MAX_SIZE,
+                 persist: bool = True) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path or ResultCache.default_path()  # Cache directory
+        self.TTL: int = ttl                                  # Entry TTL (seconds)
+        self.MaxEntries: int = max_entries                   # Maximum in-process entries
+        self.MaxSize: int = max_size                         # Maximum disk size (bytes)
+        self.Persist: bool = persist                         # Use the on-disk cache
+
+        self._Entries: OrderedDict[query_key_t, _entry_t] = OrderedDict()
+        self._Lock: Lock = Lock()
+        self._Files: utils.LruDirectory = utils.LruDirectory(self.Path, ".json")
+
+        if self.MaxEntries < 1:
+            raise ValueError(f"Invalid maximum entry count: {self.MaxEntries}")
+
+    def __len__(self) -> int:
+        """
+        Get the number of in-process cached result sets.
+        """
+        return len(self._Entries)
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Get the default cache directory path.
+        """
+        return os.path.join(utils.data_dir(), "result-cache")
+
+    def _path(self, key: query_key_t) -> str:
+        """
+        Get the on-disk result file path of the given query key.
+        """
+        import hashlib
+        canonical = json.dumps(key, separators=(",", ":"))
+        digest = hashlib.sha256(canonical.encode()).hexdigest()
+
+        return os.path.join(self.Path, f"{digest}.json")
+
+    def _is_fresh(self, stored: float) -> bool:
+        """
+        Determine whether a result set stored at the given timestamp has not expired.
+        """
+        return time.time() - stored <= self.TTL
+
+    def get(self, key: query_key_t, stale: bool = False) -> list[SpecMetadata] | void_t:
+        """
+        Get the cached results of the given query key, including expired
+        results if stale results are allowed (e.g., in offline mode).
+        """
+        with self._Lock:
+            entry = self._Entries.get(key)
+
+            if entry is not None:
+                self._Entries.move_to_end(key)
+
+        if entry is None and self.Persist:
+            entry = self._read(key)
+
+            if entry is not None:
+                self._remember(key, *entry)
+
+        if entry is None or not (stale or self._is_fresh(entry[0])):
+            return None
+
+        return list(entry[1])
+
+    def put(self, key: query_key_t, results: list[SpecMetadata]) -> void_t:
+        """
+        Add the given results of the given query key to the cache, evicting the
+        least recently used result sets if the maximum entries or size are exceeded.
+        """
+        stored = time.time()
+        self._remember(key, stored, list(results))
+
+        if self.Persist:
+            self._write(key, stored, results)
+            self._Files.trim(self.MaxSize, _EVICT_RATIO)
+
+    def _remember(self,
+                  key: query_key_t,
+                  stored: float,
+                  results: list[SpecMetadata]) -> void_t:
+        """
+        Add the given result set to the in-process LRU cache.
+        """
+        with self._Lock:
+            self._Entries[key] = (stored, results)
+            self._Entries.move_to_end(key)
+
+            while len(self._Entries) > self.MaxEntries:
+                self._Entries.popitem(last=False)
+
+    def _read(self, key: query_key_t) -> _entry_t | void_t:
+        """
+        Read the on-disk result set of the given query key.
+        """
+        path = self._path(key)
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+
+        except (OSError, ValueError):
+            return None
+
+        # Key hash collisions and older file formats are treated as misses
+        if data.get("version") != _CACHE_VERSION or tuple(data.get("key", ())) != key:
+            return None
+
+        self._Files.touch(path)
+        return data["stored"], [SpecMetadata.from_dict(d) for d in data["results"]]
+
+    def _write(self,
+               key: query_key_t,
+               stored: float,
+               results: list[SpecMetadata]) -> void_t:
+        """
+        Atomically write the on-disk result set of the given query key.
+        """
+        data = {
+            "version": _CACHE_VERSION,
+            "key": key,
+            "stored": stored,
+            "results": [s.dict() for s in results]
+        }
+
+        self._Files.write(self._path(key), json.dumps(data, separators=(",", ":")).encode())
+
+    def evict(self, target_size: int = -1) -> int:
+        """
+        Remove the least recently used on-disk result sets until their total size
+        does not exceed the given target size (or the maximum size). Get the number
+        of removed result sets.
+        """
+        return self._Files.evict(self.MaxSize if target_size < 0 else target_size)
+
+
+# Module export symbols
+__all__ = ["DEFAULT_MAX_ENTRIES", "DEFAULT_MAX_SIZE", "DEFAULT_TTL", "ResultCache"]
@@ -0,0 +1,173 @@
+"""
+RFC search results HTML parser module.
+"""
+import codecs
+import re
+import timings
+from html.parser import HTMLParser
+from typing import Iterable, Iterator
+from urllib.parse import urljoin
+from alias import void_t
+from spec_metadata import SpecMetadata
+from utils import RfcFieldPos
+
+# Search results banner total result count pattern (e.g., '1 to 25 of 410 results'),
+# which excludes other result counts on the page (e.g., '25 results per page')
+_TOTAL_RE: re.Pattern[str] = re.compile(
+    r"\bof\s+(\d[\d,]*)\s+(?:results?|records|matches)\b",
+    re.I
+)
+
+
+class ResultParser(HTMLParser):
+    """
+    RFC search results HTML table parser.
+    """
+    def __init__(self, base_url: str = str()) -> None:
+        """
+        Initialize the object.
+        """
+        super().__init__(convert_charrefs=True)
+
+        self.BaseUrl: str = base_url                             # Relative link base URL
+        self.Results: list[SpecMetadata] = list[SpecMetadata]()  # Parsed specifications
+        self.Total: int = 0                                      # Total result count
+
+        self._Cells: list[str] = list[str]()              # Current row cell text
+        self._Links: list[dict[str, str]] = list[dict[str, str]]()  # Current row links
+        self._CellData: list[str] | None = None           # Current cell text parts
+        self._Href: str | None = None                     # Current link target
+        self._LinkData: list[str] = list[str]()           # Current link text parts
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """
+        Collapse all whitespace sequences in the given text to single spaces.
+        """
+        return re.sub(r"\s+", " ", text).strip()
+
+    def parse(self, text: str) -> list[SpecMetadata]:
+        """
+        Parse the given search results HTML and get the specifications it contains.
+        """
+        with timings.span("parse"):
+            self.feed(text)
+            self.close()
+
+        return self.Results
+
+    def parse_page(self, text: str) -> "ResultParser":
+        """
+        Parse the given search results HTML page and get the parser
+        so that both the results and the total result count are available.
+        """
+        self.parse(text)
+        return self
+
+    def iter_parse(self,
+                   chunks: Iterable[bytes],
+                   encoding: str = "utf-8") -> Iterator[SpecMetadata]:
+        """
+        Incrementally parse the given search results HTML content chunks, yielding
+        each specification as soon as its table row is complete. Yielded results
+        are not retained by the parser.
+        """
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+        for chunk in chunks:
+            with timings.span("parse"):
+                self.feed(decoder.decode(chunk))
+
+            yield from self._drain()
+
+        with timings.span("parse"):
+            self.feed(decoder.decode(b"", final=True))
+            self.close()
+
+        yield from self._drain()
+
+    def _drain(self) -> list[SpecMetadata]:
+        """
+        Remove and get all the parsed specifications.
+        """
+        results, self.Results = self.Results, list[SpecMetadata]()
+        return results
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> void_t:
+        """
+        Process an HTML start tag.
+        """
+        if tag == "tr":
+            self._Cells.clear()
+            self._Links.clear()
+
+        elif tag == "td":
+            self._CellData = list[str]()
+            self._Links.append(dict[str, str]())
+
+        elif tag == "a" and self._CellData is not None:
+            href = dict(attrs).get("href")
+            self._Href = urljoin(self.BaseUrl, href) if href else None
+            self._LinkData.clear()
+
+    def handle_endtag(self, tag: str) -> void_t:
+        """
+        Process an HTML end tag.
+        """
+        if tag == "a" and self._Href is not None:
+            if self._Links:
+                self._Links[-1][self._normalize("".join(self._LinkData))] = self._Href
+            self._Href = None
+
+        elif tag == "td" and self._CellData is not None:
+            self._Cells.append(self._normalize("".join(self._CellData)))
+            self._CellData = None
+
+        elif tag == "tr":
+            if len(self._Cells) == len(RfcFieldPos):
+                spec = self._make_spec()
+
+                if spec is not None:
+                    self.Results.append(spec)
+
+            self._Cells.clear()
+            self._Links.clear()
+
+    def handle_data(self, data: str) -> void_t:
+        """
+        Process HTML text data.
+        """
+        if self._CellData is not None:
+            self._CellData.append(data)
+
+        elif not self.Total and (total_match := _TOTAL_RE.search(data)):
+            self.Total = int(total_match.group(1).replace(",", str()))
+
+        if self._Href is not None:
+            self._LinkData.append(data)
+
+    def _make_spec(self) -> SpecMetadata | void_t:
+        """
+        Create specification metadata from the current table row cells.
+        """
+        id_match = re.search(r"\d+", self._Cells[RfcFieldPos.ID])
+
+        if not id_match:
+            return None
+
+        id_links = self._Links[RfcFieldPos.ID]
+        files = dict(self._Links[RfcFieldPos.FILES])
+
+        return SpecMetadata(rfc_id=int(id_match.group()),
+                            files=files,
+                            title=self._Cells[RfcFieldPos.TITLE],
+                            authors=self._Cells[RfcFieldPos.AUTHORS],
+                            date=self._Cells[RfcFieldPos.DATE],
+                            more_info=self._Cells[RfcFieldPos.MORE_INFO],
+                            status=self._Cells[RfcFieldPos.STATUS],
+                            txt_url=files.get("TEXT", files.get("ASCII", str())),
+                            info_url=next(iter(id_links.values()), str()))
+
+
+# Module export symbols
+__all__ = ["ResultParser"]
@@ -0,0 +1,118 @@
+"""
+Buffered streaming search result writer module.
+"""
+import csv
+import json
+import sys
+import timings
+from types import TracebackType
+from typing import TextIO
+from alias import void_t
+from spec_metadata import SpecMetadata
+
+# Supported result output format names
+FORMATS: tuple[str, ...] = ("text", "ndjson", "csv", "json")
+
+# Default output stream buffer size (in bytes)
+DEFAULT_BUFFER_SIZE: int = 1024 * 1024
+
+# Compact JSON record encoder
+_ENCODER: json.JSONEncoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+class ResultWriter:
+    """
+    Search result writer that serializes each specification as soon as it is
+    produced, writing through a large output buffer that is never flushed per row
+    unless it is written to an interactive terminal.
+    """
+    def __init__(self,
+                 fmt: str = "text",
+                 stream: TextIO | None = None,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """
+        Initialize the object.
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Invalid output format: {fmt}")
+
+        self.Format: str = fmt  # Output format name
+        self.Count: int = 0     # Written result count
+
+        # Pending console output must precede the buffered results
+        if stream is None:
+            sys.stdout.flush()
+
+            stream = open(sys.stdout.fileno(),
+                          "w",
+                          buffering=buffer_size,
+                          encoding="utf-8",
+                          newline="",
+                          closefd=False)
+
+        self._Stream: TextIO = stream
+        self._Closed: bool = False
+        self._Interactive: bool = stream.isatty()
+        self._Csv: csv.DictWriter[str] | None = None
+
+        if self.Format == "csv":
+            self._Csv = csv.DictWriter(self._Stream,
+                                       SpecMetadata.FIELDS,
+                                       lineterminator="\n")
+            self._Csv.writeheader()
+
+    def __enter__(self) -> "ResultWriter":
+        """
+        Enter the runtime context of the object.
+        """
+        return self
+
+    def __exit__(self,
+                 exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> void_t:
+        """
+        Exit the runtime context of the object and flush the written results.
+        The output stream is left unflushed if it was closed by its reader.
+        """
+        if exc_type is None or not issubclass(exc_type, BrokenPipeError):
+            self.close()
+
+    def write(self, spec: SpecMetadata) -> void_t:
+        """
+        Serialize the given specification and write it to the output buffer.
+        """
+        with timings.span("console"):
+            if self.Format == "ndjson":
+                self._Stream.write(f"{_ENCODER.encode(spec.dict())}\n")
+
+            elif self.Format == "json":
+                separator = ",\n" if self.Count else "[\n"
+                self._Stream.write(f"{separator}{_ENCODER.encode(spec.dict())}")
+
+            elif self._Csv is not None:
+                row = spec.dict()
+                row["Files"] = ";".join([f"{k}={v}" for k, v in spec.Files.items()])
+                self._Csv.writerow(row)
+            else:
+                self._Stream.write(f"{spec!r}\n")
+
+            # Interactive searches show each result as soon as it is parsed
+            if self._Interactive:
+                self._Stream.flush()
+
+        self.Count += 1
+
+    def close(self) -> void_t:
+        """
+        Terminate the written results (if necessary) and flush the output buffer.
+        """
+        if not self._Closed and self.Format == "json":
+            self._Stream.write("\n]\n" if self.Count else "[]\n")
+
+        self._Closed = True
+        self._Stream.flush()
+
+
+# Module export symbols
+__all__ = ["DEFAULT_BUFFER_SIZE", "FORMATS", "ResultWriter"]
@@ -2,19 +2,595 @@
 """
 Application entry point script.
 """
+import contextlib
+import os
+import sys
+import time
 import console
+import timings
+import utils
+from typing import TYPE_CHECKING
 from alias import args_t, void_t
 from arg_parse import Parser
+from result_writer import ResultWriter
+from rfc_index import RfcIndex
+from spec_metadata import SpecMetadata
 
+# Task-specific modules are imported by the tasks that need them,
+# so that startup only pays for the modules that it actually uses
+if TYPE_CHECKING:
+    from cProfile import Profile
+    from crawler import Crawler
 
-def parse_args() -> tuple[args_t, list[str]]:
+
+def parse_args() -> tuple[args_t, bool]:
     """
     Parse and validate the command-line arguments.
     """
     parser = Parser()
     args = parser.parse_args()
 
-    return args, parser.UnknownArgs
+    return args, parser.is_valid()
+
+
+def start_profiling(cl_args: args_t,
+                    args_start: float,
+                    args_elapsed: float) -> "Profile | void_t":
+    """
+    Enable the phase timing spans and profiler requested by the command-line
+    arguments, recording the startup and argument parsing phases that preceded them.
+    """
+    if not cl_args.timings and not cl_args.profile:
+        return None
+
+    trace = bool(cl_args.profile) and cl_args.profile.lower().endswith(".json")
+    timings.enable(trace)
+
+    # Startup is measured from the timing module import, which precedes all task imports
+    timings.add("startup", timings.origin(), args_start - timings.origin())
+    timings.add("args", args_start, args_elapsed)
+
+    if not cl_args.profile or trace:
+        return None
+
+    from cProfile import Profile
+    profiler = Profile()
+    profiler.enable()
+
+    return profiler
+
+
+def finish_profiling(cl_args: args_t, profiler: "Profile | None") -> void_t:
+    """
+    Write the phase timing breakdown and profiling results requested
+    by the command-line arguments.
+    """
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(cl_args.profile)
+
+    elif cl_args.profile:
+        timings.write_trace(cl_args.profile)
+
+    if cl_args.timings:
+        for line in timings.summary():
+            console.verbose_ln(line)
+
+
+def update_index(source: str) -> void_t:
+    """
+    Build the local RFC index from the given bulk index file path or URL.
+    """
+    index = RfcIndex()
+    console.write_ln(f"Building local RFC index from '{source}'")
+
+    count = index.build(source)
+    index.save()
+
+    console.write_ln(f"Indexed {count} RFC specifications in '{index.Path}'")
+
+    from facets import FacetIndex
+    from fuzzy import TrigramIndex
+    from rfc_graph import RfcGraph
+
+    TrigramIndex.open(index)
+    RfcGraph.open(index)
+    FacetIndex.open(index)
+
+
+def refresh_index(offline: bool) -> void_t:
+    """
+    Apply the RFC specifications published or changed since the local RFC
+    index was last updated, without rebuilding the entire index.
+    """
+    from crawler import Crawler
+    from http_cache import ResponseCache
+    from index_refresh import IndexRefresh
+
+    index = RfcIndex.open()
+
+    if not len(index):
+        console.error_ln("Build the local RFC index first using -u/--update-index")
+        sys.exit(1)
+
+    console.write_ln(f"Refreshing local RFC index from RFC {index.LatestId} "
+                     f"({index.LatestDate})")
+
+    # Cached delta search responses are always revalidated
+    with Crawler(index=index, cache=ResponseCache(ttl=0), offline=offline) as crawler:
+        stats = IndexRefresh(index, crawler).run()
+
+    console.write_ln(f"Checked {stats.Checked} entries: {stats.Added} added, "
+                     f"{stats.Changed} changed, {stats.Linked} newly obsoleted or updated")
+
+    if stats.Added or stats.Changed or stats.Linked:
+        from facets import FacetIndex
+        from fuzzy import TrigramIndex
+        from rfc_graph import RfcGraph
+
+        TrigramIndex.open(index)
+        RfcGraph.open(index)
+        FacetIndex.open(index)
+
+
+def sync_corpus(mirror_dir: str, formats: str) -> void_t:
+    """
+    Mirror the files of every locally indexed RFC specification into the given directory.
+    """
+    from crawler import Crawler
+    from sync import CorpusMirror
+
+    index = RfcIndex.open()
+
+    if not len(index):
+        console.error_ln("Build the local RFC index first using -u/--update-index")
+        sys.exit(1)
+
+    console.write_ln(f"Synchronizing RFC specification files into '{mirror_dir}'")
+
+    with Crawler(index=index) as crawler:
+        mirror_formats = [f.strip().upper() for f in formats.split(",")]
+        mirror = CorpusMirror(crawler, mirror_dir, mirror_formats)
+        stats = mirror.sync(index)
+
+    console.write_ln(f"Fetched {stats.Fetched} files ({stats.Bytes} bytes), "
+                     f"{stats.Unchanged} unchanged, {stats.Failed} failed")
+
+
+def fetch_texts(crawler: "Crawler", text_dir: str) -> list[tuple[int, str]]:
+    """
+    Get the RFC number and text file path of every locally indexed RFC specification
+    in the given directory, downloading and saving the text files that are missing.
+    """
+    if crawler.Index is None:
+        raise RuntimeError("Missing local RFC index")
+
+    os.makedirs(text_dir, exist_ok=True)
+    paths = list[tuple[int, str]]()
+
+    for spec in crawler.Index:
+        path = os.path.join(text_dir, f"rfc{spec.Id}.txt")
+
+        if not os.path.isfile(path):
+            if (text := crawler.fetch_text(spec)) is None:
+                continue
+
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text)
+
+        paths.append((spec.Id, path))
+
+    return paths
+
+
+def index_text(text_dir: str, offline: bool) -> void_t:
+    """
+    Build the local full-text index, packed text store and relationship graph
+    from the RFC text files in the given directory, using worker processes.
+    """
+    from crawler import Crawler
+    from index_pipeline import IndexPipeline
+
+    index = RfcIndex.open()
+
+    if not len(index):
+        console.error_ln("Build the local RFC index first using -u/--update-index")
+        sys.exit(1)
+
+    with Crawler(index=index, offline=offline) as crawler:
+        paths = fetch_texts(crawler, text_dir)
+
+    pipeline = IndexPipeline(index)
+    console.write_ln(f"Indexing {len(paths)} RFC text files from '{text_dir}' "
+                     f"using {pipeline.Workers} worker processes")
+
+    try:
+        count = pipeline.run(paths)
+    finally:
+        pipeline.close()
+
+    console.write_ln(f"Indexed {count} RFC specifications in '{pipeline.FullText.Path}'")
+    console.write_ln(f"Packed {count} RFC specifications in '{pipeline.Store.Path}'")
+    console.write_ln(f"Indexed {len(pipeline.Graph)} RFC relationships "
+                     f"in '{pipeline.Graph.Path}'")
+
+
+def request_failed(exc: BaseException) -> bool:
+    """
+    Determine whether the given exception is an HTTP request failure. HTTP
+    requests can only have failed if the HTTP client module was imported.
+    """
+    requests = sys.modules.get("requests")
+    return requests is not None and isinstance(exc, requests.RequestException)
+
+
+def has_facets(cl_args: args_t) -> bool:
+    """
+    Determine whether any facet filters were specified on the command-line.
+    """
+    return any([cl_args.status, cl_args.author, cl_args.from_year, cl_args.to_year])
+
+
+def facet_filter(cl_args: args_t) -> set[int] | void_t:
+    """
+    Get the RFC numbers of the locally indexed specifications that match the
+    command-line facet filters, or none if no facet filters were specified.
+    """
+    if not has_facets(cl_args):
+        return None
+
+    from facets import FacetIndex, members
+
+    index = RfcIndex.open()
+
+    if not len(index):
+        console.error_ln("Build the local RFC index first using -u/--update-index")
+        sys.exit(1)
+
+    with timings.span("facets"):
+        bits = FacetIndex.open(index).select((cl_args.status or str()).split(","),
+                                             cl_args.author or str(),
+                                             cl_args.from_year,
+                                             cl_args.to_year)
+        return set(members(bits))
+
+
+def fulltext_search(query: str,
+                    writer: ResultWriter,
+                    limit: int = 0,
+                    allowed: set[int] | None = None) -> void_t:
+    """
+    Search the local full-text index and write at most the given number of
+    ranked matching specifications (0 for the default limit), limited to
+    the given allowed RFC numbers (if any).
+    """
+    from fulltext import FullTextIndex
+    fulltext = FullTextIndex.open()
+
+    if not len(fulltext):
+        console.error_ln("Build the full-text index first using -t/--index-text")
+        sys.exit(1)
+
+    index = RfcIndex.open()
+    if limit:
+        ranked = fulltext.search(query, limit, allowed)
+    else:
+        ranked = fulltext.search(query, allowed=allowed)
+
+    for rfc_id, _ in ranked:
+        spec = index.lookup(rfc_id)
+        writer.write(spec if spec is not None else SpecMetadata(rfc_id=rfc_id))
+
+    if not ranked:
+        console.warn_ln("No matching RFC specifications found")
+
+
+def lookup_ids(rfc_ids: list[int],
+               offline: bool,
+               writer: ResultWriter,
+               allowed: set[int] | None = None) -> void_t:
+    """
+    Find the specifications matching the given RFC numbers (limited to the given
+    allowed RFC numbers, if any) and write them in input order as soon as they
+    are resolved.
+    """
+    if allowed is not None:
+        rfc_ids = [i for i in rfc_ids if i in allowed]
+
+        if not rfc_ids:
+            console.warn_ln("No matching RFC specifications found")
+            return
+
+    from crawler import Crawler
+    from http_cache import ResponseCache
+    from result_cache import ResultCache
+
+    url = utils.search_url()
+    index = RfcIndex.open()
+    pending = dict.fromkeys(rfc_ids)
+
+    try:
+        with Crawler(index=index,
+                     cache=ResponseCache(),
+                     offline=offline,
+                     results=ResultCache()) as crawler:
+            for rfc_id, spec in crawler.batch_search(url, rfc_ids):
+                pending.pop(rfc_id, None)
+
+                if spec is None:
+                    console.warn_ln(f"No matching RFC specification found for RFC {rfc_id}")
+                else:
+                    writer.write(spec)
+
+    except OSError as exc:
+        if not request_failed(exc):
+            raise
+
+        console.error_ln(f"Unable to search for RFC {next(iter(pending))}: {exc}")
+
+        # Remaining RFC numbers are resolved using only the local index
+        for rfc_id in list(pending)[1:]:
+            if (spec := index.lookup(rfc_id)) is None:
+                console.warn_ln(f"No local RFC specification found for RFC {rfc_id}")
+            else:
+                writer.write(spec)
+
+        sys.exit(1)
+
+
+def list_index(writer: ResultWriter,
+               limit: int = 0,
+               allowed: set[int] | None = None) -> void_t:
+    """
+    Write at most the given number of locally indexed specifications (0 for
+    unlimited) in RFC number order, limited to the given allowed RFC numbers (if any).
+    """
+    index = RfcIndex.open()
+
+    if not len(index):
+        console.error_ln("Build the local RFC index first using -u/--update-index")
+        sys.exit(1)
+
+    if allowed is None:
+        specs = iter(index)
+    else:
+        specs = (s for i in sorted(allowed) if (s := index.lookup(i)) is not None)
+
+    for count, spec in enumerate(specs, 1):
+        writer.write(spec)
+
+        if count == limit:
+            break
+
+    if allowed is not None and not allowed:
+        console.warn_ln("No matching RFC specifications found")
+
+
+def write_sections(rfc_ids: list[int], section: str, offline: bool) -> void_t:
+    """
+    Write the given section of each given RFC specification, slicing it from the
+    packed text store or splitting the downloaded text if it is not packed.
+    """
+    from crawler import Crawler
+    from text_store import TextStore
+
+    index = RfcIndex.open()
+    sys.stdout.flush()
+
+    with TextStore.open() as store, Crawler(index=index, offline=offline) as crawler:
+        for rfc_id in rfc_ids:
+            if rfc_id in store:
+                text = store.section(rfc_id, section)
+            else:
+                txt_url = f"{utils.editor_url()}/rfc/rfc{rfc_id}.txt"
+                spec = index.lookup(rfc_id) or SpecMetadata(rfc_id=rfc_id, txt_url=txt_url)
+                spec_text = crawler.fetch_text(spec)
+
+                if spec_text is None:
+                    text = None
+                else:
+                    text = TextStore.split_section(spec_text.encode("utf-8"), section)
+
+            if text is None:
+                console.warn_ln(f"No section {section} found for RFC {rfc_id}")
+            else:
+                sys.stdout.buffer.write(text)
+                sys.stdout.buffer.flush()
+
+                # Release the view before the memory map is closed
+                text.release()
+
+
+def write_related(cl_args: args_t, writer: ResultWriter) -> void_t:
+    """
+    Write the specifications related to the command-line RFC numbers by
+    the requested relationship, using the local relationship graph.
+    """
+    from rfc_graph import Relation, RfcGraph
+
+    index = RfcIndex.open()
+    graph = RfcGraph.open(index)
+    written = set[int]()
+
+    for rfc_id in cl_args.rfc_ids:
+        if cl_args.latest:
+            related = graph.latest(rfc_id)
+
+        elif cl_args.updated_by:
+            related = graph.closure(rfc_id, Relation.UPDATED_BY)
+        else:
+            related = graph.closure(rfc_id, Relation.REFERENCES)
+
+        if not related:
+            console.warn_ln(f"No related RFC specifications found for RFC {rfc_id}")
+
+        for related_id in [i for i in related if i not in written]:
+            written.add(related_id)
+            writer.write(index.lookup(related_id) or SpecMetadata(rfc_id=related_id))
+
+
+def fuzzy_search(keyword: str,
+                 writer: ResultWriter,
+                 limit: int = 0,
+                 allowed: set[int] | None = None) -> bool:
+    """
+    Write the locally indexed specifications whose titles best match the given
+    (possibly misspelled) keyword, limited to the given number of matches (0
+    for the default limit) and allowed RFC numbers (if any). Determine whether
+    any titles matched.
+    """
+    from fuzzy import DEFAULT_LIMIT, TrigramIndex
+
+    index = RfcIndex.open()
+    trigrams = TrigramIndex.open(index)
+    matches = trigrams.search(keyword, limit or DEFAULT_LIMIT, allowed=allowed)
+
+    for rfc_id, _ in matches:
+        spec = index.lookup(rfc_id)
+        writer.write(spec if spec is not None else SpecMetadata(rfc_id=rfc_id))
+
+    return bool(matches)
+
+
+def search(cl_args: args_t,
+           writer: ResultWriter,
+           allowed: set[int] | None = None) -> void_t:
+    """
+    Search for the RFC specifications matching the command-line keyword (limited
+    to the given allowed RFC numbers, if any), falling back to a fuzzy title
+    search if there are no exact matches.
+    """
+    if cl_args.fuzzy:
+        if not fuzzy_search(cl_args.keyword, writer, cl_args.limit, allowed):
+            console.warn_ln("No matching RFC specifications found")
+        return
+
+    from datetime import datetime
+    from crawler import Crawler
+    from http_cache import ResponseCache
+    from query_params import FIRST_YEAR, QueryParams
+    from result_cache import ResultCache
+
+    params = QueryParams(cl_args.from_year or FIRST_YEAR,
+                         cl_args.to_year or datetime.now().year,
+                         title=cl_args.keyword,
+                         page=100)
+    url = utils.search_url()
+    found = 0
+    failed = False
+
+    # Results are written as soon as they are parsed, and result pages
+    # beyond the result limit are never requested
+    try:
+        with Crawler(params,
+                     RfcIndex.open(),
+                     ResponseCache(),
+                     cl_args.offline,
+                     results=ResultCache()) as crawler:
+            # Filtered results are limited after filtering
+            limit = 0 if allowed is not None else cl_args.limit
+
+            with crawler.search(url, limit) as results:
+                for spec in results:
+                    if allowed is not None and spec.Id not in allowed:
+                        continue
+
+                    writer.write(spec)
+                    found += 1
+
+                    if found == cl_args.limit:
+                        break
+
+    except OSError as exc:
+        if not request_failed(exc):
+            raise
+
+        console.error_ln(f"Unable to search for '{cl_args.keyword}': {exc}")
+        failed = True
+
+    if not found:
+        if failed:
+            console.warn_ln("Showing the closest local RFC titles instead")
+        else:
+            console.warn_ln("No exact matches found, showing the closest local RFC titles")
+
+        if not fuzzy_search(cl_args.keyword, writer, cl_args.limit, allowed):
+            console.warn_ln("No matching RFC specifications found")
+
+    if failed:
+        sys.exit(1)
+
+
+def serve(address: str, offline: bool) -> void_t:
+    """
+    Serve queries from the local indexes and caches until the server is interrupted.
+    """
+    from query_server import QueryServer
+    server = QueryServer(address, offline)
+
+    count = len(server.Index)
+    console.write_ln(f"Serving {count} indexed RFC specifications on '{address}'")
+
+    # Servers are stopped by keyboard interrupts or termination signals
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+
+    console.write_ln(f"Stopped query server after {server.Requests} requests")
+
+
+def remote_search(cl_args: args_t, writer: ResultWriter) -> void_t:
+    """
+    Send the command-line search to the query server and write its results.
+    """
+    from query_client import QueryClient
+
+    try:
+        with QueryClient(cl_args.connect) as client:
+            if cl_args.fulltext:
+                specs = client.fulltext(cl_args.fulltext, cl_args.limit)
+
+            elif cl_args.rfc_ids:
+                specs = list[SpecMetadata]()
+
+                for rfc_id, spec in client.lookup(cl_args.rfc_ids):
+                    if spec is None:
+                        message = f"No matching RFC specification found for RFC {rfc_id}"
+                        console.warn_ln(message)
+                    else:
+                        specs.append(spec)
+            else:
+                specs, fuzzy = client.search(cl_args.keyword, cl_args.fuzzy, cl_args.limit)
+
+                if fuzzy and specs and not cl_args.fuzzy:
+                    console.warn_ln("No exact matches found, "
+                                    "showing the closest local RFC titles")
+
+    except OSError as exc:
+        console.error_ln(f"Unable to query server '{cl_args.connect}': {exc}")
+        sys.exit(1)
+
+    # Failed requests are reported by the server as error responses
+    except RuntimeError as exc:
+        console.error_ln(f"Query server '{cl_args.connect}' request failed: {exc}")
+        sys.exit(1)
+
+    for spec in specs:
+        writer.write(spec)
+
+    if not specs and not cl_args.rfc_ids:
+        console.warn_ln("No matching RFC specifications found")
+
+
+def open_writer(cl_args: args_t) -> ResultWriter:
+    """
+    Create the search result writer of the output format requested
+    by the command-line arguments.
+    """
+    if not cl_args.list:
+        return ResultWriter(cl_args.format or "text")
+
+    from table_writer import TableWriter
+    return TableWriter()
 
 
 def main() -> void_t:
@@ -22,9 +598,71 @@ def main() -> void_t:
     Application startup function.
     """
     console.setup_console()
-    cl_args, unknown_args = parse_args()
 
-    raise NotImplementedError(main)
+    args_start = time.perf_counter()
+    cl_args, valid = parse_args()
+    args_elapsed = time.perf_counter() - args_start
+
+    if not valid:
+        sys.exit(1)
+
+    profiler = start_profiling(cl_args, args_start, args_elapsed)
+
+    try:
+        if cl_args.update_index:
+            update_index(cl_args.update_index)
+
+        if cl_args.refresh:
+            refresh_index(cl_args.offline)
+
+        if cl_args.sync:
+            sync_corpus(cl_args.sync, cl_args.formats)
+
+        if cl_args.index_text:
+            index_text(cl_args.index_text, cl_args.offline)
+
+        if cl_args.serve:
+            serve(cl_args.serve, cl_args.offline)
+
+        elif cl_args.rfc_ids and cl_args.section:
+            write_sections(cl_args.rfc_ids, cl_args.section, cl_args.offline)
+
+        elif any([cl_args.fulltext, cl_args.rfc_ids, cl_args.keyword, cl_args.list]) \
+                or has_facets(cl_args):
+            allowed = facet_filter(cl_args)
+
+            with open_writer(cl_args) as writer:
+                if cl_args.connect:
+                    remote_search(cl_args, writer)
+
+                elif cl_args.fulltext:
+                    fulltext_search(cl_args.fulltext, writer, cl_args.limit, allowed)
+
+                elif cl_args.latest or cl_args.updated_by or cl_args.depends:
+                    write_related(cl_args, writer)
+
+                elif cl_args.rfc_ids:
+                    lookup_ids(cl_args.rfc_ids, cl_args.offline, writer, allowed)
+
+                elif cl_args.keyword:
+                    search(cl_args, writer, allowed)
+                else:
+                    list_index(writer, cl_args.limit, allowed)
+
+    except BrokenPipeError:
+        # Standard streams are flushed at exit, so discard any unwritten output
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+    # Tasks without local results to fall back to only report the failed request
+    except OSError as exc:
+        if not request_failed(exc):
+            raise
+
+        console.error_ln(f"HTTP request failed: {exc}")
+        sys.exit(1)
+    finally:
+        finish_profiling(cl_args, profiler)
 
 
 # Static application entry point
@@ -0,0 +1,310 @@
+"""
+RFC specification relationship graph module.
+"""
+import contextlib
+import enum
+import json
+import os
+import re
+import utils
+from array import array
+from collections import deque
+from enum import IntEnum
+from typing import Iterable, Iterator
+from alias import void_t
+from binary_index import BinaryIndex, write_index
+from rfc_index import RfcIndex
+from spec_metadata import SpecMetadata
+
+_INDEX_KIND: bytes = b"GRPH"  # Binary index file kind
+_INDEX_VERSION: int = 2       # Index file format version
+
+# 'More Info' relationship label pattern (e.g., 'Updated by RFC 1122, RFC 3168')
+_MORE_INFO_RE: re.Pattern[str] = re.compile(
+    r"(Obsoleted by|Obsoletes|Updated by|Updates)((?:[\s,]*RFC\s*\d+)+)",
+    re.I
+)
+
+# References section heading line pattern, excluding table of contents lines
+_REFERENCES_RE: re.Pattern[bytes] = re.compile(
+    rb"^(?:[A-Z0-9]+(?:\.\d+)*\.?[ \t]+)?"
+    rb"(?:Normative[ \t]+|Informative[ \t]+)?References[ \t]*\r?$",
+    re.M | re.I
+)
+
+_RFC_RE: re.Pattern[bytes] = re.compile(rb"RFC[ -]?0*(\d{1,5})\b")   # RFC reference pattern
+_CITATION_RE: re.Pattern[bytes] = re.compile(rb"\[RFC0*(\d{1,5})\]")  # RFC citation pattern
+
+
+@enum.unique
+class Relation(IntEnum):
+    """
+    RFC specification relationship type integral enumeration type.
+    """
+    OBSOLETES = 0
+    OBSOLETED_BY = 1
+    UPDATES = 2
+    UPDATED_BY = 3
+    REFERENCES = 4
+
+
+# 'More Info' relationship labels mapped to relationship types
+_LABELS: dict[str, Relation] = {
+    "obsoletes": Relation.OBSOLETES,
+    "obsoleted by": Relation.OBSOLETED_BY,
+    "updates": Relation.UPDATES,
+    "updated by": Relation.UPDATED_BY
+}
+
+# Relationship types mapped to their inverse relationship types
+_INVERSES: dict[Relation, Relation] = {
+    Relation.OBSOLETES: Relation.OBSOLETED_BY,
+    Relation.OBSOLETED_BY: Relation.OBSOLETES,
+    Relation.UPDATES: Relation.UPDATED_BY,
+    Relation.UPDATED_BY: Relation.UPDATES
+}
+
+
+class RfcGraph:
+    """
+    RFC specification relationship graph, stored as one compressed sparse row
+    adjacency list per relationship type indexed by RFC number. Saved graphs
+    are memory-mapped, so opening a graph does not decode its adjacency lists.
+    """
+    def __init__(self, path: str = str()) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path if path else RfcGraph.default_path()  # Graph file path
+        self.Updated: float = 0.0                                   # Source index timestamp
+
+        # Per-relationship adjacency list offsets (by RFC number) and target RFC numbers
+        self._Offsets: list[array[int] | memoryview] = [array("I", [0]) for _ in Relation]
+        self._Targets: list[array[int] | memoryview] = [array("I") for _ in Relation]
+
+        self._File: BinaryIndex | None = None  # Memory-mapped graph file
+
+    def __len__(self) -> int:
+        """
+        Get the number of relationships in the graph.
+        """
+        return sum([len(t) for t in self._Targets])
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Get the default relationship graph file path.
+        """
+        return os.path.join(utils.data_dir(), "rfc-graph.idx")
+
+    @staticmethod
+    def open(index: RfcIndex, path: str = str()) -> "RfcGraph":
+        """
+        Load the relationship graph of the given local RFC index from disk,
+        rebuilding and saving it if it is missing or out of date. Reference
+        relationships are only parsed from the packed specification texts
+        when the corpus is indexed, so rebuilds keep the loaded references.
+        """
+        graph = RfcGraph(path)
+
+        # Unsupported and corrupt graph files are rebuilt
+        if os.path.isfile(graph.Path):
+            with contextlib.suppress(RuntimeError):
+                graph.load()
+
+        if graph.Updated != index.Updated:
+            graph.build(index, list(graph.references()))
+            graph.Updated = index.Updated
+
+            if len(index):
+                graph.save()
+
+        return graph
+
+    @staticmethod
+    def parse_more_info(more_info: str) -> list[tuple[Relation, int]]:
+        """
+        Get the relationship types and RFC numbers listed in the given 'More Info' text.
+        """
+        relations = list[tuple[Relation, int]]()
+
+        for match in _MORE_INFO_RE.finditer(more_info):
+            relation = _LABELS[" ".join(match.group(1).lower().split())]
+            rfc_ids = re.findall(r"\d+", match.group(2))
+            relations.extend([(relation, int(i)) for i in rfc_ids])
+
+        return relations
+
+    @staticmethod
+    def format_more_info(relations: Iterable[tuple[Relation, int]]) -> str:
+        """
+        Get the 'More Info' text of the given relationship types and RFC numbers.
+        """
+        related = dict[Relation, list[int]]()
+
+        for relation, rfc_id in relations:
+            if rfc_id not in related.setdefault(relation, list[int]()):
+                related[relation].append(rfc_id)
+
+        labels = {v: k.capitalize() for k, v in _LABELS.items()}
+        groups = [(r, related[r]) for r in Relation if related.get(r)]
+        texts = [f"{labels[r]} {', '.join([f'RFC {i}' for i in ids])}" for r, ids in groups]
+
+        return ", ".join(texts)
+
+    @staticmethod
+    def parse_references(text: bytes | memoryview) -> set[int]:
+        """
+        Get the RFC numbers referenced by the given specification text. References
+        sections are used if there are any, otherwise RFC citations (e.g., '[RFC9110]').
+        """
+        headings = [m.start() for m in _REFERENCES_RE.finditer(text)]
+
+        if not headings:
+            return {int(m.group(1)) for m in _CITATION_RE.finditer(text)}
+
+        # Indented table of contents lines never match, so the first heading is in the body
+        return {int(m.group(1)) for m in _RFC_RE.finditer(text[headings[0]:])}
+
+    def references(self) -> Iterator[tuple[int, set[int]]]:
+        """
+        Get an iterator over the RFC numbers that reference other specifications
+        and the RFC numbers referenced by each specification.
+        """
+        for rfc_id in range(len(self._Offsets[Relation.REFERENCES]) - 1):
+            if referenced := self.related(rfc_id, Relation.REFERENCES):
+                yield rfc_id, set(referenced)
+
+    def build(self,
+              specs: Iterable[SpecMetadata],
+              references: Iterable[tuple[int, set[int]]] = ()) -> int:
+        """
+        Build the graph from the relationships in the given specifications' 'More Info'
+        text and the given RFC numbers and their referenced RFC numbers, replacing all
+        existing relationships. Get the number of relationships.
+        """
+        edges: list[dict[int, set[int]]] = [dict[int, set[int]]() for _ in Relation]
+        max_id = 0
+
+        for spec in specs:
+            max_id = max(max_id, spec.Id)
+
+            for relation, rfc_id in RfcGraph.parse_more_info(spec.MoreInfo):
+                edges[relation].setdefault(spec.Id, set[int]()).add(rfc_id)
+                edges[_INVERSES[relation]].setdefault(rfc_id, set[int]()).add(spec.Id)
+                max_id = max(max_id, rfc_id)
+
+        for rfc_id, referenced in references:
+            if referenced:
+                edges[Relation.REFERENCES][rfc_id] = set(referenced)
+                max_id = max(max_id, rfc_id, *referenced)
+
+        self.close()
+
+        for relation in Relation:
+            offsets = array("I", [0])
+            targets = array("I")
+
+            for rfc_id in range(max_id + 1):
+                targets.extend(sorted(edges[relation].get(rfc_id, set[int]())))
+                offsets.append(len(targets))
+
+            self._Offsets[relation] = offsets
+            self._Targets[relation] = targets
+
+        return len(self)
+
+    def related(self, rfc_id: int, relation: Relation) -> "array[int]":
+        """
+        Get the RFC numbers directly related to the given RFC number
+        by the given relationship type.
+        """
+        offsets = self._Offsets[relation]
+
+        if not 0 <= rfc_id < len(offsets) - 1:
+            return array("I")
+
+        return array("I", self._Targets[relation][offsets[rfc_id]:offsets[rfc_id + 1]])
+
+    def closure(self, rfc_id: int, relation: Relation) -> list[int]:
+        """
+        Get the RFC numbers transitively related to the given RFC number by the
+        given relationship type (e.g., every specification that updates it or one
+        of its updates), in breadth-first order.
+        """
+        visited = {rfc_id}
+        pending = deque([rfc_id])
+        related = list[int]()
+
+        while pending:
+            for target in self.related(pending.popleft(), relation):
+                if target not in visited:
+                    visited.add(target)
+                    related.append(target)
+                    pending.append(target)
+
+        return related
+
+    def latest(self, rfc_id: int) -> list[int]:
+        """
+        Get the current replacements of the given RFC number by following its
+        obsoleted-by chain, or the given RFC number if it is not obsolete.
+        """
+        if not self.related(rfc_id, Relation.OBSOLETED_BY):
+            return [rfc_id]
+
+        replacements = self.closure(rfc_id, Relation.OBSOLETED_BY)
+        current = [i for i in replacements if not self.related(i, Relation.OBSOLETED_BY)]
+        return sorted(current)
+
+    def close(self) -> void_t:
+        """
+        Close the memory-mapped graph file, which also discards its relationships.
+        """
+        if self._File is not None:
+            self._File.close()
+            self._File = None
+
+            self._Offsets = [array("I", [0]) for _ in Relation]
+            self._Targets = [array("I") for _ in Relation]
+
+    def load(self) -> void_t:
+        """
+        Memory-map the underlying graph file. Adjacency lists are decoded on access.
+        """
+        self.close()
+        index_file = BinaryIndex.open(self.Path, _INDEX_KIND, _INDEX_VERSION)
+
+        try:
+            data = json.loads(str(index_file.section(0), "utf-8"))
+
+            # Each relationship type has an offset table followed by a target table
+            tables = [index_file.table(p, "I") for p in range(1, 2 * len(Relation) + 1)]
+        except RuntimeError:
+            index_file.close()
+            raise
+
+        self.Updated = data["updated"]
+        self._Offsets = [t for t in tables[0::2]]
+        self._Targets = [t for t in tables[1::2]]
+        self._File = index_file
+
+    def save(self) -> void_t:
+        """
+        Atomically write the graph to the underlying graph file.
+        """
+        # Memory-mapped graphs are unchanged since they were loaded
+        if self._File is not None:
+            return
+
+        sections = [json.dumps({"updated": self.Updated}).encode()]
+
+        for relation in Relation:
+            sections.append(bytes(self._Offsets[relation]))
+            sections.append(bytes(self._Targets[relation]))
+
+        write_index(self.Path, _INDEX_KIND, _INDEX_VERSION, sections)
+
+
+# Module export symbols
+__all__ = ["Relation", "RfcGraph"]
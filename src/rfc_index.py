@@ -0,0 +1,411 @@
+"""
+Local RFC specification metadata index module.
+"""
+import contextlib
+import json
+import os
+import time
+import utils
+from threading import RLock
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator
+from alias import void_t
+from binary_index import BinaryIndex, write_index
+from spec_metadata import SpecMetadata
+from spec_table import MappedSpecTable, SpecTable
+
+# Download and XML parsing modules are only imported when building the index
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element
+
+# RFC Editor bulk index XML download URL
+INDEX_URL: str = "https://www.rfc-editor.org/rfc-index.xml"
+
+# Local index maximum age (in seconds) before entries are considered stale
+DEFAULT_MAX_AGE: int = 7 * 24 * 60 * 60
+
+_INDEX_KIND: bytes = b"SPEC"                             # Binary index file kind
+_INDEX_VERSION: int = 3                                  # Index file format version
+_LEGACY_VERSION: int = 2                                 # JSON index file format version
+_LEGACY_NAME: str = "rfc-index.json"                     # JSON index file name
+_XML_NS: str = "{https://www.rfc-editor.org/rfc-index}"  # Bulk index XML namespace
+
+# Bulk index file format names mapped to search result file names and extensions
+_FILE_FORMATS: dict[str, tuple[str, str]] = {
+    "ASCII": ("TEXT", "txt"),
+    "TEXT": ("TEXT", "txt"),
+    "HTML": ("HTML", "html"),
+    "PDF": ("PDF", "pdf"),
+    "PS": ("PS", "ps"),
+    "XML": ("XML", "xml")
+}
+
+# Bulk index relationship element names mapped to 'More Info' labels
+_RELATIONS: dict[str, str] = {
+    "obsoletes": "Obsoletes",
+    "obsoleted-by": "Obsoleted by",
+    "updates": "Updates",
+    "updated-by": "Updated by"
+}
+
+
+class RfcIndex:
+    """
+    Local RFC specification metadata index keyed by RFC number. Saved indexes are
+    memory-mapped binary index files whose entries are decoded on access, and are
+    only fully decoded once they are modified. Lookups and modifications are
+    thread-safe, so that concurrent lookups can add the specifications they find.
+    """
+    def __init__(self, path: str = str(), max_age: int = DEFAULT_MAX_AGE) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path if path else RfcIndex.default_path()  # Index file path
+        self.MaxAge: int = max_age                                  # Maximum age (seconds)
+        self.Updated: float = 0.0                                   # Build UNIX timestamp
+        self.Source: str = str()                                    # Build source path/URL
+        self.Modified: float = 0.0                                  # Source file timestamp
+        self.LatestId: int = 0                                      # High-water RFC number
+        self.LatestDate: str = str()                                # High-water RFC date
+
+        self._Specs: SpecTable | MappedSpecTable = SpecTable()  # Indexed specifications
+        self._File: BinaryIndex | None = None                   # Memory-mapped index file
+
+        # Memory-mapped index file replaced by its decoded table, which stays mapped
+        # until the index is closed or saved, since other threads may still read it
+        self._Detached: BinaryIndex | None = None
+        self._Lock: RLock = RLock()
+
+    def __contains__(self, rfc_id: int) -> bool:
+        """
+        Determine whether the index contains the given RFC number.
+        """
+        with self._Lock:
+            return rfc_id in self._Specs
+
+    def __iter__(self) -> Iterator[SpecMetadata]:
+        """
+        Get an iterator over the indexed specifications in RFC number order.
+        """
+        return iter(self._Specs)
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed specifications.
+        """
+        with self._Lock:
+            return len(self._Specs)
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Get the default local index file path.
+        """
+        return os.path.join(utils.data_dir(), "rfc-index.bin")
+
+    @staticmethod
+    def open(path: str = str(), max_age: int = DEFAULT_MAX_AGE) -> "RfcIndex":
+        """
+        Load the local index from disk, or get an empty index if none exists.
+        JSON index files of earlier versions are converted to binary index files.
+        """
+        index = RfcIndex(path, max_age)
+        legacy_path = os.path.join(os.path.dirname(index.Path), _LEGACY_NAME)
+
+        if os.path.isfile(index.Path):
+            index.load()
+
+        elif legacy_path != index.Path and os.path.isfile(legacy_path):
+            index._load_json(legacy_path)
+            index.save()
+            os.remove(legacy_path)
+
+        return index
+
+    @staticmethod
+    def _text(elem: "Element", tag: str) -> str:
+        """
+        Get the normalized text of the given element's first matching child.
+        """
+        child = elem.find(f"{_XML_NS}{tag}")
+        return " ".join((child.text or str()).split()) if child is not None else str()
+
+    @staticmethod
+    def _doc_ids(elem: "Element", tag: str) -> list[int]:
+        """
+        Get the RFC numbers listed in the given element's matching child.
+        """
+        child = elem.find(f"{_XML_NS}{tag}")
+
+        if child is None:
+            return list[int]()
+
+        doc_ids = [d.text or str() for d in child.iter(f"{_XML_NS}doc-id")]
+        return [int(d[3:]) for d in doc_ids if d.startswith("RFC") and d[3:].isdigit()]
+
+    @staticmethod
+    def _make_spec(entry: "Element") -> SpecMetadata | void_t:
+        """
+        Create specification metadata from a bulk index 'rfc-entry' element.
+        """
+        doc_id = RfcIndex._text(entry, "doc-id")
+
+        if not doc_id.startswith("RFC") or not doc_id[3:].isdigit():
+            return None
+
+        rfc_id = int(doc_id[3:])
+        authors = list[str]()
+
+        for author in entry.iter(f"{_XML_NS}author"):
+            name = RfcIndex._text(author, "name")
+
+            if RfcIndex._text(author, "title") == "Editor":
+                name = f"{name}, Ed."
+            authors.append(name)
+
+        files = dict[str, str]()
+
+        for fmt in entry.iter(f"{_XML_NS}file-format"):
+            if (fmt.text or str()) in _FILE_FORMATS:
+                name, ext = _FILE_FORMATS[fmt.text or str()]
+                files[name] = f"{utils.editor_url()}/rfc/rfc{rfc_id}.{ext}"
+
+        date_elem = entry.find(f"{_XML_NS}date")
+        date = str()
+
+        if date_elem is not None:
+            month = RfcIndex._text(date_elem, "month")
+            date = f"{month} {RfcIndex._text(date_elem, 'year')}"
+
+        more_info = list[str]()
+
+        for tag, label in _RELATIONS.items():
+            if related := RfcIndex._doc_ids(entry, tag):
+                more_info.append(f"{label} {', '.join([f'RFC {i}' for i in related])}")
+
+        return SpecMetadata(rfc_id=rfc_id,
+                            files=files,
+                            title=RfcIndex._text(entry, "title"),
+                            authors=", ".join(authors),
+                            date=date.strip(),
+                            more_info=", ".join(more_info),
+                            status=RfcIndex._text(entry, "current-status"),
+                            txt_url=files.get("TEXT", str()),
+                            info_url=f"{utils.editor_url()}/info/rfc{rfc_id}")
+
+    @staticmethod
+    def _download(url: str, path: str) -> void_t:
+        """
+        Download the bulk index file from the given URL to the given local path.
+        """
+        import requests
+
+        if not utils.valid_url(url):
+            raise ValueError(f"Invalid URL: {url}")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = utils.temp_path(path)
+
+        try:
+            with requests.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+
+                with open(temp_path, "wb") as file:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        file.write(chunk)
+
+            os.replace(temp_path, path)
+
+        # Temporary file names are unique, so failed downloads must remove their own
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
+
+    def build(self, source: str = INDEX_URL) -> int:
+        """
+        Build the index from a bulk index XML file path or URL, replacing all
+        existing entries. Get the number of indexed specifications.
+        """
+        xml_path = source
+
+        if utils.valid_url(source):
+            xml_path = os.path.join(os.path.dirname(self.Path), "rfc-index.xml")
+            RfcIndex._download(source, xml_path)
+
+        with open(xml_path, "rb") as file:
+            specs = RfcIndex._parse(file)
+
+        self.close()
+        self._Specs = specs
+
+        self.Source = source
+        self.Updated = time.time()
+        self.Modified = os.path.getmtime(xml_path)
+        self._mark_latest()
+
+        return len(self._Specs)
+
+    def _mark_latest(self) -> void_t:
+        """
+        Record the RFC number and date of the latest indexed specification
+        as the high-water mark of incremental refreshes.
+        """
+        latest = self._Specs.last()
+
+        self.LatestId = latest.Id if latest is not None else 0
+        self.LatestDate = latest.Date if latest is not None else str()
+
+    @staticmethod
+    def _parse(file: BinaryIO) -> SpecTable:
+        """
+        Incrementally parse the 'rfc-entry' elements of a bulk index XML file.
+        """
+        from xml.etree import ElementTree
+        specs = SpecTable()
+
+        for _, elem in ElementTree.iterparse(file, events=["end"]):
+            if elem.tag == f"{_XML_NS}rfc-entry":
+                spec = RfcIndex._make_spec(elem)
+
+                if spec is not None:
+                    specs.add(spec)
+                elem.clear()
+
+        return specs
+
+    def is_stale(self) -> bool:
+        """
+        Determine whether the index is older than its maximum age.
+        """
+        return time.time() - self.Updated > self.MaxAge
+
+    def lookup(self, rfc_id: int) -> SpecMetadata | void_t:
+        """
+        Get the indexed specification metadata for the given RFC number.
+        """
+        with self._Lock:
+            return self._Specs.get(rfc_id)
+
+    def _table(self) -> SpecTable:
+        """
+        Get the modifiable specification table, decoding every memory-mapped
+        entry and detaching the index file if necessary.
+        """
+        with self._Lock:
+            if isinstance(self._Specs, MappedSpecTable):
+                self._Specs = self._Specs.unpack()
+                self._Detached, self._File = self._File, None
+
+            return self._Specs
+
+    def add(self, spec: SpecMetadata) -> void_t:
+        """
+        Add or replace the given specification in the index.
+        """
+        with self._Lock:
+            self._table().add(spec)
+
+    def apply(self, specs: Iterable[SpecMetadata]) -> void_t:
+        """
+        Add or replace the given new and changed specifications as a single delta,
+        then atomically write the index and advance its high-water mark.
+        """
+        with self._Lock:
+            table = self._table()
+
+            for spec in specs:
+                table.add(spec)
+
+            self.Updated = time.time()
+            self._mark_latest()
+            self.save()
+
+    def close(self) -> void_t:
+        """
+        Close the memory-mapped index file, which also discards its entries.
+        """
+        with self._Lock:
+            if self._File is not None:
+                self._Specs = SpecTable()
+                self._File.close()
+                self._File = None
+
+            self._close_detached()
+
+    def _close_detached(self) -> void_t:
+        """
+        Close the detached memory-mapped index file, if any.
+        """
+        if self._Detached is not None:
+            self._Detached.close()
+            self._Detached = None
+
+    def load(self) -> void_t:
+        """
+        Memory-map the underlying index file. Entries are decoded on access.
+        """
+        self.close()
+        self._File = BinaryIndex.open(self.Path, _INDEX_KIND, _INDEX_VERSION)
+
+        try:
+            data = json.loads(str(self._File.section(0), "utf-8"))
+            self._Specs = MappedSpecTable(self._File, 1)
+        except RuntimeError:
+            self.close()
+            raise
+
+        self.Source = data["source"]
+        self.Updated = data["updated"]
+        self.Modified = data["modified"]
+        self.LatestId, self.LatestDate = data["latest"]
+
+    def _load_json(self, path: str) -> void_t:
+        """
+        Load the index from the given JSON index file of an earlier version.
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+        if data.get("version") != _LEGACY_VERSION:
+            raise RuntimeError(f"Unsupported index file version: {data.get('version')}")
+
+        self.close()
+        self.Source = data["source"]
+        self.Updated = data["updated"]
+        self.Modified = data.get("modified", 0.0)
+        self._Specs = SpecTable()
+
+        for spec_data in data["specs"]:
+            self._Specs.add(SpecMetadata.from_dict(spec_data))
+
+        # Indexes saved without a high-water mark derive it from their specifications
+        self.LatestId, self.LatestDate = data.get("latest", (0, str()))
+
+        if not self.LatestId:
+            self._mark_latest()
+
+    def save(self) -> void_t:
+        """
+        Atomically write the index to the underlying index file.
+        """
+        data = {
+            "source": self.Source,
+            "updated": self.Updated,
+            "modified": self.Modified,
+            "latest": [self.LatestId, self.LatestDate]
+        }
+
+        # Memory-mapped index files are decoded and closed first, since
+        # they cannot be replaced while mapped on every platform
+        with self._Lock:
+            sections = self._table().pack()
+            self._close_detached()
+
+            write_index(self.Path,
+                        _INDEX_KIND,
+                        _INDEX_VERSION,
+                        [json.dumps(data).encode(), *sections])
+
+
+# Module export symbols
+__all__ = ["DEFAULT_MAX_AGE", "INDEX_URL", "RfcIndex"]
@@ -0,0 +1,270 @@
+"""
+Adaptive HTTP request rate limiting and retry scheduler module.
+"""
+import threading
+import time
+import timings
+from typing import TYPE_CHECKING, Callable
+from alias import void_t
+
+# HTTP response types are only imported when a request is sent
+if TYPE_CHECKING:
+    from requests import Response
+
+# HTTP response status codes of requests that are retried
+RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+# HTTP response status codes that signal server throttling
+THROTTLE_STATUSES: frozenset[int] = frozenset({429})
+
+_DECREASE_FACTOR: float = 0.5     # Multiplicative decrease factor
+_LATENCY_FACTOR: float = 0.75     # Slow response concurrency decrease factor
+_DECREASE_INTERVAL: float = 0.5   # Minimum interval between decreases (seconds)
+_MIN_RATE: float = 0.5            # Minimum adaptive request rate (requests/s)
+_RATE_STEP: float = 0.05          # Rate increase per second (fraction of maximum rate)
+_PROBE_FACTOR: float = 0.1        # Rate increase factor near the last throttled rate
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket request rate limiter.
+    """
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        Initialize the object.
+        """
+        self.Rate: float = rate           # Token refill rate (tokens/s, 0 for unlimited)
+        self.Burst: int = max(burst, 1)   # Maximum stored tokens
+
+        self._Tokens: float = float(self.Burst)
+        self._Updated: float = time.monotonic()
+        self._Lock: threading.Lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token from the bucket, waiting until one is available.
+        Get the number of seconds spent waiting.
+        """
+        waited = 0.0
+
+        while True:
+            with self._Lock:
+                now = time.monotonic()
+
+                if self.Rate <= 0:
+                    return waited
+
+                refill = (now - self._Updated) * self.Rate
+                self._Tokens = min(self.Burst, self._Tokens + refill)
+                self._Updated = now
+
+                if self._Tokens >= 1:
+                    self._Tokens -= 1
+                    return waited
+
+                delay = (1 - self._Tokens) / self.Rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+class RequestScheduler:
+    """
+    HTTP request scheduler that limits the request rate with a token bucket, adapts
+    the request rate and concurrency limit to throttling and latency signals (additive
+    increase, multiplicative decrease), and retries failed requests after a jittered
+    exponential backoff or the server's 'Retry-After' delay.
+    """
+    def __init__(self,
+                 rate: float = 0.0,
+                 burst: int = 10,
+                 max_concurrency: int = 4,
+                 retries: int = 3,
+                 backoff: float = 0.5,
+                 max_backoff: float = 30.0,
+                 latency_target: float = 5.0,
+                 max_retry_after: float = 120.0) -> None:
+        """
+        Initialize the object.
+        """
+        self.Bucket: TokenBucket = TokenBucket(rate, burst)  # Request rate limiter
+        self.MaxRate: float = rate                           # Rate limit (0 for unlimited)
+        self.MaxConcurrency: int = max(max_concurrency, 1)   # Maximum concurrent requests
+        self.Limit: float = float(self.MaxConcurrency)       # Adaptive concurrency limit
+        self.Retries: int = retries                          # Maximum retries per request
+        self.Backoff: float = backoff                        # Backoff base delay (seconds)
+        self.MaxBackoff: float = max_backoff                 # Maximum backoff (seconds)
+        self.LatencyTarget: float = latency_target           # Slow response time (seconds)
+        self.MaxRetryAfter: float = max_retry_after          # Maximum Retry-After (seconds)
+        self.Throttled: int = 0                              # Throttling responses received
+        self.Retried: int = 0                                # Retried request count
+
+        self._Active: int = 0
+        self._Resume: float = 0.0
+        self._Decreased: float = 0.0
+        self._Throttled: float = rate
+        self._Cond: threading.Condition = threading.Condition()
+
+    def send(self, request: Callable[[], "Response"]) -> "Response":
+        """
+        Send an HTTP request using the given request function once the rate and
+        concurrency limits allow it, retrying it if the request fails or the server
+        responds with a retryable status code. Get the final response.
+        """
+        attempt = 0
+
+        while True:
+            self._acquire()
+            start = time.monotonic()
+
+            # Request exceptions (e.g., connection errors, timeouts) are OSError subclasses
+            try:
+                response = request()
+
+            except OSError:
+                self._release(time.monotonic() - start)
+
+                if attempt >= self.Retries:
+                    raise
+
+                delay = self._backoff(attempt)
+            else:
+                status = response.status_code
+                self._release(time.monotonic() - start, status)
+
+                if status not in RETRY_STATUSES or attempt >= self.Retries:
+                    return response
+
+                retry_after = RequestScheduler.retry_after(response)
+
+                if retry_after is not None and retry_after > self.MaxRetryAfter:
+                    return response
+
+                delay = self._backoff(attempt) if retry_after is None else retry_after
+                response.close()
+
+                # Throttling applies to every request, so all requests are paused
+                if status in THROTTLE_STATUSES or retry_after is not None:
+                    self._pause(delay)
+
+            with self._Cond:
+                self.Retried += 1
+
+            with timings.span("backoff"):
+                time.sleep(delay)
+
+            attempt += 1
+
+    @staticmethod
+    def retry_after(response: "Response") -> float | void_t:
+        """
+        Get the delay (in seconds) of the given response's 'Retry-After' header, if any.
+        """
+        value = response.headers.get("Retry-After", str()).strip()
+
+        if not value:
+            return None
+
+        if value.replace(".", "", 1).isdigit():
+            return float(value)
+
+        import email.utils
+
+        try:
+            retry_time = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max(float(retry_time.timestamp()) - time.time(), 0.0)
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        Get the jittered exponential backoff delay (in seconds) of the given retry attempt.
+        """
+        import random
+
+        delay = min(self.MaxBackoff, self.Backoff * 2.0 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _acquire(self) -> void_t:
+        """
+        Wait until a request can be sent without exceeding the adaptive concurrency
+        limit or the request rate limit, or sending it during a throttling pause.
+        """
+        with timings.span("throttle"):
+            with self._Cond:
+                while True:
+                    pause = self._Resume - time.monotonic()
+
+                    if pause <= 0 and self._Active < int(self.Limit):
+                        break
+
+                    self._Cond.wait(pause if pause > 0 else None)
+
+                self._Active += 1
+
+            self.Bucket.acquire()
+
+    def _release(self, latency: float, status: int = 0) -> void_t:
+        """
+        Release the concurrency slot of a completed request, adapting the request
+        rate and concurrency limit to the given response latency and status code.
+        """
+        with self._Cond:
+            self._Active -= 1
+
+            if status in THROTTLE_STATUSES:
+                self.Throttled += 1
+                self._decrease(_DECREASE_FACTOR, adapt_rate=True)
+
+            # Failed requests and server errors signal overload and only limit concurrency
+            elif not status or status >= 500:
+                self._decrease(_DECREASE_FACTOR)
+
+            elif latency > self.LatencyTarget:
+                self._decrease(_LATENCY_FACTOR)
+            else:
+                # Concurrency increases by one per round of successful requests,
+                # and the rate increases by a fixed step per second of them
+                self.Limit = min(self.MaxConcurrency, self.Limit + 1 / self.Limit)
+
+                if self.MaxRate > 0:
+                    rate = self.Bucket.Rate
+                    step = max(self.MaxRate * _RATE_STEP, 1.0)
+
+                    # Rates near the last throttled rate are probed slowly
+                    if rate >= self._Throttled * 0.9:
+                        step *= _PROBE_FACTOR
+
+                    self.Bucket.Rate = min(self.MaxRate, rate + step / rate)
+
+            self._Cond.notify_all()
+
+    def _decrease(self, factor: float, adapt_rate: bool = False) -> void_t:
+        """
+        Multiplicatively decrease the concurrency limit (and optionally the request
+        rate), at most once per decrease interval so that the responses of requests
+        sent before a decrease do not decrease it again.
+        """
+        now = time.monotonic()
+
+        if now - self._Decreased < _DECREASE_INTERVAL:
+            return
+
+        self._Decreased = now
+        self.Limit = max(1.0, self.Limit * factor)
+
+        if adapt_rate and self.MaxRate > 0:
+            self._Throttled = self.Bucket.Rate
+            self.Bucket.Rate = max(_MIN_RATE, self.Bucket.Rate * factor)
+
+    def _pause(self, delay: float) -> void_t:
+        """
+        Pause all requests for the given number of seconds.
+        """
+        with self._Cond:
+            self._Resume = max(self._Resume, time.monotonic() + delay)
+
+
+# Module export symbols
+__all__ = ["RETRY_STATUSES", "RequestScheduler", "THROTTLE_STATUSES", "TokenBucket"]
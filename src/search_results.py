@@ -0,0 +1,115 @@
+"""
+Lazy paginated search result iterator module.
+"""
+from collections import deque
+from types import TracebackType
+from typing import Iterator
+from alias import void_t
+from spec_metadata import SpecMetadata
+
+
+class SearchResults:
+    """
+    Lazy search result iterator that fetches and parses result pages on demand,
+    and stops fetching pages once its result limit is reached or it is closed.
+    """
+    def __init__(self, limit: int = 0) -> None:
+        """
+        Initialize the object.
+        """
+        self.Limit: int = max(limit, 0)  # Maximum result count (0 for unlimited)
+        self.Total: int | None = None    # Total result count hint (once known)
+        self.Count: int = 0              # Produced result count
+
+        self._Source: Iterator[SpecMetadata] | None = None
+        self._Buffer: deque[SpecMetadata] = deque()
+
+    def __enter__(self) -> "SearchResults":
+        """
+        Enter the runtime context of the object.
+        """
+        return self
+
+    def __exit__(self,
+                 exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> void_t:
+        """
+        Exit the runtime context of the object and stop fetching result pages.
+        """
+        self.close()
+
+    def __iter__(self) -> Iterator[SpecMetadata]:
+        """
+        Get an iterator over the remaining results.
+        """
+        return self
+
+    def __next__(self) -> SpecMetadata:
+        """
+        Get the next result, fetching the next result page if necessary.
+        """
+        if self.Limit and self.Count >= self.Limit:
+            self.close()
+            raise StopIteration
+
+        spec = self._Buffer.popleft() if self._Buffer else self._next()
+
+        if spec is None:
+            self.Total = self.Count if self.Total is None else self.Total
+            self._Source = None
+            raise StopIteration
+
+        self.Count += 1
+        return spec
+
+    def __len__(self) -> int:
+        """
+        Get the number of results (limited by the result limit), parsing only as
+        much of the first result page as needed to read its total result count.
+        """
+        return self.hint()
+
+    def bind(self, source: Iterator[SpecMetadata]) -> "SearchResults":
+        """
+        Set the lazy result source, which updates the total result count hint.
+        """
+        self._Source = source
+        return self
+
+    def _next(self) -> SpecMetadata | void_t:
+        """
+        Get the next result of the lazy result source, if there is one.
+        """
+        return next(self._Source, None) if self._Source is not None else None
+
+    def hint(self) -> int:
+        """
+        Get the total result count hint (limited by the result limit), buffering
+        results until the total result count is known. Results are only fully
+        buffered if the total result count is never reported.
+        """
+        while self.Total is None and self._Source is not None:
+            if (spec := self._next()) is None:
+                self.Total = self.Count + len(self._Buffer)
+                break
+
+            self._Buffer.append(spec)
+
+        total = self.Total if self.Total is not None else self.Count + len(self._Buffer)
+        return min(total, self.Limit) if self.Limit else total
+
+    def close(self) -> void_t:
+        """
+        Stop fetching result pages and discard any buffered results.
+        """
+        self._Buffer.clear()
+
+        # Closing the source generator cancels its pending page requests
+        if self._Source is not None:
+            getattr(self._Source, "close", lambda: None)()
+            self._Source = None
+
+
+# Module export symbols
+__all__ = ["SearchResults"]
@@ -2,12 +2,28 @@
 RFC specification metadata module.
 """
 import json
+from alias import any_t
 
 
 class SpecMetadata:
     """
     RFC specification metadata.
     """
+    # Field names in serialization order
+    FIELDS: tuple[str, ...] = (
+        "Id",
+        "Files",
+        "Title",
+        "Authors",
+        "Date",
+        "MoreInfo",
+        "Status",
+        "InfoUrl",
+        "TxtUrl"
+    )
+
+    __slots__ = FIELDS
+
     def __init__(self,
                  rfc_id: int = 0,
                  files: dict[str, str] | None = None,
@@ -37,11 +53,29 @@ class SpecMetadata:
         """
         return f'"rfc{self.Id}": {self.json()}'
 
+    @staticmethod
+    def from_dict(data: dict[str, any_t]) -> "SpecMetadata":
+        """
+        Create specification metadata from a dictionary of its fields.
+        """
+        spec = SpecMetadata()
+
+        for name in [n for n in SpecMetadata.FIELDS if n in data]:
+            setattr(spec, name, data[name])
+
+        return spec
+
+    def dict(self) -> dict[str, any_t]:
+        """
+        Get a dictionary of the specification metadata fields.
+        """
+        return {n: getattr(self, n) for n in SpecMetadata.FIELDS}
+
     def json(self, indent: int = 4) -> str:
         """
         Get the specification metadata as a JSON string.
         """
-        return json.dumps(self.__dict__, indent=abs(indent))
+        return json.dumps(self.dict(), indent=abs(indent))
 
 
 # Module export symbols
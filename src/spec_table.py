@@ -0,0 +1,364 @@
+"""
+Compact columnar RFC specification metadata storage module.
+"""
+import bisect
+import json
+import struct
+import utils
+from array import array
+from typing import Iterator
+from alias import any_t, void_t
+from binary_index import BinaryIndex
+from spec_metadata import SpecMetadata
+
+# Canonical file names mapped to RFC Editor file extensions, in bit flag order
+FILE_EXTS: dict[str, str] = {
+    "TEXT": "txt",
+    "HTML": "html",
+    "PDF": "pdf",
+    "PS": "ps",
+    "XML": "xml"
+}
+
+_NO_ROW: int = -1  # Missing RFC number row position
+
+# Binary table record (file format bit flags, 'Title', 'Authors', 'Date', 'MoreInfo'
+# and 'Status' string codes), stored in RFC number order
+_RECORD: struct.Struct = struct.Struct("=B3xIIIII")
+
+
+class StringPool:
+    """
+    Dictionary-encoded string storage that maps each distinct string to a code.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the object.
+        """
+        self._Strings: list[str] = [str()]        # Distinct strings by code
+        self._Codes: dict[str, int] = {str(): 0}  # String codes by string
+
+    def __getitem__(self, code: int) -> str:
+        """
+        Get the string of the given code.
+        """
+        return self._Strings[code]
+
+    def __len__(self) -> int:
+        """
+        Get the number of distinct strings.
+        """
+        return len(self._Strings)
+
+    def encode(self, value: str) -> int:
+        """
+        Get the code of the given string, adding it to the pool if necessary.
+        """
+        code = self._Codes.get(value)
+
+        if code is None:
+            code = len(self._Strings)
+            self._Strings.append(value)
+            self._Codes[value] = code
+
+        return code
+
+
+class SpecTable:
+    """
+    Columnar RFC specification metadata table. String fields are dictionary-encoded
+    into a shared string pool, and canonical RFC Editor URLs are derived from the
+    RFC number instead of being stored.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the object.
+        """
+        self.Strings: StringPool = StringPool()  # Shared string pool
+
+        self._Ids: array[int] = array("I")       # RFC numbers
+        self._Formats: array[int] = array("B")   # Canonical file format bit flags
+        self._Titles: array[int] = array("I")    # 'Title' string codes
+        self._Authors: array[int] = array("I")   # 'Authors' string codes
+        self._Dates: array[int] = array("I")     # 'Date' string codes
+        self._MoreInfo: array[int] = array("I")  # 'MoreInfo' string codes
+        self._Status: array[int] = array("I")    # 'Status' string codes
+        self._Rows: array[int] = array("i")      # Row positions by RFC number
+
+        # Non-canonical URL fields by row position
+        self._Extras: dict[int, dict[str, any_t]] = dict[int, dict[str, any_t]]()
+
+    def __contains__(self, rfc_id: int) -> bool:
+        """
+        Determine whether the table contains the given RFC number.
+        """
+        return self._row_pos(rfc_id) != _NO_ROW
+
+    def __iter__(self) -> Iterator[SpecMetadata]:
+        """
+        Get an iterator over the table rows in RFC number order.
+        """
+        return (self.row(p) for p in self._Rows if p != _NO_ROW)
+
+    def __len__(self) -> int:
+        """
+        Get the number of table rows.
+        """
+        return len(self._Ids)
+
+    @staticmethod
+    def _file_url(rfc_id: int, name: str) -> str:
+        """
+        Get the canonical RFC Editor URL of the given specification file.
+        """
+        return f"{utils.editor_url()}/rfc/rfc{rfc_id}.{FILE_EXTS[name]}"
+
+    @staticmethod
+    def _info_url(rfc_id: int) -> str:
+        """
+        Get the canonical RFC Editor information page URL of the given specification.
+        """
+        return f"{utils.editor_url()}/info/rfc{rfc_id}"
+
+    def _row_pos(self, rfc_id: int) -> int:
+        """
+        Get the row position of the given RFC number.
+        """
+        return self._Rows[rfc_id] if 0 < rfc_id < len(self._Rows) else _NO_ROW
+
+    def get(self, rfc_id: int) -> SpecMetadata | void_t:
+        """
+        Get the specification metadata row of the given RFC number.
+        """
+        pos = self._row_pos(rfc_id)
+        return self.row(pos) if pos != _NO_ROW else None
+
+    def last(self) -> SpecMetadata | void_t:
+        """
+        Get the specification metadata row with the largest RFC number.
+        """
+        for pos in reversed(self._Rows):
+            if pos != _NO_ROW:
+                return self.row(pos)
+
+        return None
+
+    def row(self, pos: int) -> SpecMetadata:
+        """
+        Get the specification metadata row at the given row position.
+        """
+        columns = [self._Titles, self._Authors, self._Dates, self._MoreInfo, self._Status]
+
+        return SpecTable._make_row(self._Ids[pos],
+                                   self._Formats[pos],
+                                   [self.Strings[c[pos]] for c in columns],
+                                   self._Extras.get(pos, dict[str, any_t]()))
+
+    @staticmethod
+    def _make_row(rfc_id: int,
+                  formats: int,
+                  fields: list[str],
+                  extras: dict[str, any_t]) -> SpecMetadata:
+        """
+        Create specification metadata from the given RFC number, file format
+        bit flags, string fields and non-canonical URL fields.
+        """
+        files = dict[str, str]()
+
+        for bit, name in enumerate(FILE_EXTS):
+            if formats & (1 << bit):
+                files[name] = SpecTable._file_url(rfc_id, name)
+
+        files.update(extras.get("Files", dict[str, str]()))
+        title, authors, date, more_info, status = fields
+
+        return SpecMetadata(rfc_id=rfc_id,
+                            files=files,
+                            title=title,
+                            authors=authors,
+                            date=date,
+                            more_info=more_info,
+                            status=status,
+                            txt_url=extras.get("TxtUrl", files.get("TEXT", str())),
+                            info_url=extras.get("InfoUrl", SpecTable._info_url(rfc_id)))
+
+    def add(self, spec: SpecMetadata) -> void_t:
+        """
+        Add the given specification metadata, replacing any existing row
+        with the same RFC number.
+        """
+        if spec.Id <= 0:
+            raise ValueError(f"Invalid RFC number: {spec.Id}")
+
+        formats = 0
+        extras = dict[str, any_t]()
+
+        for name, url in spec.Files.items():
+            if name in FILE_EXTS and url == SpecTable._file_url(spec.Id, name):
+                formats |= 1 << list(FILE_EXTS).index(name)
+            else:
+                extras.setdefault("Files", dict[str, str]())[name] = url
+
+        if spec.TxtUrl != spec.Files.get("TEXT", str()):
+            extras["TxtUrl"] = spec.TxtUrl
+
+        if spec.InfoUrl != SpecTable._info_url(spec.Id):
+            extras["InfoUrl"] = spec.InfoUrl
+
+        columns = [
+            (self._Formats, formats),
+            (self._Titles, self.Strings.encode(spec.Title)),
+            (self._Authors, self.Strings.encode(spec.Authors)),
+            (self._Dates, self.Strings.encode(spec.Date)),
+            (self._MoreInfo, self.Strings.encode(spec.MoreInfo)),
+            (self._Status, self.Strings.encode(spec.Status))
+        ]
+        pos = self._row_pos(spec.Id)
+
+        if pos == _NO_ROW:
+            pos = len(self._Ids)
+            self._Ids.append(spec.Id)
+
+            for column, value in columns:
+                column.append(value)
+
+            if spec.Id >= len(self._Rows):
+                self._Rows.extend([_NO_ROW] * (spec.Id + 1 - len(self._Rows)))
+            self._Rows[spec.Id] = pos
+        else:
+            for column, value in columns:
+                column[pos] = value
+
+        if extras:
+            self._Extras[pos] = extras
+        else:
+            self._Extras.pop(pos, None)
+
+    def pack(self) -> list[bytes]:
+        """
+        Get the binary table sections of the table rows in RFC number order.
+        Strings are re-encoded so that replaced strings are not written.
+        """
+        ids = array("I")
+        records = bytearray()
+        strings = StringPool()
+        extras = dict[str, dict[str, any_t]]()
+        columns = [self._Titles, self._Authors, self._Dates, self._MoreInfo, self._Status]
+
+        for pos in self._Rows:
+            if pos == _NO_ROW:
+                continue
+
+            if pos in self._Extras:
+                extras[str(len(ids))] = self._Extras[pos]
+
+            ids.append(self._Ids[pos])
+            codes = [strings.encode(self.Strings[c[pos]]) for c in columns]
+            records.extend(_RECORD.pack(self._Formats[pos], *codes))
+
+        offsets = array("I", [0])
+        data = bytearray()
+
+        for code in range(len(strings)):
+            data.extend(strings[code].encode("utf-8"))
+            offsets.append(len(data))
+
+        return [
+            ids.tobytes(),
+            bytes(records),
+            offsets.tobytes(),
+            bytes(data),
+            json.dumps(extras).encode()
+        ]
+
+
+class MappedSpecTable:
+    """
+    Read-only columnar RFC specification metadata table backed by the sections of
+    a memory-mapped binary index file. Rows are only decoded when they are accessed.
+    """
+    def __init__(self, index: BinaryIndex, start: int = 0) -> None:
+        """
+        Initialize the object.
+        """
+        self._Ids: memoryview = index.table(start, "I")          # RFC numbers
+        self._Records: memoryview = index.section(start + 1)     # Fixed-width records
+        self._Offsets: memoryview = index.table(start + 2, "I")  # String data offsets
+        self._Strings: memoryview = index.section(start + 3)     # UTF-8 string data
+        self._Extras: memoryview = index.section(start + 4)      # Non-canonical URL fields
+
+        self._ExtrasCache: dict[str, dict[str, any_t]] | None = None
+
+    def __contains__(self, rfc_id: int) -> bool:
+        """
+        Determine whether the table contains the given RFC number.
+        """
+        return self._row_pos(rfc_id) != _NO_ROW
+
+    def __iter__(self) -> Iterator[SpecMetadata]:
+        """
+        Get an iterator over the table rows in RFC number order.
+        """
+        return (self.row(p) for p in range(len(self._Ids)))
+
+    def __len__(self) -> int:
+        """
+        Get the number of table rows.
+        """
+        return len(self._Ids)
+
+    def _row_pos(self, rfc_id: int) -> int:
+        """
+        Get the row position of the given RFC number.
+        """
+        pos = bisect.bisect_left(self._Ids, rfc_id)
+        return pos if pos < len(self._Ids) and self._Ids[pos] == rfc_id else _NO_ROW
+
+    def _string(self, code: int) -> str:
+        """
+        Decode the string of the given code.
+        """
+        return str(self._Strings[self._Offsets[code]:self._Offsets[code + 1]], "utf-8")
+
+    def get(self, rfc_id: int) -> SpecMetadata | void_t:
+        """
+        Get the specification metadata row of the given RFC number.
+        """
+        pos = self._row_pos(rfc_id)
+        return self.row(pos) if pos != _NO_ROW else None
+
+    def last(self) -> SpecMetadata | void_t:
+        """
+        Get the specification metadata row with the largest RFC number.
+        """
+        return self.row(len(self._Ids) - 1) if len(self._Ids) else None
+
+    def row(self, pos: int) -> SpecMetadata:
+        """
+        Get the specification metadata row at the given row position.
+        """
+        formats, *codes = _RECORD.unpack_from(self._Records, pos * _RECORD.size)
+
+        # Non-canonical URL fields are rare, so they are only parsed once needed
+        if self._ExtrasCache is None:
+            self._ExtrasCache = json.loads(str(self._Extras, "utf-8"))
+
+        return SpecTable._make_row(self._Ids[pos],
+                                   formats,
+                                   [self._string(c) for c in codes],
+                                   self._ExtrasCache.get(str(pos), dict[str, any_t]()))
+
+    def unpack(self) -> SpecTable:
+        """
+        Get a modifiable copy of the table.
+        """
+        table = SpecTable()
+
+        for spec in self:
+            table.add(spec)
+
+        return table
+
+
+# Module export symbols
+__all__ = ["FILE_EXTS", "MappedSpecTable", "SpecTable", "StringPool"]
@@ -0,0 +1,364 @@
+"""
+Resumable RFC specification corpus mirror module.
+"""
+import base64
+import hashlib
+import json
+import os
+import time
+import requests
+import utils
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Iterable
+from alias import any_t, void_t
+from crawler import Crawler
+from spec_metadata import SpecMetadata
+
+# Default age (in seconds) after which mirrored files are revalidated
+DEFAULT_REVALIDATE_AGE: int = 30 * 24 * 60 * 60
+
+_MANIFEST_VERSION: int = 1     # Manifest file format version
+_CHUNK_SIZE: int = 64 * 1024   # Download content chunk size (in bytes)
+_SAVE_INTERVAL: int = 100      # Completed downloads between manifest saves
+
+
+class SyncStats:
+    """
+    Corpus mirror synchronization statistics.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the object.
+        """
+        self.Fetched: int = 0    # Files downloaded (fully or resumed)
+        self.Unchanged: int = 0  # Files that were already up to date
+        self.Failed: int = 0     # Files that could not be downloaded or verified
+        self.Bytes: int = 0      # Total bytes downloaded
+
+    def __repr__(self) -> str:
+        """
+        Get the string representation of the object.
+        """
+        return f"{self.__class__.__name__}({json.dumps(vars(self))})"
+
+
+class CorpusMirror:
+    """
+    Local mirror of RFC specification files with an incremental sync manifest.
+    """
+    def __init__(self,
+                 crawler: Crawler,
+                 path: str = str(),
+                 formats: Iterable[str] = ("TEXT",),
+                 base_url: str = str(),
+                 revalidate_age: int = DEFAULT_REVALIDATE_AGE,
+                 verify: bool = False) -> None:
+        """
+        Initialize the object.
+        """
+        self.Crawler: Crawler = crawler                        # Download HTTP crawler
+        self.Path: str = path if path else utils.corpus_dir()  # Mirror directory
+        self.Formats: list[str] = list(formats)                # Mirrored file formats
+        self.BaseUrl: str = base_url                           # Alternate base URL
+        self.RevalidateAge: int = revalidate_age               # Revalidation age (seconds)
+        self.Verify: bool = verify                             # Verify file checksums
+
+        self._Manifest: dict[str, dict[str, any_t]] = dict[str, dict[str, any_t]]()
+        self._Partial: dict[str, str] = dict[str, str]()
+        self._Lock: Lock = Lock()
+        self._Pending: int = 0
+
+    def manifest_path(self) -> str:
+        """
+        Get the sync manifest file path.
+        """
+        return os.path.join(self.Path, "manifest.json")
+
+    @staticmethod
+    def _sha256(path: str) -> str:
+        """
+        Get the SHA-256 checksum (hex digest) of the given file.
+        """
+        digest = hashlib.sha256()
+
+        with open(path, "rb") as file:
+            while chunk := file.read(_CHUNK_SIZE):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def _load_manifest(self) -> void_t:
+        """
+        Load the sync manifest from the mirror directory, if it exists.
+        """
+        self._Manifest.clear()
+        self._Partial.clear()
+
+        if os.path.isfile(self.manifest_path()):
+            with open(self.manifest_path(), "r", encoding="utf-8") as file:
+                data = json.load(file)
+
+            if data.get("version") == _MANIFEST_VERSION:
+                self._Manifest.update(data["files"])
+                self._Partial.update(data.get("partial", {}))
+
+    def _save_manifest(self) -> void_t:
+        """
+        Atomically write the sync manifest to the mirror directory.
+        """
+        temp_path = utils.temp_path(self.manifest_path())
+
+        with self._Lock:
+            data = {
+                "version": _MANIFEST_VERSION,
+                "files": self._Manifest,
+                "partial": self._Partial
+            }
+
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=1, sort_keys=True)
+
+            os.replace(temp_path, self.manifest_path())
+
+    def _file_urls(self, specs: Iterable[SpecMetadata]) -> dict[str, str]:
+        """
+        Get the mirrored file names mapped to their download URLs.
+        """
+        urls = dict[str, str]()
+
+        for spec in specs:
+            for name in [f for f in self.Formats if f in spec.Files]:
+                url = spec.Files[name]
+
+                if self.BaseUrl and url.startswith(utils.editor_url()):
+                    url = f"{self.BaseUrl.rstrip('/')}{url[len(utils.editor_url()):]}"
+
+                urls[url.rsplit("/", 1)[-1]] = url
+
+        return urls
+
+    def _is_current(self, name: str) -> bool:
+        """
+        Determine whether the given mirrored file matches its manifest entry
+        and does not need to be revalidated with the server.
+        """
+        entry = self._Manifest.get(name)
+        path = os.path.join(self.Path, name)
+
+        if entry is None or not os.path.isfile(path):
+            return False
+
+        if os.path.getsize(path) != entry["size"]:
+            return False
+
+        if self.Verify and CorpusMirror._sha256(path) != entry["sha256"]:
+            return False
+
+        return time.time() - float(entry["synced"]) <= self.RevalidateAge
+
+    def sync(self, specs: Iterable[SpecMetadata]) -> SyncStats:
+        """
+        Download all new or changed files of the given specifications using
+        bounded parallel downloads. Get the synchronization statistics.
+        """
+        os.makedirs(self.Path, exist_ok=True)
+        self._load_manifest()
+
+        stats = SyncStats()
+        urls = self._file_urls(specs)
+        names = [(n, u) for n, u in urls.items() if not self._is_current(n)]
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.Crawler.Pool.MaxWorkers) as executor:
+                for result in executor.map(lambda i: self._sync_file(*i), names):
+                    if result is None:
+                        stats.Failed += 1
+                    elif result < 0:
+                        stats.Unchanged += 1
+                    else:
+                        stats.Fetched += 1
+                        stats.Bytes += result
+
+            stats.Unchanged += len(urls) - len(names)
+        finally:
+            self._save_manifest()
+
+        return stats
+
+    def _sync_file(self, name: str, url: str) -> int | void_t:
+        """
+        Download the given file if it is new or changed, resuming any partial
+        download that is still current. Get the number of downloaded bytes, a
+        negative number if the file is unchanged, or None if the download failed.
+        """
+        path = os.path.join(self.Path, name)
+        part_path = f"{path}.part"
+        entry = self._Manifest.get(name)
+        headers = dict[str, str]()
+
+        offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+        validator = self._partial(name)
+
+        # Partial files can only be resumed if they are known to be current
+        if offset and not validator:
+            os.remove(part_path)
+            offset = 0
+
+        # Conditional requests and range requests are mutually exclusive
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+
+        elif entry is not None and os.path.isfile(path):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            with self.Crawler.fetch(url, headers, stream=True) as response:
+                if response.status_code == 304 and entry is not None:
+                    self._record(name, entry)
+                    return -1
+
+                # Partial file is already complete (or longer than the file)
+                if response.status_code == 416 and offset:
+                    restart = True
+
+                elif response.status_code not in [200, 206]:
+                    return None
+
+                else:
+                    restart = False
+
+                    # Servers that ignore the range request send the full file
+                    if response.status_code == 200:
+                        offset = 0
+
+                    self._set_partial(name, CorpusMirror._validator(response))
+                    size = self._download(response, part_path, offset)
+
+            if restart:
+                os.remove(part_path)
+                self._set_partial(name, str())
+                return self._sync_file(name, url)
+
+            sha256 = CorpusMirror._sha256(part_path)
+            expected = CorpusMirror._server_digest(response)
+
+            # Corrupt downloads must be fetched again from the start
+            if expected and sha256 != expected:
+                os.remove(part_path)
+                self._set_partial(name, str())
+                return None
+
+            os.replace(part_path, path)
+            self._set_partial(name, str())
+
+        except (OSError, requests.RequestException):
+            return None
+
+        self._record(name, {
+            "size": os.path.getsize(path),
+            "sha256": sha256,
+            "etag": response.headers.get("ETag", str()),
+            "last_modified": response.headers.get("Last-Modified", str())
+        })
+        return size
+
+    def _partial(self, name: str) -> str:
+        """
+        Get the range request validator of the given file's partial download,
+        or an empty string if it has none.
+        """
+        with self._Lock:
+            return self._Partial.get(name, str())
+
+    def _set_partial(self, name: str, validator: str) -> void_t:
+        """
+        Set the range request validator of the given file's partial download,
+        removing it if the given validator is empty.
+        """
+        with self._Lock:
+            if validator:
+                self._Partial[name] = validator
+            else:
+                self._Partial.pop(name, None)
+
+    @staticmethod
+    def _validator(response: requests.Response) -> str:
+        """
+        Get the validator of the given response that can be used to resume its
+        download with a range request, or an empty string if it has none.
+        """
+        etag = response.headers.get("ETag", str())
+
+        # Range requests can only be conditional on strong entity tags
+        if etag and not etag.startswith("W/"):
+            return etag
+
+        return response.headers.get("Last-Modified", str())
+
+    @staticmethod
+    def _server_digest(response: requests.Response) -> str:
+        """
+        Get the SHA-256 checksum (hex digest) of the complete file provided by
+        the server in the given response, or an empty string if it has none.
+        """
+        # Representation digests cover the complete file, even for range responses
+        for header, sep in [("Repr-Digest", ":"), ("Digest", "")]:
+            for field in response.headers.get(header, str()).split(","):
+                algorithm, _, value = field.strip().partition("=")
+
+                if algorithm.lower() == "sha-256" and value:
+                    try:
+                        return base64.b64decode(value.strip(sep), validate=True).hex()
+                    except ValueError:
+                        return str()
+
+        return str()
+
+    @staticmethod
+    def _download(response: requests.Response, part_path: str, offset: int) -> int:
+        """
+        Write the given streamed response content to the given partial file,
+        appending to it from the given offset. Get the number of written bytes.
+        """
+        written = 0
+        expected = response.headers.get("Content-Length")
+
+        # Decoded content length only matches for uncompressed responses
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            expected = None
+
+        with open(part_path, "ab" if offset else "wb") as file:
+            for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                file.write(chunk)
+                written += len(chunk)
+
+        if expected is not None and written != int(expected):
+            raise OSError(f"Incomplete download of '{response.url}': {written}/{expected}")
+
+        return written
+
+    def _record(self, name: str, entry: dict[str, any_t]) -> void_t:
+        """
+        Update the manifest entry of the given file and periodically save
+        the manifest so that interrupted syncs keep their progress.
+        """
+        with self._Lock:
+            self._Manifest[name] = dict(entry, synced=time.time())
+            self._Pending += 1
+            save = self._Pending >= _SAVE_INTERVAL
+
+            if save:
+                self._Pending = 0
+
+        if save:
+            self._save_manifest()
+
+
+# Module export symbols
+__all__ = ["CorpusMirror", "DEFAULT_REVALIDATE_AGE", "SyncStats"]
@@ -0,0 +1,242 @@
+"""
+Paged fixed-width search result table writer module.
+"""
+import os
+import shutil
+import time
+import timings
+from types import TracebackType
+from typing import TYPE_CHECKING, TextIO, cast
+from alias import void_t
+from result_writer import ResultWriter
+from spec_metadata import SpecMetadata
+
+# Pager processes are only created for interactive output that exceeds the screen
+if TYPE_CHECKING:
+    from subprocess import Popen
+
+# Default maximum number of rows sampled to compute the column widths
+DEFAULT_SAMPLE_SIZE: int = 256
+
+# Default pager command when '$PAGER' is unset
+DEFAULT_PAGER: str = "more" if os.name == "nt" else "less"
+
+# Table column headers
+_HEADERS: tuple[str, ...] = ("RFC", "Title", "Authors", "Date", "Status")
+
+_SEPARATOR: str = "  "        # Column separator
+_ELLIPSIS: str = "..."        # Truncated cell suffix
+_ID_WIDTH: int = 5            # Minimum 'RFC' column width (largest RFC number digits)
+_MIN_WIDTH: int = 8           # Minimum truncated column width
+_MAX_DATE: int = 14           # Maximum 'Date' column width
+_MAX_STATUS: int = 22         # Maximum 'Status' column width
+_CHUNK_ROWS: int = 512        # Maximum rows per output write
+_FLUSH_INTERVAL: float = 0.1  # Maximum interactive output delay (seconds)
+
+
+class TableWriter(ResultWriter):
+    """
+    Search result writer that renders specifications as a fixed-width table. Column
+    widths are computed once from a bounded sample of the first rows, 'Title' and
+    'Authors' are truncated to the terminal width, and rows are written in large
+    chunks, through '$PAGER' if interactive output does not fit on the screen.
+    """
+    def __init__(self,
+                 stream: TextIO | None = None,
+                 width: int = 0,
+                 height: int = 0,
+                 pager: str | None = None,
+                 sample_size: int = DEFAULT_SAMPLE_SIZE) -> None:
+        """
+        Initialize the object.
+        """
+        super().__init__("text", stream)
+        size = shutil.get_terminal_size()
+
+        self.Width: int = width or size.columns     # Table width (in characters)
+        self.Height: int = height or size.lines     # Screen height (in lines)
+        self.SampleSize: int = max(sample_size, 1)  # Maximum layout sample rows
+        self.Paged: bool = False                    # Whether output is paged
+
+        # Output is only paged on interactive terminals (an empty pager disables paging)
+        if pager is None:
+            pager = os.environ.get("PAGER", DEFAULT_PAGER) if self._Interactive else str()
+
+        self.Pager: str = pager  # Pager command line
+
+        self._Widths: list[int] | None = None
+        self._Sample: list[SpecMetadata] = list[SpecMetadata]()
+        self._Lines: list[str] = list[str]()
+        self._Flushed: float = time.monotonic()
+        self._Process: "Popen[str] | None" = None
+
+    def __exit__(self,
+                 exc_type: type[BaseException] | None,
+                 exc_value: BaseException | None,
+                 traceback: TracebackType | None) -> void_t:
+        """
+        Exit the runtime context of the object, flush the written results and
+        wait until the pager (if any) exits.
+        """
+        try:
+            super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._close_pager()
+
+    def write(self, spec: SpecMetadata) -> void_t:
+        """
+        Format the given specification as a table row and write it to the output
+        buffer, once the column widths have been computed from the sample rows.
+        """
+        with timings.span("console"):
+            if self._Widths is None:
+                self._Sample.append(spec)
+
+                if len(self._Sample) >= self.SampleSize or self._overdue():
+                    self._layout()
+            else:
+                self._Lines.append(self._row(spec))
+
+                if len(self._Lines) >= _CHUNK_ROWS or self._overdue():
+                    self._write_lines()
+
+        self.Count += 1
+
+    def close(self) -> void_t:
+        """
+        Write the remaining rows and flush the output buffer.
+        """
+        if not self._Closed:
+            with timings.span("console"):
+                if self._Widths is None and self._Sample:
+                    self._layout()
+                self._write_lines()
+
+        super().close()
+        self._close_pager()
+
+    def _overdue(self) -> bool:
+        """
+        Determine whether interactive output was delayed for longer than the flush interval.
+        """
+        return self._Interactive and time.monotonic() - self._Flushed > _FLUSH_INTERVAL
+
+    def _layout(self) -> void_t:
+        """
+        Compute the column widths from the sample rows in a single pass,
+        then write the table header and sample rows.
+        """
+        widths = [len(h) for h in _HEADERS]
+
+        for spec in self._Sample:
+            cells = [str(spec.Id), spec.Title, spec.Authors, spec.Date, spec.Status]
+            widths = [max(w, len(c)) for w, c in zip(widths, cells)]
+
+        # Later rows may have larger RFC numbers than the sample rows
+        widths[0] = max(widths[0], _ID_WIDTH)
+        widths[3] = min(widths[3], _MAX_DATE)
+        widths[4] = min(widths[4], _MAX_STATUS)
+
+        # 'Title' and 'Authors' share the remaining width, with 'Authors' limited to a third
+        remaining = self.Width - widths[0] - widths[3] - widths[4] - len(_SEPARATOR) * 4 - 1
+
+        if widths[1] + widths[2] > remaining:
+            author_width = min(widths[2], max(remaining // 3, remaining - widths[1]))
+            widths[2] = max(author_width, _MIN_WIDTH)
+            widths[1] = max(remaining - widths[2], _MIN_WIDTH)
+
+        self._Widths = widths
+        self._Lines = [
+            self._format(_HEADERS),
+            self._format(tuple(["-" * w for w in widths])),
+            *[self._row(s) for s in self._Sample]
+        ]
+
+        if self.Pager and len(self._Lines) > self.Height - 1:
+            self._start_pager()
+
+        self._Sample.clear()
+        self._write_lines()
+
+    def _row(self, spec: SpecMetadata) -> str:
+        """
+        Format the given specification as a table row.
+        """
+        cells = (str(spec.Id), spec.Title, spec.Authors, spec.Date, spec.Status)
+        return self._format(cells)
+
+    def _format(self, cells: tuple[str, ...]) -> str:
+        """
+        Format the given cells as a table line, truncating
+        the cells that exceed their width.
+        """
+        widths = self._Widths or [len(c) for c in cells]
+        fitted = list[str]()
+
+        for cell, width in zip(cells, widths):
+            if len(cell) > width:
+                cell = f"{cell[:max(width - len(_ELLIPSIS), 0)]}{_ELLIPSIS}"
+            fitted.append(cell.ljust(width))
+
+        return f"{_SEPARATOR.join(fitted).rstrip()}\n"
+
+    def _write_lines(self) -> void_t:
+        """
+        Write the pending table lines in a single write.
+        """
+        if self._Lines:
+            self._Stream.write("".join(self._Lines))
+            self._Lines.clear()
+
+        # Paged and interactive output is shown as soon as each chunk is written
+        if self.Paged or self._Interactive:
+            self._Stream.flush()
+
+        self._Flushed = time.monotonic()
+
+    def _start_pager(self) -> void_t:
+        """
+        Redirect the table to a pager process, or leave
+        it unpaged if the pager fails to start.
+        """
+        import shlex
+        import subprocess
+
+        env = dict(os.environ)
+        env.setdefault("LESS", "FRX")
+
+        try:
+            process = subprocess.Popen(shlex.split(self.Pager, posix=os.name != "nt"),
+                                       stdin=subprocess.PIPE,
+                                       env=env,
+                                       encoding="utf-8")
+        except (OSError, ValueError):
+            return
+
+        if process.stdin is None:
+            return
+
+        self._Stream.flush()
+        self._Stream = cast(TextIO, process.stdin)
+        self._Process = process
+        self.Paged = True
+
+    def _close_pager(self) -> void_t:
+        """
+        Close the pager input stream and wait until the pager exits.
+        """
+        if self._Process is None:
+            return
+
+        # Pagers that were quit early have already closed their input stream
+        try:
+            self._Stream.close()
+        except BrokenPipeError:
+            pass
+
+        self._Process.wait()
+        self._Process = None
+
+
+# Module export symbols
+__all__ = ["DEFAULT_PAGER", "DEFAULT_SAMPLE_SIZE", "TableWriter"]
@@ -0,0 +1,336 @@
+"""
+Memory-mapped packed RFC specification text store module.
+"""
+import bisect
+import contextlib
+import mmap
+import os
+import re
+import struct
+import utils
+from array import array
+from typing import Iterable, Iterator
+from alias import any_t, section_t, void_t
+
+_STORE_MAGIC: bytes = b"RFCPACK\0"  # Store file signature
+_STORE_VERSION: int = 1             # Store file format version
+_ALIGNMENT: int = 8                 # Offset table alignment (in bytes)
+
+# Store file header (signature, version, document count, section count, table offset)
+_HEADER: struct.Struct = struct.Struct("=8sIIIQ")
+
+# Section heading line pattern (e.g., '3.10.  Title', 'Appendix A.  Title', 'A.1.  Title'),
+# excluding table of contents lines that end in dot leaders and a page number
+_SECTION_RE: re.Pattern[bytes] = re.compile(
+    rb"^(?:Appendix[ \t]+([A-Z](?:\.\d{1,3})*)\.?"
+    rb"|(\d{1,3}(?:\.\d{1,3})*)\.?"
+    rb"|([A-Z](?:\.\d{1,3})*)\.)"
+    rb"[ \t]+(?=[A-Z])(?![^\r\n]*\.{3,}[ \t]*\d+[ \t]*\r?$)",
+    re.M
+)
+
+
+class TextStore:
+    """
+    Packed RFC specification text corpus with precomputed section byte ranges,
+    read through a memory map so that sections are sliced without copying.
+    """
+    def __init__(self, path: str = str()) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path if path else TextStore.default_path()  # Store file path
+
+        self._Map: mmap.mmap | None = None
+        self._Ids: array[int] = array("I")            # Document RFC numbers
+        self._DocOffsets: array[int] = array("Q")     # Document text byte offsets
+        self._DocSections: array[int] = array("I")    # Document first section positions
+        self._SectionStarts: array[int] = array("Q")  # Section start byte offsets
+        self._SectionEnds: array[int] = array("Q")    # Section end byte offsets
+        self._NameOffsets: array[int] = array("I")    # Section name offsets into names
+        self._Names: bytes = bytes()                  # Joined section names
+
+    def __contains__(self, rfc_id: int) -> bool:
+        """
+        Determine whether the store contains the given RFC number.
+        """
+        return self._doc_pos(rfc_id) is not None
+
+    def __enter__(self) -> "TextStore":
+        """
+        Enter the runtime context.
+        """
+        return self
+
+    def __exit__(self, *args: any_t) -> void_t:
+        """
+        Exit the runtime context and close the memory map.
+        """
+        self.close()
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Get an iterator over the stored RFC numbers in ascending order.
+        """
+        return iter(self._Ids)
+
+    def __len__(self) -> int:
+        """
+        Get the number of stored documents.
+        """
+        return len(self._Ids)
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Get the default packed text store file path.
+        """
+        return os.path.join(utils.data_dir(), "corpus.pack")
+
+    @staticmethod
+    def open(path: str = str()) -> "TextStore":
+        """
+        Memory-map the packed text store, or get an empty store if none exists.
+        """
+        store = TextStore(path)
+
+        if os.path.isfile(store.Path):
+            store.load()
+
+        return store
+
+    @staticmethod
+    def find_sections(text: bytes) -> list[section_t]:
+        """
+        Get the names and byte ranges of the numbered sections in the given
+        specification text. Each section range includes its subsections.
+        """
+        headings = list[tuple[str, int]]()
+
+        for match in _SECTION_RE.finditer(text):
+            name = next(g for g in match.groups() if g).decode("ascii")
+            headings.append((name, match.start()))
+
+        sections = dict[str, tuple[int, int]]()
+
+        for pos, (name, start) in enumerate(headings):
+            end = len(text)
+
+            for next_name, next_start in headings[pos + 1:]:
+                if not next_name.startswith(f"{name}."):
+                    end = next_start
+                    break
+
+            # Body headings follow any matching table of contents lines
+            sections[name] = (start, end)
+
+        return [(n, s, e) for n, (s, e) in sections.items()]
+
+    @staticmethod
+    def split_section(text: bytes, name: str) -> memoryview | void_t:
+        """
+        Get a zero-copy view of the given section of the given unpacked specification text.
+        """
+        name = TextStore._normalize(name)
+
+        for section_name, start, end in TextStore.find_sections(text):
+            if section_name == name:
+                return memoryview(text)[start:end]
+        return None
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        """
+        Normalize the given section name (e.g., '3.10.' to '3.10', 'a.1' to 'A.1').
+        """
+        return name.strip().rstrip(".").upper()
+
+    def close(self) -> void_t:
+        """
+        Close the underlying memory map.
+        """
+        if self._Map is not None:
+            self._Map.close()
+            self._Map = None
+
+    def _doc_pos(self, rfc_id: int) -> int | void_t:
+        """
+        Get the document position of the given RFC number.
+        """
+        pos = bisect.bisect_left(self._Ids, rfc_id)
+        return pos if pos < len(self._Ids) and self._Ids[pos] == rfc_id else None
+
+    def _view(self, start: int, end: int) -> memoryview:
+        """
+        Get a zero-copy view of the given byte range of the memory map.
+        """
+        if self._Map is None:
+            raise RuntimeError("Text store is not loaded")
+
+        return memoryview(self._Map)[start:end]
+
+    def text(self, rfc_id: int) -> memoryview | void_t:
+        """
+        Get the UTF-8 text of the given RFC number.
+        """
+        pos = self._doc_pos(rfc_id)
+
+        if pos is None:
+            return None
+
+        return self._view(self._DocOffsets[pos], self._DocOffsets[pos + 1])
+
+    def sections(self, rfc_id: int) -> list[str]:
+        """
+        Get the section names of the given RFC number in document order.
+        """
+        pos = self._doc_pos(rfc_id)
+
+        if pos is None:
+            return list[str]()
+
+        start, end = self._DocSections[pos], self._DocSections[pos + 1]
+        return [self._name(p) for p in range(start, end)]
+
+    def _name(self, section_pos: int) -> str:
+        """
+        Get the name of the section at the given section position.
+        """
+        start = self._NameOffsets[section_pos]
+        return self._Names[start:self._NameOffsets[section_pos + 1]].decode("ascii")
+
+    def section(self, rfc_id: int, name: str) -> memoryview | void_t:
+        """
+        Get the UTF-8 text of the given section (e.g., '3.10') of the given RFC number.
+        """
+        pos = self._doc_pos(rfc_id)
+        name = TextStore._normalize(name)
+
+        if pos is None:
+            return None
+
+        for section_pos in range(self._DocSections[pos], self._DocSections[pos + 1]):
+            if self._name(section_pos) == name:
+                return self._view(self._SectionStarts[section_pos],
+                                  self._SectionEnds[section_pos])
+        return None
+
+    def build(self, documents: Iterable[tuple[int, str]]) -> int:
+        """
+        Pack the given RFC number and text pairs (in ascending RFC number order)
+        into the store file, replacing all existing documents. Get the number
+        of stored documents.
+        """
+        encoded = ((i, t.encode("utf-8")) for i, t in documents)
+        return self.pack((i, d, TextStore.find_sections(d)) for i, d in encoded)
+
+    def pack(self, documents: Iterable[tuple[int, bytes, list[section_t]]]) -> int:
+        """
+        Pack the given RFC number, UTF-8 text and precomputed section tuples (in
+        ascending RFC number order) into the store file, replacing all existing
+        documents. Get the number of stored documents.
+        """
+        ids = array("I")
+        doc_offsets = array("Q")
+        doc_sections = array("I", [0])
+        section_starts = array("Q")
+        section_ends = array("Q")
+        name_offsets = array("I", [0])
+        names = bytearray()
+
+        self.close()
+        os.makedirs(os.path.dirname(self.Path), exist_ok=True)
+        temp_path = utils.temp_path(self.Path)
+
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(bytes(_HEADER.size))
+                offset = _HEADER.size
+
+                for rfc_id, data, sections in documents:
+                    if ids and rfc_id <= ids[-1]:
+                        raise ValueError(f"RFC {rfc_id} was added out of order")
+
+                    for name, start, end in sections:
+                        section_starts.append(offset + start)
+                        section_ends.append(offset + end)
+                        names.extend(name.encode("ascii"))
+                        name_offsets.append(len(names))
+
+                    ids.append(rfc_id)
+                    doc_offsets.append(offset)
+                    doc_sections.append(len(section_starts))
+
+                    file.write(data)
+                    offset += len(data)
+
+                doc_offsets.append(offset)
+
+                padding = -offset % _ALIGNMENT
+                file.write(bytes(padding))
+
+                for table in [ids, doc_offsets, doc_sections,
+                              section_starts, section_ends, name_offsets]:
+                    file.write(table.tobytes())
+                file.write(names)
+
+                file.seek(0)
+                file.write(_HEADER.pack(_STORE_MAGIC,
+                                        _STORE_VERSION,
+                                        len(ids),
+                                        len(section_starts),
+                                        offset + padding))
+
+                # Data must be on disk before the rename, or a crash can empty the store
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(temp_path, self.Path)
+
+        # Temporary file names are unique, so failed writes must remove their own
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
+
+        self.load()
+
+        return len(self._Ids)
+
+    def load(self) -> void_t:
+        """
+        Memory-map the underlying store file and load its offset tables.
+        """
+        self.close()
+
+        with open(self.Path, "rb") as file:
+            store_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, doc_count, section_count, offset = _HEADER.unpack_from(store_map)
+
+        if magic != _STORE_MAGIC or version != _STORE_VERSION:
+            store_map.close()
+            raise RuntimeError(f"Unsupported text store file: {self.Path}")
+
+        tables = [
+            (self._Ids, doc_count),
+            (self._DocOffsets, doc_count + 1),
+            (self._DocSections, doc_count + 1),
+            (self._SectionStarts, section_count),
+            (self._SectionEnds, section_count),
+            (self._NameOffsets, section_count + 1)
+        ]
+
+        # Offset tables are small, so only the text remains memory-mapped
+        for table, count in tables:
+            size = count * table.itemsize
+            del table[:]
+            table.frombytes(store_map[offset:offset + size])
+            offset += size
+
+        self._Names = store_map[offset:]
+        self._Map = store_map
+
+
+# Module export symbols
+__all__ = ["TextStore"]
@@ -0,0 +1,196 @@
+"""
+Lightweight named timing span instrumentation module.
+"""
+import contextlib
+import os
+import threading
+import time
+from contextlib import AbstractContextManager
+from typing import Iterable, Iterator, TypeVar
+from alias import any_t, void_t
+
+# Iterated item type variable
+_T = TypeVar("_T")
+
+# Span recording is enabled
+_enabled: bool = False
+
+# Span trace events are recorded
+_tracing: bool = False
+
+_LOCK: threading.Lock = threading.Lock()         # Span statistics lock
+_LOCAL: threading.local = threading.local()      # Per-thread active span stack
+_NO_SPAN: contextlib.nullcontext[None] = contextlib.nullcontext()  # Disabled span
+
+_ORIGIN: float = time.perf_counter()             # Trace event time origin
+_stats: dict[str, list[float]] = dict[str, list[float]]()  # Call count, total and self time
+_events: list[dict[str, any_t]] = list[dict[str, any_t]]()  # Trace events
+
+
+class Span:
+    """
+    Timed named phase span. Time spent in nested spans on the same
+    thread is excluded from the span's self time.
+    """
+    __slots__ = ("Name", "_Start", "_Children")
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the object.
+        """
+        self.Name: str = name         # Phase name
+        self._Start: float = 0.0      # Start performance counter
+        self._Children: float = 0.0   # Nested span time (seconds)
+
+    def __enter__(self) -> "Span":
+        """
+        Enter the runtime context and start the span.
+        """
+        _stack().append(self)
+        self._Start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *args: any_t) -> void_t:
+        """
+        Exit the runtime context and record the span.
+        """
+        elapsed = time.perf_counter() - self._Start
+        stack = _stack()
+        stack.pop()
+
+        if stack:
+            stack[-1]._Children += elapsed
+
+        add(self.Name, self._Start, elapsed, elapsed - self._Children)
+
+
+def _stack() -> list[Span]:
+    """
+    Get the active span stack of the current thread.
+    """
+    if not hasattr(_LOCAL, "stack"):
+        _LOCAL.stack = list[Span]()
+
+    stack: list[Span] = _LOCAL.stack
+    return stack
+
+
+def enable(trace: bool = False) -> void_t:
+    """
+    Enable span recording, and optionally trace event recording.
+    """
+    global _enabled, _tracing
+    _enabled, _tracing = True, trace
+
+
+def is_enabled() -> bool:
+    """
+    Determine whether span recording is enabled.
+    """
+    return _enabled
+
+
+def origin() -> float:
+    """
+    Get the performance counter at which the module was imported,
+    which is also the time origin of trace events.
+    """
+    return _ORIGIN
+
+
+def span(name: str) -> AbstractContextManager[Span | None]:
+    """
+    Get a timed span of the given phase, or a shared no-op context
+    manager if span recording is disabled.
+    """
+    return Span(name) if _enabled else _NO_SPAN
+
+
+def iter_span(name: str, items: Iterable[_T]) -> Iterable[_T]:
+    """
+    Time each item retrieval of the given iterable as a span of the given
+    phase. The iterable is returned unchanged if span recording is disabled.
+    """
+    return _iter_span(name, items) if _enabled else items
+
+
+def _iter_span(name: str, items: Iterable[_T]) -> Iterator[_T]:
+    """
+    Time each item retrieval of the given iterable as a span of the given phase.
+    """
+    iterator = iter(items)
+
+    while True:
+        with Span(name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+
+        yield item
+
+
+def add(name: str, start: float, elapsed: float, self_time: float | None = None) -> void_t:
+    """
+    Record a span of the given phase that started at the given performance
+    counter and lasted the given number of seconds.
+    """
+    with _LOCK:
+        stats = _stats.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += elapsed if self_time is None else self_time
+
+        if _tracing:
+            _events.append({
+                "name": name,
+                "ph": "X",
+                "ts": max(start - _ORIGIN, 0.0) * 1e6,
+                "dur": elapsed * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident()
+            })
+
+
+def summary() -> list[str]:
+    """
+    Get the recorded phase timing breakdown lines, in descending self time order.
+    """
+    lines = [f"{'Phase':<10} {'Calls':>7} {'Total (ms)':>12} {'Self (ms)':>12}"]
+
+    with _LOCK:
+        ranked = sorted(_stats.items(), key=lambda s: -s[1][2])
+
+    for name, (count, total, self_time) in ranked:
+        total_ms, self_ms = total * 1000, self_time * 1000
+        lines.append(f"{name:<10} {int(count):>7} {total_ms:>12.3f} {self_ms:>12.3f}")
+
+    return lines
+
+
+def write_trace(path: str) -> void_t:
+    """
+    Write the recorded spans to the given trace event format JSON file.
+    """
+    import json
+
+    with _LOCK:
+        data = {"traceEvents": list(_events), "displayTimeUnit": "ms"}
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+
+
+# Module export symbols
+__all__ = [
+    "Span",
+    "add",
+    "enable",
+    "is_enabled",
+    "iter_span",
+    "origin",
+    "span",
+    "summary",
+    "write_trace"
+]
@@ -1,9 +1,13 @@
 """
 Module for miscellaneous utility functions and types.
 """
+import _thread
+import contextlib
 import enum
+import os
 import re
 from enum import IntEnum, StrEnum
+from alias import void_t
 
 
 @enum.unique
@@ -41,6 +45,20 @@ def repo_url() -> str:
     return "https://github.com/vandavey/rfc-search"
 
 
+def editor_url() -> str:
+    """
+    Get the RFC Editor website base URL.
+    """
+    return "https://www.rfc-editor.org"
+
+
+def search_url() -> str:
+    """
+    Get the RFC Editor search page URL.
+    """
+    return f"{editor_url()}/search/rfc_search_detail.php"
+
+
 def app_name() -> str:
     """
     Get the rfc-search application name.
@@ -55,6 +73,166 @@ def app_title() -> str:
     return f"{app_name()} ({repo_url()})"
 
 
+def data_dir() -> str:
+    """
+    Get the application local data directory path.
+    """
+    path = os.environ.get("RFC_SEARCH_HOME")
+
+    if not path:
+        path = os.path.join(os.path.expanduser("~"), ".rfc-search")
+
+    return os.path.abspath(path)
+
+
+def corpus_dir() -> str:
+    """
+    Get the local RFC specification text corpus directory path.
+    """
+    return os.path.join(data_dir(), "corpus")
+
+
+def server_address() -> str:
+    """
+    Get the default query server address, which is a Unix domain
+    socket path on platforms that support Unix domain sockets.
+    """
+    if os.name == "nt":
+        return "127.0.0.1:8790"
+
+    return os.path.join(data_dir(), "rfc-search.sock")
+
+
+def temp_path(path: str) -> str:
+    """
+    Get a temporary file path for atomically replacing the given file path,
+    which is unique to the calling process and thread.
+    """
+    return f"{path}.{os.getpid()}-{_thread.get_ident()}.tmp"
+
+
+class LruDirectory:
+    """
+    Cache directory of files with the given suffix, whose total size is tracked as
+    files are written so that the directory is only scanned to evict the least
+    recently used files. Files with the given companion suffixes (e.g., metadata
+    files) are removed along with the file of the same name.
+    """
+    def __init__(self, path: str, suffix: str, companions: tuple[str, ...] = ()) -> None:
+        """
+        Initialize the object.
+        """
+        self.Path: str = path                          # Cache directory path
+        self.Suffix: str = suffix                      # Size-tracked file suffix
+        self.Companions: tuple[str, ...] = companions  # Companion file suffixes
+
+        # Total size (in bytes) of the size-tracked files, scanned when first needed
+        self._Size: int | None = None
+        self._Lock: _thread.LockType = _thread.allocate_lock()
+
+    def size(self) -> int:
+        """
+        Get the tracked total size of the size-tracked files,
+        scanning the directory if it has not been scanned yet.
+        """
+        with self._Lock:
+            if self._Size is None:
+                self._Size = sum([f[1] for f in self.scan()])
+
+            return self._Size
+
+    def scan(self) -> list[tuple[float, int, str]]:
+        """
+        Get the access time, size and path of every size-tracked file.
+        """
+        files = list[tuple[float, int, str]]()
+
+        if not os.path.isdir(self.Path):
+            return files
+
+        with os.scandir(self.Path) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name.endswith(self.Suffix):
+                    with contextlib.suppress(FileNotFoundError):
+                        stat = dir_entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, dir_entry.path))
+
+        return files
+
+    def write(self, path: str, data: bytes) -> void_t:
+        """
+        Atomically write the given data to the given file path in the directory,
+        updating the tracked total size if the file is size-tracked.
+        """
+        os.makedirs(self.Path, exist_ok=True)
+
+        # Temporary files are unique, so that concurrent writes of a file do not collide
+        tmp_path = temp_path(path)
+
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+
+        # Replaced file sizes are only exact if no other thread replaces the file meanwhile
+        with self._Lock:
+            try:
+                old_size = os.path.getsize(path)
+            except OSError:
+                old_size = 0
+
+            os.replace(tmp_path, path)
+
+            if self._Size is not None and path.endswith(self.Suffix):
+                self._Size += len(data) - old_size
+
+    @staticmethod
+    def touch(path: str) -> void_t:
+        """
+        Record the access time of the given file for least recently used eviction.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+
+    def trim(self, max_size: int, ratio: float) -> int:
+        """
+        Evict the least recently used files down to the given fraction of the given
+        maximum size if their tracked total size exceeds it. Get the number of
+        removed size-tracked files.
+        """
+        if self.size() <= max_size:
+            return 0
+
+        return self.evict(int(max_size * ratio))
+
+    def evict(self, target_size: int) -> int:
+        """
+        Remove the least recently used files until the total size of the size-tracked
+        files does not exceed the given target size. Get the number of removed
+        size-tracked files.
+        """
+        removed = 0
+
+        # Rescanned sizes also account for files written by other processes
+        with self._Lock:
+            files = self.scan()
+            self._Size = sum([f[1] for f in files])
+
+            for _, size, path in sorted(files):
+                if self._Size <= target_size:
+                    break
+
+                base_path = path[:-len(self.Suffix)]
+
+                # Files may be evicted concurrently by other processes
+                for file_path in [path, *[f"{base_path}{s}" for s in self.Companions]]:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(file_path)
+
+                self._Size -= size
+                removed += 1
+
+        return removed
+
+
 def valid_url(url: str) -> bool:
     """
     Determine whether the given URL is valid.
@@ -72,4 +250,4 @@ def valid_url(url: str) -> bool:
 
 
 # Module export symbols
-__all__ = ["RfcFieldName", "RfcFieldPos"]
+__all__ = ["LruDirectory", "RfcFieldName", "RfcFieldPos"]
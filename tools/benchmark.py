@@ -0,0 +1,1416 @@
+#!/usr/bin/env python3
+"""
+Crawler performance benchmark script.
+
+Runs the crawler against a local stand-in server so that measurements
+do not depend on (or put load on) the RFC Editor website.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator
+from urllib.parse import parse_qsl, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from crawler import Crawler, PoolConfig
+from facets import FacetIndex, members
+from fuzzy import TrigramIndex, words
+from http_cache import ResponseCache
+from index_pipeline import IndexPipeline
+from query_client import QueryClient
+from query_params import QueryParams
+from result_cache import ResultCache
+from result_parser import ResultParser
+from result_writer import ResultWriter
+from rfc_graph import Relation, RfcGraph
+from rfc_index import RfcIndex
+from spec_metadata import SpecMetadata
+from spec_table import SpecTable
+from table_writer import TableWriter
+
+# Stand-in search results page served for every request
+_PAGE: bytes = b"""<table class="gridtable">
+<tr><th>Number</th><th>Files</th><th>Title</th><th>Authors</th><th>Date</th>
+<th>More Info</th><th>Status</th></tr>
+<tr><td><a href="/info/rfc9293">RFC 9293</a></td>
+<td><a href="/rfc/rfc9293.txt">TEXT</a></td><td>Transmission Control Protocol (TCP)</td>
+<td>W. Eddy, Ed.</td><td>August 2022</td><td>Obsoletes RFC 793</td>
+<td>Internet Standard</td></tr>
+</table>"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in RFC Editor search request handler.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        """
+        Respond to an HTTP GET request with the stand-in results page.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(_PAGE)))
+        self.end_headers()
+        self.wfile.write(_PAGE)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """
+        Suppress per-request logging.
+        """
+
+
+def _make_cert(temp_dir: str) -> tuple[str, str]:
+    """
+    Create a self-signed localhost certificate and private key using OpenSSL.
+    """
+    cert_path = os.path.join(temp_dir, "cert.pem")
+    key_path = os.path.join(temp_dir, "key.pem")
+
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+                    "-days", "1", "-subj", "/CN=127.0.0.1",
+                    "-addext", "subjectAltName=IP:127.0.0.1",
+                    "-keyout", key_path, "-out", cert_path],
+                   check=True,
+                   capture_output=True)
+
+    return cert_path, key_path
+
+
+def start_server(temp_dir: str, tls: bool) -> tuple[ThreadingHTTPServer, str]:
+    """
+    Start the stand-in server on a background thread and get its search URL.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    scheme = "http"
+
+    if tls:
+        cert_path, key_path = _make_cert(temp_dir)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+
+        context.load_cert_chain(cert_path, key_path)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+
+        # Trust the self-signed certificate for all crawler sessions
+        os.environ["REQUESTS_CA_BUNDLE"] = cert_path
+        scheme = "https"
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"{scheme}://127.0.0.1:{server.server_port}/search/rfc_search_detail.php"
+
+
+def _percentile(ms: list[float], percent: float) -> float:
+    """
+    Get the nearest-rank percentile of the given sorted samples.
+    """
+    return ms[min(len(ms) - 1, max(0, int(len(ms) * percent / 100 + 0.5) - 1))]
+
+
+def _latency(samples: list[float]) -> dict[str, float]:
+    """
+    Get the latency summary (in milliseconds) of the given per-request samples (in seconds).
+    """
+    ms = sorted([s * 1000 for s in samples])
+
+    return {
+        "mean": statistics.mean(ms),
+        "p50": _percentile(ms, 50),
+        "p95": _percentile(ms, 95),
+        "p99": _percentile(ms, 99)
+    }
+
+
+def _report(name: str, samples: list[float]) -> None:
+    """
+    Print the latency summary of the given per-request samples (in seconds).
+    """
+    latency = _latency(samples)
+
+    print(f"{name:<14} n={len(samples):<5} mean={latency['mean']:8.3f} ms  "
+          f"p50={latency['p50']:8.3f} ms  p95={latency['p95']:8.3f} ms  "
+          f"p99={latency['p99']:8.3f} ms")
+
+
+def bench_pool(args: argparse.Namespace) -> None:
+    """
+    Compare per-request latency with and without connection reuse.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        server, url = start_server(temp_dir, not args.plain)
+        params = QueryParams(1968, time.localtime().tm_year, rfc_id=9293)
+
+        for name, keep_alive in [("no-pool", False), ("pool", True)]:
+            pool = PoolConfig(keep_alive=keep_alive, rate_limit=0)
+
+            with Crawler(params, pool=pool) as crawler:
+                crawler.id_search(url)
+                samples = list[float]()
+
+                for _ in range(args.requests):
+                    start = time.perf_counter()
+                    crawler.id_search(url)
+                    samples.append(time.perf_counter() - start)
+
+            _report(name, samples)
+
+        server.shutdown()
+
+
+def _make_page(rfc_ids: range, total: int) -> bytes:
+    """
+    Create a search results page fixture containing a row for each given RFC number.
+    """
+    lines = [f"<p>Showing {len(rfc_ids)} of {total} results</p>",
+             '<table class="gridtable">']
+
+    for rfc_id in rfc_ids:
+        lines.append(f'<tr><td><a href="/info/rfc{rfc_id}">RFC&nbsp;{rfc_id}</a></td>'
+                     f'<td><a href="/rfc/rfc{rfc_id}.html">HTML</a>, '
+                     f'<a href="/rfc/rfc{rfc_id}.txt">TEXT</a></td>'
+                     f'<td class="title">Specification Title Number {rfc_id} </td>'
+                     f"<td>A. Author, B. Author, Ed.</td><td>August 2022</td>"
+                     f'<td>Obsoletes <a href="/info/rfc{rfc_id + 1}">'
+                     f"RFC {rfc_id + 1}</a></td>"
+                     f"<td>Proposed Standard</td></tr>")
+
+    lines.append("</table>")
+    return "\n".join(lines).encode()
+
+
+def _make_fixture(rows: int) -> bytes:
+    """
+    Create a search results page fixture containing the given number of rows.
+    """
+    return _make_page(range(1, rows + 1), rows)
+
+
+def bench_parse(args: argparse.Namespace) -> None:
+    """
+    Measure streaming search results parser throughput and peak memory usage.
+    """
+    if args.file:
+        with open(args.file, "rb") as file:
+            data = file.read()
+    else:
+        data = _make_fixture(args.rows)
+
+    url = "https://www.rfc-editor.org/search/rfc_search_detail.php"
+    chunk_size = args.chunk_size
+
+    first_row = 0.0
+    rows = 0
+
+    start = time.perf_counter()
+
+    for _ in ResultParser(url).iter_parse(data[i:i + chunk_size]
+                                          for i in range(0, len(data), chunk_size)):
+        if not rows:
+            first_row = time.perf_counter() - start
+        rows += 1
+
+    elapsed = time.perf_counter() - start
+
+    # Memory is traced in a separate pass since tracing skews the timings
+    tracemalloc.start()
+
+    for _ in ResultParser(url).iter_parse(data[i:i + chunk_size]
+                                          for i in range(0, len(data), chunk_size)):
+        pass
+
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"bytes={len(data)} rows={rows} elapsed={elapsed:.3f} s "
+          f"rows/s={rows / elapsed:,.0f} first-row={first_row * 1000:.3f} ms "
+          f"peak-mem={peak / 1024:,.1f} KiB")
+
+
+class DictSpec:
+    """
+    Specification metadata stored in a per-instance attribute dictionary.
+    """
+    def __init__(self, spec: SpecMetadata) -> None:
+        """
+        Initialize the object.
+        """
+        self.__dict__.update(spec.dict())
+
+
+def _iter_specs(rows: int) -> Iterator[SpecMetadata]:
+    """
+    Get an iterator over synthetic corpus-like specification metadata records.
+    """
+    months = ["January", "April", "July", "October"]
+    statuses = ["PROPOSED STANDARD", "INFORMATIONAL", "EXPERIMENTAL", "UNKNOWN"]
+
+    for rfc_id in range(1, rows + 1):
+        base = "https://www.rfc-editor.org"
+        files = {
+            "TEXT": f"{base}/rfc/rfc{rfc_id}.txt",
+            "PDF": f"{base}/rfc/rfc{rfc_id}.pdf"
+        }
+        more_info = f"Obsoletes RFC {rfc_id - 1}" if rfc_id % 5 == 0 else ""
+
+        yield SpecMetadata(rfc_id=rfc_id,
+                           files=files,
+                           title=f"Specification Title Number {rfc_id}",
+                           authors=f"A. Author{rfc_id % 3000}, B. Author{rfc_id % 700}",
+                           date=f"{months[rfc_id % 4]} {1969 + rfc_id % 55}",
+                           more_info=more_info,
+                           status=f"{statuses[rfc_id % 4]}",
+                           txt_url=files["TEXT"],
+                           info_url=f"{base}/info/rfc{rfc_id}")
+
+
+def _traced_size(build: Callable[[], Any]) -> int:
+    """
+    Get the traced memory retained by the object created by the given function.
+    """
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+    del obj
+
+    return size
+
+
+def bench_memory(args: argparse.Namespace) -> None:
+    """
+    Compare the memory usage of the specification metadata storage layouts.
+    """
+    source: Iterator[SpecMetadata] = _iter_specs(args.rows)
+
+    if args.file:
+        index = RfcIndex(os.path.join(tempfile.gettempdir(), "rfc-index.bin"))
+        index.build(args.file)
+        source = iter(index)
+
+    # Records are decoded inside each traced build so no strings are shared
+    records = [json.dumps(s.dict()) for s in source]
+
+    def specs() -> Iterator[SpecMetadata]:
+        return (SpecMetadata.from_dict(json.loads(r)) for r in records)
+
+    def table() -> SpecTable:
+        spec_table = SpecTable()
+
+        for spec in specs():
+            spec_table.add(spec)
+        return spec_table
+
+    layouts: list[tuple[str, Callable[[], Any]]] = [
+        ("dict", lambda: [DictSpec(s) for s in specs()]),
+        ("slots", lambda: list(specs())),
+        ("table", table)
+    ]
+
+    for name, build in layouts:
+        size = _traced_size(build)
+        print(f"{name:<8} {size / 1024 / 1024:8.2f} MiB")
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    Local search server that replays recorded responses with injected network conditions.
+    """
+    daemon_threads = True
+
+    def __init__(self,
+                 recordings: ResponseCache | None,
+                 latency: float,
+                 bandwidth: float,
+                 results: int,
+                 throttle: float = 0.0,
+                 retry_after: str = str(),
+                 error_rate: float = 0.0) -> None:
+        """
+        Initialize the object.
+        """
+        super().__init__(("127.0.0.1", 0), ReplayHandler)
+
+        self.recordings = recordings     # Recorded responses (by search query)
+        self.latency = latency           # Injected response latency (seconds)
+        self.bandwidth = bandwidth       # Injected bandwidth limit (bytes/s, 0 for none)
+        self.results = results           # Synthetic keyword search result count
+        self.throttle = throttle         # Injected rate limit (requests/s, 0 for none)
+        self.retry_after = retry_after   # Throttled response 'Retry-After' header value
+        self.error_rate = error_rate     # Injected server error response probability
+        self.bytes_sent = 0              # Response body bytes sent
+        self.replayed = 0                # Responses served from recordings
+        self.throttled = 0               # Throttled responses sent
+        self.errors = 0                  # Injected server error responses sent
+        self.accepted = list[float]()    # Accepted request times within the last second
+        self.lock = threading.Lock()
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        """
+        Report request handling errors, except for clients that disconnect
+        before a response is complete (e.g., abandoned searches).
+        """
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def reject_status(self) -> int:
+        """
+        Get the injected error status code of a new request,
+        or zero if the request is accepted.
+        """
+        now = time.monotonic()
+
+        with self.lock:
+            if self.error_rate > 0 and random.random() < self.error_rate:
+                self.errors += 1
+                return 503
+
+            if self.throttle > 0:
+                self.accepted = [t for t in self.accepted if now - t < 1.0]
+
+                if len(self.accepted) >= self.throttle:
+                    self.throttled += 1
+                    return 429
+
+                self.accepted.append(now)
+
+        return 0
+
+    def response_body(self, path: str) -> bytes:
+        """
+        Get the recorded response body of the given request path, or a
+        synthetic search results page if the query was not recorded.
+        """
+        params = dict(parse_qsl(urlsplit(path).query, keep_blank_values=True))
+
+        if self.recordings is not None:
+            url = "https://www.rfc-editor.org/search/rfc_search_detail.php"
+            entry = self.recordings.get(url, params)
+
+            if entry is not None:
+                with self.lock:
+                    self.replayed += 1
+                return entry.Body
+
+        if params.get("rfc"):
+            rfc_id = int(params["rfc"])
+            return _make_page(range(rfc_id, rfc_id + 1), 1)
+
+        page = params.get("page", "All")
+        page_size = int(page) if page.isdigit() else self.results
+        start = (int(params.get("pageno", "1")) - 1) * page_size + 1
+
+        end = min(start + page_size, self.results + 1)
+        return _make_page(range(start, end), self.results)
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """
+    Replay server search request handler.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: ReplayServer
+
+    def do_GET(self) -> None:
+        """
+        Respond to an HTTP GET request after the injected latency, writing
+        the response body no faster than the injected bandwidth limit.
+        """
+        time.sleep(self.server.latency)
+
+        if status := self.server.reject_status():
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+
+            if status == 429 and self.server.retry_after:
+                self.send_header("Retry-After", self.server.retry_after)
+
+            self.end_headers()
+            return
+
+        body = self.server.response_body(self.path)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        if self.server.bandwidth > 0:
+            chunk_size = max(1024, int(self.server.bandwidth / 100))
+
+            for i in range(0, len(body), chunk_size):
+                chunk = body[i:i + chunk_size]
+                self.wfile.write(chunk)
+                time.sleep(len(chunk) / self.server.bandwidth)
+        else:
+            self.wfile.write(body)
+
+        with self.server.lock:
+            self.server.bytes_sent += len(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """
+        Suppress per-request logging.
+        """
+
+
+def bench_throttle(args: argparse.Namespace) -> None:
+    """
+    Measure batch lookup throughput and failures against a replay server that
+    throttles requests above a fixed rate, with and without crawler rate limiting.
+    """
+    server = ReplayServer(None,
+                          args.latency / 1000,
+                          0.0,
+                          args.requests,
+                          args.limit,
+                          args.retry_after,
+                          args.error_rate)
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/search/rfc_search_detail.php"
+
+    for name, rate in [("unlimited", 0.0), ("adaptive", args.rate)]:
+        with server.lock:
+            server.throttled = server.errors = 0
+
+        pool = PoolConfig(max_workers=args.workers,
+                          retries=args.retries,
+                          backoff=args.backoff,
+                          rate_limit=rate,
+                          burst=args.burst)
+        start = time.perf_counter()
+
+        with Crawler(pool=pool) as crawler:
+            results = list(crawler.batch_search(url, range(1, args.requests + 1)))
+            scheduler = crawler.Scheduler
+
+        elapsed = time.perf_counter() - start
+        found = len([s for _, s in results if s is not None])
+
+        print(f"{name:<14} n={len(results):<5} elapsed={elapsed:8.3f} s  "
+              f"ops/s={found / elapsed:8.1f}  found={found / len(results):.2%}")
+        print(f"{'':<14} throttled={server.throttled}  errors={server.errors}  "
+              f"retried={scheduler.Retried}  limit={scheduler.Limit:.2f}  "
+              f"rate={scheduler.Bucket.Rate:.2f}/s")
+
+    server.shutdown()
+    server.server_close()
+
+
+def _peak_rss() -> int | None:
+    """
+    Get the peak resident set size (in bytes) of the benchmark process, if available.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _git_commit() -> str | None:
+    """
+    Get the current source tree commit hash, if available.
+    """
+    repo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    result = subprocess.run(["git", "-C", repo_dir, "rev-parse", "--short", "HEAD"],
+                            capture_output=True,
+                            text=True)
+
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _replay_ops(url: str, args: argparse.Namespace) -> dict[str, Callable[[Crawler], Any]]:
+    """
+    Get the crawler operations measured against the replay server.
+    """
+    year = time.localtime().tm_year
+    rand = random.Random(args.seed)
+
+    def id_params() -> QueryParams:
+        return QueryParams(1968, year, rfc_id=rand.randint(1, args.results))
+
+    def keyword_params() -> QueryParams:
+        return QueryParams(1968, year, title=args.keyword, page=args.page_size)
+
+    def crawl(crawler: Crawler) -> Any:
+        crawler.Params = id_params() if rand.random() < 0.5 else keyword_params()
+        return crawler.crawl(url)
+
+    def id_search(crawler: Crawler) -> Any:
+        crawler.Params = id_params()
+        return crawler.id_search(url)
+
+    def keyword_search(crawler: Crawler) -> Any:
+        crawler.Params = keyword_params()
+        return crawler.keyword_search(url)
+
+    def first_result(crawler: Crawler) -> Any:
+        crawler.Params = keyword_params()
+
+        with crawler.search(url) as results:
+            return next(results, None), len(results)
+
+    def limited_search(crawler: Crawler) -> Any:
+        crawler.Params = keyword_params()
+
+        with crawler.search(url, args.limit) as results:
+            return list(results)
+
+    return {
+        "crawl": crawl,
+        "id_search": id_search,
+        "keyword_search": keyword_search,
+        "first_result": first_result,
+        "limited_search": limited_search
+    }
+
+
+def bench_replay(args: argparse.Namespace) -> None:
+    """
+    Measure crawler search latency, throughput and memory usage
+    against a local replay server.
+    """
+    recordings = None
+
+    if args.recordings:
+        recordings = ResponseCache(args.recordings, ttl=sys.maxsize)
+
+    server = ReplayServer(recordings,
+                          args.latency / 1000,
+                          args.bandwidth * 1024,
+                          args.results)
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/search/rfc_search_detail.php"
+
+    ops = _replay_ops(url, args)
+    results = dict[str, Any]()
+
+    for name in args.ops:
+        # Repeated queries are only cached in-process, so every run starts cold
+        result_cache = ResultCache(persist=False) if args.result_cache else None
+
+        pool = PoolConfig(max_workers=args.workers, rate_limit=args.rate)
+
+        with Crawler(pool=pool, results=result_cache) as crawler:
+            ops[name](crawler)
+
+            with server.lock:
+                server.bytes_sent = 0
+
+            samples = list[float]()
+            start = time.perf_counter()
+
+            for _ in range(args.requests):
+                op_start = time.perf_counter()
+                ops[name](crawler)
+                samples.append(time.perf_counter() - op_start)
+
+            elapsed = time.perf_counter() - start
+
+        results[name] = {
+            "requests": len(samples),
+            "elapsed_s": elapsed,
+            "ops_per_s": len(samples) / elapsed,
+            "bytes": server.bytes_sent,
+            "bytes_per_s": server.bytes_sent / elapsed,
+            "latency_ms": _latency(samples),
+            "peak_rss": _peak_rss()
+        }
+
+        _report(name, samples)
+        print(f"{'':<14} ops/s={results[name]['ops_per_s']:,.1f}  "
+              f"bytes={server.bytes_sent:,}  "
+              f"MiB/s={server.bytes_sent / elapsed / 1024 / 1024:,.2f}  "
+              f"peak-rss={(results[name]['peak_rss'] or 0) / 1024 / 1024:,.1f} MiB")
+
+    server.shutdown()
+    server.server_close()
+
+    if args.json:
+        report = {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": {
+                "requests": args.requests,
+                "latency_ms": args.latency,
+                "bandwidth_kib_s": args.bandwidth,
+                "results": args.results,
+                "page_size": args.page_size,
+                "workers": args.workers,
+                "replayed": server.replayed
+            },
+            "results": results
+        }
+
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        _compare(args.baseline, results)
+
+
+def _compare(baseline_path: str, results: dict[str, Any]) -> None:
+    """
+    Print the relative change of the given results from the given baseline JSON report.
+    """
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)["results"]
+
+    print(f"\nchange from baseline '{baseline_path}':")
+
+    for name in [n for n in results if n in baseline]:
+        old, new = baseline[name], results[name]
+        old_ms, new_ms = old["latency_ms"], new["latency_ms"]
+        changes = [(k, old_ms[k], new_ms[k]) for k in ["p50", "p95", "p99"]]
+        changes.append(("ops/s", old["ops_per_s"], new["ops_per_s"]))
+
+        print(f"{name:<14} " + "  ".join([f"{k}={(n - o) / o * 100:+6.1f}%"
+                                          for k, o, n in changes if o]))
+
+
+# Modules that must not be imported by the local startup paths
+_LAZY_MODULES: list[str] = [
+    "concurrent.futures",
+    "html.parser",
+    "requests",
+    "urllib3",
+    "xml.etree.ElementTree"
+]
+
+
+def _import_times(command: list[str],
+                  env: dict[str, str]) -> tuple[dict[str, int], set[str], float]:
+    """
+    Run the given Python command with import timing enabled. Get the cumulative
+    import time (in microseconds) of each top-level import, the names of all
+    imported modules and the wall time.
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", *command],
+                            capture_output=True,
+                            env=env,
+                            text=True)
+    elapsed = time.perf_counter() - start
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Command failed: {command}\n{result.stderr}")
+
+    times = dict[str, int]()
+    modules = set[str]()
+
+    for line in result.stderr.splitlines():
+        fields = line[len("import time:"):].split("|")
+
+        if not line.startswith("import time:") or not fields[1].strip().isdigit():
+            continue
+
+        modules.add(fields[2].strip())
+
+        # Nested imports are indented below their importing module
+        if not fields[2][1:].startswith(" "):
+            times[fields[2].strip()] = int(fields[1])
+
+    return times, modules, elapsed
+
+
+def bench_startup(args: argparse.Namespace) -> None:
+    """
+    Measure the application import time of the command-line startup paths
+    and fail if any exceeds its budget or imports a lazily loaded module.
+    """
+    src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    script = os.path.join(src_dir, "rfc-search.py")
+    failed = False
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env = dict(os.environ, RFC_SEARCH_HOME=temp_dir)
+        index = RfcIndex(os.path.join(temp_dir, "rfc-index.bin"))
+
+        for spec in _iter_specs(100):
+            index.add(spec)
+
+        index.Updated = time.time()
+        index.save()
+
+        # Interpreter startup imports are excluded from the application import time
+        baseline = _import_times(["-c", "pass"], env)[1]
+
+        paths = [
+            ("help", ["--help"], args.help_budget),
+            ("lookup", ["--offline", "42"], args.lookup_budget)
+        ]
+
+        for name, cl_args, budget in paths:
+            import_ms = list[float]()
+            wall_ms = list[float]()
+            modules = set[str]()
+
+            for _ in range(args.runs):
+                times, imported, elapsed = _import_times([script, *cl_args], env)
+
+                import_us = sum([v for k, v in times.items() if k not in baseline])
+                import_ms.append(import_us / 1000)
+                wall_ms.append(elapsed * 1000)
+                modules.update(imported)
+
+            median_ms = statistics.median(import_ms)
+            eager = [m for m in _LAZY_MODULES if m in modules]
+            ok = median_ms <= budget and not eager
+
+            print(f"{name:<8} imports={median_ms:8.3f} ms  budget={budget:8.3f} ms  "
+                  f"wall={statistics.median(wall_ms):8.3f} ms  {'ok' if ok else 'FAIL'}")
+
+            if eager:
+                print(f"{'':<8} eagerly imported: {', '.join(eager)}")
+
+            failed = failed or not ok
+
+    if failed:
+        sys.exit(1)
+
+
+def bench_serve(args: argparse.Namespace) -> None:
+    """
+    Measure hot query latency against a query server process, compared with
+    the wall time of the equivalent command-line lookups.
+    """
+    src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    script = os.path.join(src_dir, "rfc-search.py")
+    rand = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env = dict(os.environ, RFC_SEARCH_HOME=temp_dir)
+        index = RfcIndex(os.path.join(temp_dir, "rfc-index.bin"))
+
+        for spec in _iter_specs(args.rows):
+            index.add(spec)
+
+        index.Updated = time.time()
+        index.save()
+
+        address = os.path.join(temp_dir, "rfc-search.sock")
+        server = subprocess.Popen([sys.executable, script, "--offline", "--serve", address],
+                                  env=env,
+                                  stdout=subprocess.DEVNULL)
+        try:
+            deadline = time.monotonic() + 10
+
+            while not os.path.exists(address):
+                if time.monotonic() > deadline or server.poll() is not None:
+                    raise RuntimeError(f"Query server failed to start on '{address}'")
+                time.sleep(0.01)
+
+            cli_samples = list[float]()
+
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                rfc_id = str(rand.randint(1, args.rows))
+                subprocess.run([sys.executable, script, "--offline", rfc_id],
+                               env=env,
+                               stdout=subprocess.DEVNULL,
+                               check=True)
+                cli_samples.append(time.perf_counter() - start)
+
+            with QueryClient(address) as client:
+                rfc_ids = range(1, args.rows + 1)
+
+                ops: dict[str, Callable[[], Any]] = {
+                    "lookup": lambda: client.lookup([rand.randint(1, args.rows)]),
+                    "batch": lambda: client.lookup(rand.sample(rfc_ids, 100))
+                }
+                _report("cli-lookup", cli_samples)
+
+                for name, op in ops.items():
+                    op()
+                    samples = list[float]()
+
+                    for _ in range(args.requests):
+                        start = time.perf_counter()
+                        op()
+                        samples.append(time.perf_counter() - start)
+
+                    _report(f"serve-{name}", samples)
+
+                    # Batch lookups of 100 RFC numbers are reported for comparison only
+                    if name == "lookup":
+                        ok = _latency(samples)["p50"] <= args.budget
+                        status = "ok" if ok else "FAIL"
+                        print(f"{'':<14} budget={args.budget:.1f} ms  {status}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+# Synthetic specification title vocabulary
+_TITLE_WORDS: list[str] = [
+    "Transmission", "Control", "Protocol", "Congestion", "Internet", "Message", "Format",
+    "Extensions", "Security", "Considerations", "Domain", "Name", "System", "Routing",
+    "Multicast", "Address", "Architecture", "Requirements", "Framework", "Transport",
+    "Layer", "Authentication", "Encryption", "Datagram", "Hypertext", "Semantics",
+    "Caching", "Mobile", "Network", "Management", "Information", "Base", "Version",
+    "Use", "Cases", "Guidelines", "Operational", "Experience", "Media", "Types"
+]
+
+
+def _iter_titles(args: argparse.Namespace) -> Iterator[tuple[int, str]]:
+    """
+    Get an iterator over bulk index or synthetic RFC number and title pairs.
+    """
+    if args.file:
+        index = RfcIndex(os.path.join(tempfile.gettempdir(), "rfc-index.bin"))
+        index.build(args.file)
+        yield from [(s.Id, s.Title) for s in index]
+    else:
+        rand = random.Random(args.seed)
+
+        for rfc_id in range(1, args.rows + 1):
+            yield rfc_id, " ".join(rand.sample(_TITLE_WORDS, rand.randint(3, 8)))
+
+
+def _misspell(text: str, rand: random.Random) -> str:
+    """
+    Swap two adjacent characters of a random word of the given text.
+    """
+    text_words = text.split()
+    pos = rand.randrange(len(text_words))
+    word = text_words[pos]
+
+    if len(word) > 3:
+        i = rand.randrange(1, len(word) - 2)
+        text_words[pos] = f"{word[:i]}{word[i + 1]}{word[i]}{word[i + 2:]}"
+
+    return " ".join(text_words)
+
+
+def bench_fuzzy(args: argparse.Namespace) -> None:
+    """
+    Measure fuzzy title search latency and top match accuracy for misspelled
+    partial title queries.
+    """
+    titles = list(_iter_titles(args))
+    trigram_index = TrigramIndex(os.path.join(tempfile.gettempdir(), "trigram.idx"))
+
+    start = time.perf_counter()
+    trigram_index.build(titles)
+    print(f"build        titles={len(titles)} elapsed={time.perf_counter() - start:.3f} s")
+
+    rand = random.Random(args.seed)
+    queries = list[tuple[set[str], str]]()
+
+    # Partial title queries, which may match several titles that share their words
+    for _, title in rand.sample(titles, min(args.queries, len(titles))):
+        title_words = title.split()
+        first = rand.randrange(max(len(title_words) - 1, 1))
+        query = " ".join(title_words[first:first + 2])
+        queries.append((set(words(query)), _misspell(query, rand)))
+
+    title_sets = {i: set(words(t)) for i, t in titles}
+
+    for name, rerank in [("trigram", False), ("rerank", True)]:
+        samples = list[float]()
+        found = 0
+
+        for expected, query in queries:
+            start = time.perf_counter()
+            matches = trigram_index.search(query, rerank=rerank)
+            samples.append(time.perf_counter() - start)
+
+            found += bool(matches) and expected <= title_sets[matches[0][0]]
+
+        _report(name, samples)
+        print(f"{'':<14} top1={found / len(queries):.2%}  "
+              f"budget={args.budget:.1f} ms  "
+              f"{'ok' if _latency(samples)['p95'] <= args.budget else 'FAIL'}")
+
+
+def bench_graph(args: argparse.Namespace) -> None:
+    """
+    Measure relationship graph build time and latest replacement
+    and transitive closure query latency.
+    """
+    specs = list(_iter_specs(args.rows))
+    graph = RfcGraph(os.path.join(tempfile.gettempdir(), "rfc-graph.idx"))
+
+    start = time.perf_counter()
+    count = graph.build(specs)
+    print(f"build        specs={len(specs)} edges={count} "
+          f"elapsed={time.perf_counter() - start:.3f} s")
+
+    rand = random.Random(args.seed)
+    rfc_ids = [rand.randint(1, args.rows) for _ in range(args.queries)]
+
+    queries: dict[str, Callable[[int], Any]] = {
+        "latest": graph.latest,
+        "obsoletes": lambda i: graph.closure(i, Relation.OBSOLETES)
+    }
+
+    for name, query in queries.items():
+        samples = list[float]()
+
+        for rfc_id in rfc_ids:
+            start = time.perf_counter()
+            query(rfc_id)
+            samples.append(time.perf_counter() - start)
+
+        _report(name, samples)
+        print(f"{'':<14} budget={args.budget:.3f} ms  "
+              f"{'ok' if _latency(samples)['p95'] <= args.budget else 'FAIL'}")
+
+
+def _write_corpus(corpus_dir: str, args: argparse.Namespace) -> list[tuple[int, str]]:
+    """
+    Write synthetic RFC text files with numbered sections and references
+    sections, and get their RFC numbers and file paths.
+    """
+    rand = random.Random(args.seed)
+    paths = list[tuple[int, str]]()
+
+    for rfc_id in range(1, args.rows + 1):
+        lines = list[str]()
+
+        for section in range(1, 11):
+            lines.append(f"{section}.  {' '.join(rand.sample(_TITLE_WORDS, 3)).title()}\n")
+            lines.extend([f"   {' '.join(rand.choices(_TITLE_WORDS, k=12))}"
+                          for _ in range(args.words // 120)])
+            lines.append("")
+
+        lines.append("11.  References\n")
+        cited = rand.sample(range(1, args.rows + 1), 8)
+        lines.extend([f"   [RFC{i}]  Reference" for i in cited])
+
+        path = os.path.join(corpus_dir, f"rfc{rfc_id}.txt")
+        paths.append((rfc_id, path))
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines))
+
+    return paths
+
+
+def bench_index(args: argparse.Namespace) -> None:
+    """
+    Measure parallel corpus indexing time and speedup by worker process count.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["RFC_SEARCH_HOME"] = temp_dir
+        index = RfcIndex(os.path.join(temp_dir, "rfc-index.bin"))
+
+        for spec in _iter_specs(args.rows):
+            index.add(spec)
+
+        corpus_dir = os.path.join(temp_dir, "corpus")
+        os.makedirs(corpus_dir)
+        paths = _write_corpus(corpus_dir, args)
+
+        baseline = 0.0
+        expected = list[tuple[int, float]]()
+
+        for workers in args.workers:
+            pipeline = IndexPipeline(index, workers)
+
+            start = time.perf_counter()
+            count = pipeline.run(paths)
+            elapsed = time.perf_counter() - start
+
+            pipeline.close()
+            baseline = baseline or elapsed
+
+            # Merged shard indexes must match regardless of the worker count
+            ranked = pipeline.FullText.search(" ".join(_TITLE_WORDS[:3]), limit=0)
+            expected = expected or ranked
+
+            print(f"workers={workers:<3} docs={count} edges={len(pipeline.Graph)} "
+                  f"elapsed={elapsed:7.3f} s  speedup={baseline / elapsed:5.2f}x  "
+                  f"{'ok' if ranked == expected else 'MISMATCH'}")
+
+
+def _timed(func: Callable[[], Any], runs: int) -> list[float]:
+    """
+    Get the elapsed time samples (in seconds) of the given
+    number of calls to the given function.
+    """
+    samples = list[float]()
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+
+def bench_load(args: argparse.Namespace) -> None:
+    """
+    Measure the open and first lookup latency of the memory-mapped binary index
+    files against the JSON index file format they replace, and check that
+    corrupt index files are detected.
+    """
+    rand = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = RfcIndex(os.path.join(temp_dir, "rfc-index.bin"))
+
+        for spec in _iter_specs(args.rows):
+            index.add(spec)
+        index.save()
+
+        json_path = os.path.join(temp_dir, "rfc-index.json")
+        specs = [s.dict() for s in index]
+        data = {"version": 2, "source": "", "updated": 0.0, "specs": specs}
+
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+
+        trigram_index = TrigramIndex(os.path.join(temp_dir, "trigram.idx"))
+        trigram_index.build((s.Id, s.Title) for s in index)
+        trigram_index.save()
+
+        print(f"files        specs={len(index)} "
+              f"json={os.path.getsize(json_path) / 1024:.0f} KiB "
+              f"binary={os.path.getsize(index.Path) / 1024:.0f} KiB "
+              f"trigram={os.path.getsize(trigram_index.Path) / 1024:.0f} KiB")
+
+        def first_lookup() -> None:
+            RfcIndex.open(index.Path).lookup(rand.randint(1, args.rows))
+
+        def fuzzy_open() -> TrigramIndex:
+            loaded = TrigramIndex(trigram_index.Path)
+            loaded.load()
+            return loaded
+
+        def fuzzy_search() -> None:
+            fuzzy_open().search(f"title numbr {rand.randint(1, args.rows)}")
+
+        mapped = RfcIndex.open(index.Path)
+        few_runs, many_runs = max(args.runs // 10, 1), args.runs * 10
+
+        runs: list[tuple[str, Callable[[], Any], int, float]] = [
+            ("json_open", lambda: RfcIndex()._load_json(json_path), few_runs, 0.0),
+            ("open", lambda: RfcIndex.open(index.Path), args.runs, args.budget),
+            ("first_lookup", first_lookup, args.runs, args.budget),
+            ("lookup", lambda: mapped.lookup(rand.randint(1, args.rows)), many_runs, 0.0),
+            ("fuzzy_open", fuzzy_open, args.runs, args.budget),
+            ("fuzzy_search", fuzzy_search, few_runs, 0.0)
+        ]
+
+        for name, func, count, budget in runs:
+            samples = _timed(func, count)
+            _report(name, samples)
+
+            if budget:
+                print(f"{'':<14} budget={budget:.1f} ms  "
+                      f"{'ok' if _latency(samples)['p95'] <= budget else 'FAIL'}")
+
+        mapped.close()
+
+        # Corrupt a string data byte, which is only detected once the strings are accessed
+        with open(index.Path, "r+b") as index_file:
+            index_file.seek(-100, os.SEEK_END)
+            byte = index_file.read(1)
+            index_file.seek(-100, os.SEEK_END)
+            index_file.write(bytes([byte[0] ^ 0xFF]))
+
+        try:
+            first_lookup()
+            detected = False
+        except RuntimeError:
+            detected = True
+
+        print(f"corruption   {'detected ok' if detected else 'FAIL'}")
+
+
+class TimedSink(io.StringIO):
+    """
+    Output stream that discards its output and records the time of the first write.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize the object.
+        """
+        super().__init__()
+        self.First: float = 0.0
+        self.Writes: int = 0
+
+    def write(self, text: str) -> int:
+        """
+        Discard the given text and record the write.
+        """
+        self.First = self.First or time.perf_counter()
+        self.Writes += 1
+        return len(text)
+
+
+def bench_table(args: argparse.Namespace) -> None:
+    """
+    Measure the time to the first output write and the total render time
+    of the table writer against the default text result writer.
+    """
+    specs = list(_iter_specs(args.rows))
+
+    writers: list[tuple[str, Callable[[TimedSink], ResultWriter]]] = [
+        ("text", lambda sink: ResultWriter("text", sink)),
+        ("table", lambda sink: TableWriter(sink, width=args.width, height=args.height))
+    ]
+
+    for name, make_writer in writers:
+        samples = list[float]()
+        first = list[float]()
+        writes = 0
+
+        for _ in range(args.runs):
+            sink = TimedSink()
+            start = time.perf_counter()
+
+            with make_writer(sink) as writer:
+                for spec in specs:
+                    writer.write(spec)
+
+            samples.append(time.perf_counter() - start)
+            first.append(sink.First - start)
+            writes = sink.Writes
+
+        print(f"{name:<6} rows={len(specs)} writes={writes:<6} "
+              f"first={statistics.median(first) * 1000:8.3f} ms  "
+              f"total={statistics.median(samples) * 1000:8.3f} ms  "
+              f"{'ok' if statistics.median(samples) * 1000 <= args.budget else 'FAIL'}")
+
+
+def bench_facets(args: argparse.Namespace) -> None:
+    """
+    Measure facet index build and load time and the latency of status,
+    year range and author filter queries answered by bitset intersection.
+    """
+    rand = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = RfcIndex(os.path.join(temp_dir, "rfc-index.bin"))
+
+        for spec in _iter_specs(args.rows):
+            index.add(spec)
+        index.save()
+
+        start = time.perf_counter()
+        facet_index = FacetIndex.open(index, os.path.join(temp_dir, "facets.idx"))
+
+        print(f"build        specs={len(facet_index)} "
+              f"size={os.path.getsize(facet_index.Path) / 1024:.0f} KiB "
+              f"elapsed={time.perf_counter() - start:.3f} s")
+
+        _report("load", _timed(facet_index.load, args.runs))
+
+        def years() -> tuple[int, int]:
+            from_year = rand.randint(1969, 2020)
+            return from_year, from_year + rand.randint(0, 10)
+
+        queries: list[tuple[str, Callable[[], Any]]] = [
+            ("status_years", lambda: facet_index.select(["proposed"], "", *years())),
+            ("author", lambda: facet_index.select(author=f"author{rand.randint(1, 2999)}")),
+            ("all_facets", lambda: facet_index.select(["proposed", "informational"],
+                                                      f"author{rand.randint(1, 699)}",
+                                                      *years())),
+            ("members", lambda: members(facet_index.select(["proposed"], "", *years())))
+        ]
+
+        for name, query in queries:
+            samples = _timed(query, args.queries)
+            _report(name, samples)
+
+            print(f"{'':<14} budget={args.budget:.3f} ms  "
+                  f"{'ok' if _latency(samples)['p95'] <= args.budget else 'FAIL'}")
+
+        facet_index.close()
+
+
+def main() -> None:
+    """
+    Benchmark script entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pool_cmd = commands.add_parser("pool", help="connection pool request latency")
+    pool_cmd.add_argument("-n", "--requests", type=int, default=200)
+    pool_cmd.add_argument("--plain", action="store_true", help="use HTTP instead of HTTPS")
+    pool_cmd.set_defaults(func=bench_pool)
+
+    parse_cmd = commands.add_parser("parse", help="streaming result parser throughput")
+    parse_cmd.add_argument("-f", "--file", help="saved search results page to parse")
+    parse_cmd.add_argument("-r", "--rows", type=int, default=10000)
+    parse_cmd.add_argument("-c", "--chunk-size", type=int, default=16 * 1024)
+    parse_cmd.set_defaults(func=bench_parse)
+
+    memory_cmd = commands.add_parser("memory", help="metadata storage memory usage")
+    memory_cmd.add_argument("-f", "--file", help="bulk index XML file (rfc-index.xml)")
+    memory_cmd.add_argument("-r", "--rows", type=int, default=9500)
+    memory_cmd.set_defaults(func=bench_memory)
+
+    replay_cmd = commands.add_parser("replay",
+                                     help="crawler searches against a replay server")
+    replay_cmd.add_argument("-n", "--requests", type=int, default=100)
+    replay_cmd.add_argument("-o", "--ops",
+                            nargs="+",
+                            choices=["crawl",
+                                     "id_search",
+                                     "keyword_search",
+                                     "first_result",
+                                     "limited_search"],
+                            default=["crawl", "id_search", "keyword_search"])
+    replay_cmd.add_argument("-l", "--latency", type=float, default=0.0,
+                            help="injected response latency (ms)")
+    replay_cmd.add_argument("-b", "--bandwidth", type=float, default=0.0,
+                            help="injected bandwidth limit (KiB/s)")
+    replay_cmd.add_argument("-R", "--recordings",
+                            help="response cache directory of recorded responses to replay")
+    replay_cmd.add_argument("-r", "--results", type=int, default=500,
+                            help="synthetic keyword search result count")
+    replay_cmd.add_argument("-k", "--keyword", default="TCP")
+    replay_cmd.add_argument("--rate", type=float, default=0.0,
+                            help="crawler request rate limit (requests/s, 0 for unlimited)")
+    replay_cmd.add_argument("-c", "--result-cache", action="store_true",
+                            help="serve repeated searches from an in-process result cache")
+    replay_cmd.add_argument("-p", "--page-size", type=int, default=100)
+    replay_cmd.add_argument("--limit", type=int, default=10,
+                            help="limited_search result limit")
+    replay_cmd.add_argument("-w", "--workers", type=int, default=4)
+    replay_cmd.add_argument("-s", "--seed", type=int, default=0)
+    replay_cmd.add_argument("-j", "--json", help="write the results to a JSON report file")
+    replay_cmd.add_argument("--baseline",
+                            help="JSON report file to compare the results with")
+    replay_cmd.set_defaults(func=bench_replay)
+
+    throttle_cmd = commands.add_parser("throttle",
+                                       help="crawler throughput against throttling")
+    throttle_cmd.add_argument("-n", "--requests", type=int, default=200)
+    throttle_cmd.add_argument("-L", "--limit", type=float, default=40.0,
+                              help="server request rate limit (requests/s)")
+    throttle_cmd.add_argument("-A", "--retry-after", default="1",
+                              help="throttled response 'Retry-After' header value")
+    throttle_cmd.add_argument("-e", "--error-rate", type=float, default=0.0,
+                              help="injected server error response probability")
+    throttle_cmd.add_argument("-l", "--latency", type=float, default=5.0,
+                              help="injected response latency (ms)")
+    throttle_cmd.add_argument("--rate", type=float, default=100.0,
+                              help="adaptive crawler request rate limit (requests/s)")
+    throttle_cmd.add_argument("--burst", type=int, default=2)
+    throttle_cmd.add_argument("--retries", type=int, default=3)
+    throttle_cmd.add_argument("--backoff", type=float, default=0.25)
+    throttle_cmd.add_argument("-w", "--workers", type=int, default=8)
+    throttle_cmd.set_defaults(func=bench_throttle)
+
+    startup_cmd = commands.add_parser("startup",
+                                      help="command-line startup import time budget")
+    startup_cmd.add_argument("-n", "--runs", type=int, default=5)
+    startup_cmd.add_argument("--help-budget", type=float, default=50.0,
+                             help="maximum '--help' import time (ms)")
+    startup_cmd.add_argument("--lookup-budget", type=float, default=75.0,
+                             help="maximum offline RFC_ID lookup import time (ms)")
+    startup_cmd.set_defaults(func=bench_startup)
+
+    serve_cmd = commands.add_parser("serve", help="query server hot query latency")
+    serve_cmd.add_argument("-n", "--requests", type=int, default=500)
+    serve_cmd.add_argument("-r", "--rows", type=int, default=9500)
+    serve_cmd.add_argument("--runs", type=int, default=5, help="command-line lookup runs")
+    serve_cmd.add_argument("--budget",
+                           type=float,
+                           default=1.0,
+                           help="p50 latency budget (ms)")
+    serve_cmd.add_argument("-s", "--seed", type=int, default=0)
+    serve_cmd.set_defaults(func=bench_serve)
+
+    fuzzy_cmd = commands.add_parser("fuzzy", help="fuzzy title search latency")
+    fuzzy_cmd.add_argument("-f", "--file", help="bulk index XML file (rfc-index.xml)")
+    fuzzy_cmd.add_argument("-r", "--rows", type=int, default=9500)
+    fuzzy_cmd.add_argument("-q", "--queries", type=int, default=200)
+    fuzzy_cmd.add_argument("-s", "--seed", type=int, default=0)
+    fuzzy_cmd.add_argument("--budget",
+                           type=float,
+                           default=20.0,
+                           help="p95 latency budget (ms)")
+    fuzzy_cmd.set_defaults(func=bench_fuzzy)
+
+    graph_cmd = commands.add_parser("graph", help="relationship graph query latency")
+    graph_cmd.add_argument("-r", "--rows", type=int, default=9500)
+    graph_cmd.add_argument("-q", "--queries", type=int, default=1000)
+    graph_cmd.add_argument("-s", "--seed", type=int, default=0)
+    graph_cmd.add_argument("--budget",
+                           type=float,
+                           default=0.1,
+                           help="p95 latency budget (ms)")
+    graph_cmd.set_defaults(func=bench_graph)
+
+    index_cmd = commands.add_parser("index", help="parallel corpus indexing speedup")
+    index_cmd.add_argument("-r", "--rows", type=int, default=2000)
+    index_cmd.add_argument("-w", "--words",
+                           type=int,
+                           default=2000,
+                           help="words per document")
+    index_cmd.add_argument("-j", "--workers", type=int, nargs="+", default=[1, 2, 4])
+    index_cmd.add_argument("-s", "--seed", type=int, default=0)
+    index_cmd.set_defaults(func=bench_index)
+
+    load_cmd = commands.add_parser("load", help="binary index file open latency")
+    load_cmd.add_argument("-r", "--rows", type=int, default=9500)
+    load_cmd.add_argument("-n", "--runs", type=int, default=100)
+    load_cmd.add_argument("-s", "--seed", type=int, default=0)
+    load_cmd.add_argument("--budget",
+                          type=float,
+                          default=10.0,
+                          help="p95 latency budget (ms)")
+    load_cmd.set_defaults(func=bench_load)
+
+    table_cmd = commands.add_parser("table", help="result table render time")
+    table_cmd.add_argument("-r", "--rows", type=int, default=9500)
+    table_cmd.add_argument("-n", "--runs", type=int, default=5)
+    table_cmd.add_argument("--width",
+                           type=int,
+                           default=120,
+                           help="table width (in characters)")
+    table_cmd.add_argument("--height",
+                           type=int,
+                           default=40,
+                           help="screen height (in lines)")
+    table_cmd.add_argument("--budget",
+                           type=float,
+                           default=250.0,
+                           help="render time budget (ms)")
+    table_cmd.set_defaults(func=bench_table)
+
+    facets_cmd = commands.add_parser("facets", help="facet filter query latency")
+    facets_cmd.add_argument("-r", "--rows", type=int, default=9500)
+    facets_cmd.add_argument("-n", "--runs", type=int, default=100, help="index load runs")
+    facets_cmd.add_argument("-q", "--queries", type=int, default=1000)
+    facets_cmd.add_argument("-s", "--seed", type=int, default=0)
+    facets_cmd.add_argument("--budget",
+                            type=float,
+                            default=0.5,
+                            help="p95 latency budget (ms)")
+    facets_cmd.set_defaults(func=bench_facets)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()